@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Assets
+Verwaltet alle Bilder des Spiels. Bilder werden erst beim ersten Zugriff geladen und skaliert
+und danach im Speicher gehalten. Die Bilder des nächsten Spielzustands können im Hintergrund
+vorgeladen werden, während der aktuelle Zustand läuft.
+
+Skalierte Bilder werden zusätzlich in einem Cache auf der Festplatte abgelegt (siehe CACHE_DIR),
+damit beim nächsten Start nicht die grossen Originale dekodiert und verkleinert werden müssen.
+Der Cache kann vorab erstellt werden mit:  python -m game_core.assets
+"""
+
+# Bibliotheken importieren
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Mapping
+import pygame
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Verzeichnis für vorskalierte Bilder (kann z.B. auf ein gemeinsames Netzlaufwerk zeigen)
+CACHE_DIR = os.environ.get("PERSONA_ASSET_CACHE", os.path.join("cache", "assets"))
+
+# Kopf einer Cache-Datei: Kennung, mtime des Originals, Breite, Höhe
+CACHE_MAGIC = b"PCA1"
+CACHE_HEADER = struct.Struct("<4sdHH")
+
+class AssetRegistry:
+    """
+    Registry für Bilder, die bei Bedarf geladen und zwischengespeichert werden
+    """
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.specs = {}     # Name -> (Pfad, Grösse, weich skalieren, Fallback-Name)
+        self.cache = {}     # Name -> geladene Surface
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+
+    def register(self, name, path, size=None, smooth=True, fallback=None):
+        """Registriert ein Bild unter einem Namen, ohne es zu laden"""
+        self.specs[name] = (path, size, smooth, fallback)
+
+    def __contains__(self, name):
+        return name in self.specs
+
+    def get(self, name):
+        """Gibt das Bild zurück und lädt es beim ersten Zugriff"""
+        image = self.cache.get(name)
+        if image is not None:
+            return image
+
+        with self.lock:
+            # Könnte inzwischen vom Hintergrund-Thread geladen worden sein
+            if name not in self.cache:
+                self.cache[name] = self._load(name)
+            return self.cache[name]
+
+    def _load(self, name):
+        """Lädt ein einzelnes Bild, skalierte Bilder wenn möglich aus dem Festplatten-Cache"""
+        path, size, smooth, fallback = self.specs[name]
+        try:
+            if size is None:
+                image = pygame.image.load(path)
+            else:
+                image = self._read_cached(path, size, smooth)
+                if image is None:
+                    image = self._scale(pygame.image.load(path), size, smooth)
+                    self._write_cached(path, size, smooth, image)
+        except (pygame.error, FileNotFoundError):
+            if fallback is None:
+                raise
+            logger.warning("Konnte Bild nicht laden: %s, verwende Fallback", path)
+            fallback_image = self.cache.get(fallback)
+            if fallback_image is None:
+                fallback_image = self._load(fallback)
+                self.cache[fallback] = fallback_image
+            return fallback_image
+
+        # In das Pixelformat des Bildschirms umwandeln, sobald dieser existiert (schnelleres Blitten)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        return image
+
+    def _scale(self, image, size, smooth):
+        """Skaliert ein Bild auf die Zielgrösse"""
+        if smooth:
+            return pygame.transform.smoothscale(image, size)
+        return pygame.transform.scale(image, size)
+
+    def _cache_path(self, path, size, smooth):
+        """Dateiname im Cache: Quellpfad, Zielgrösse und Skalierungsart"""
+        stem = os.path.splitext(os.path.normpath(path))[0].replace(os.sep, "_")
+        mode = "" if smooth else "_nearest"
+        return os.path.join(self.cache_dir, f"{stem}_{size[0]}x{size[1]}{mode}.bin")
+
+    def _read_cached(self, path, size, smooth):
+        """Liest ein vorskaliertes Bild; None, wenn es fehlt oder das Original neuer ist"""
+        cache_path = self._cache_path(path, size, smooth)
+        try:
+            with open(cache_path, "rb") as f:
+                header = f.read(CACHE_HEADER.size)
+                magic, source_mtime, width, height = CACHE_HEADER.unpack(header)
+                if magic != CACHE_MAGIC or (width, height) != tuple(size):
+                    return None
+
+                # Original neuer als der Cache-Eintrag: neu erstellen
+                # (fehlt das Original, wird der Cache trotzdem verwendet)
+                if os.path.exists(path) and os.path.getmtime(path) > source_mtime:
+                    return None
+
+                pixels = zlib.decompress(f.read())
+            return pygame.image.frombytes(pixels, (width, height), "RGBA")
+        except (OSError, struct.error, zlib.error, ValueError, pygame.error):
+            return None
+
+    def _write_cached(self, path, size, smooth, image):
+        """Schreibt ein skaliertes Bild in den Cache (atomar über eine temporäre Datei)"""
+        cache_path = self._cache_path(path, size, smooth)
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            header = CACHE_HEADER.pack(CACHE_MAGIC, os.path.getmtime(path), size[0], size[1])
+            with open(temp_path, "wb") as f:
+                f.write(header)
+                f.write(zlib.compress(pygame.image.tobytes(image, "RGBA")))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            # Ohne Cache läuft das Spiel weiter, nur der nächste Start ist langsamer
+            logger.warning("Konnte Cache-Datei nicht schreiben: %s (%s)", cache_path, e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def build_cache(self):
+        """Erstellt alle fehlenden oder veralteten Cache-Einträge, gibt (erstellt, aktuell) zurück"""
+        built = 0
+        current = 0
+        for path, size, smooth, _ in self.specs.values():
+            if size is None or not os.path.exists(path):
+                continue
+            if self._read_cached(path, size, smooth) is not None:
+                current += 1
+                continue
+            image = self._scale(pygame.image.load(path), size, smooth)
+            self._write_cached(path, size, smooth, image)
+            built += 1
+        return built, current
+
+    def preload(self, names):
+        """Lädt die angegebenen Bilder in einem Hintergrund-Thread"""
+        pending = [name for name in names if name not in self.cache]
+        if not pending:
+            return None
+
+        def worker():
+            for name in pending:
+                try:
+                    self.get(name)
+                except (pygame.error, FileNotFoundError) as e:
+                    # Fehler werden beim nächsten Zugriff im Hauptthread erneut gemeldet
+                    logger.warning("Vorladen von %s fehlgeschlagen: %s", name, e)
+
+        thread = threading.Thread(target=worker, name="asset-preload", daemon=True)
+        thread.start()
+        return thread
+
+class LazyImageMap(Mapping):
+    """
+    Dictionary-ähnlicher Zugriff auf Bilder der Registry (z.B. für SCENARIO_IMAGES)
+    """
+    def __init__(self, registry, names):
+        self.registry = registry
+        self.names = names  # Schlüssel -> Name in der Registry
+
+    def __getitem__(self, key):
+        return self.registry.get(self.names[key])
+
+    def __contains__(self, key):
+        # Nur die Schlüssel prüfen, ohne das Bild zu laden
+        return key in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def asset_names(self):
+        """Gibt die Registry-Namen aller Bilder zurück (zum Vorladen)"""
+        return list(self.names.values())
+
+# =============================================================================
+# Registrierung aller Bilder
+# =============================================================================
+
+ASSETS = AssetRegistry()
+
+# Tiktik Bilder (150x150)
+_TIKTIK_IMAGES = {
+    "STANDARD_TIKTIK_IMAGE": "assets/images/standard_tiktik.png",
+    "WINKEND_TIKTIK_IMAGE": "assets/images/winkend_tiktik.png",
+    "FLIEGEND_TIKTIK_IMAGE": "assets/images/fliegend_tiktik.png",
+    "SITZEND_TIKTIK_IMAGE": "assets/images/sitzend_tiktik.png",
+    "BALANCE_TIKTIK_IMAGE": "assets/images/balance_tiktik.png",
+    "DAUMEN_TIKTIK_IMAGE": "assets/images/daumen_tiktik.png",
+    "MALEN_TIKTIK_IMAGE": "assets/images/malen_tiktik.png",
+    "DANCE_TIKTIK_IMAGE": "assets/images/dance_tiktik.png",
+    "ORGANISE_TIKTIK_IMAGE": "assets/images/organise_tiktik.png",
+    "LAPTOP_TIKTIK_IMAGE": "assets/images/laptop_tiktik.png",
+    "BIRD_TIKTIK_IMAGE": "assets/images/bird_tiktik.png",
+    "FLOWER_TIKTIK_IMAGE": "assets/images/flower_tiktik.png",
+    "CONGRATS_TIKTIK_IMAGE": "assets/images/congrats_tiktik.png",
+    "END_TIKTIK_IMAGE": "assets/images/end_tiktik.png",
+    "BLOB_IMAGE": "assets/images/happy_blob2.png",
+}
+for _name, _path in _TIKTIK_IMAGES.items():
+    ASSETS.register(_name, _path, (150, 150))
+
+# Begleiter-Bilder (150x150, wie auf der Ergebnisseite angezeigt)
+_COMPANION_IMAGES = {
+    "COMPANION_ORGANIZATION_IMAGE": "assets/images/companion_organization.png",
+    "COMPANION_INTERACTIVE_IMAGE": "assets/images/companion_interactive.png",
+    "COMPANION_CALMING_IMAGE": "assets/images/companion_calming.png",
+    "COMPANION_CREATIVE_IMAGE": "assets/images/companion_creative.png",
+    "COMPANION_PERFORMANCE_IMAGE": "assets/images/companion_performance.png",
+}
+for _name, _path in _COMPANION_IMAGES.items():
+    ASSETS.register(_name, _path, (150, 150), smooth=False)
+
+# Spiel 2: Szenario-spezifische Bilder (220x220, mit BLOB_IMAGE als Fallback)
+# Reihenfolge entspricht GAME2_SCENARIOS
+_GAME2_SCENARIO_FILES = [
+    "networking",   # Szenario 1 - Networking-Event
+    "evening",      # Szenario 2 - Abend ausgehen
+    "waiting",      # Szenario 3 - Wartezimmer
+    "group",        # Szenario 4 - Gruppenarbeit
+    "weekend",      # Szenario 5 - Wochenende
+    "discussion",   # Szenario 6 - Diskussionen
+    "travel",       # Szenario 7 - Fremde Umgebung
+    "afterwork",    # Szenario 8 - Nach dem Arbeitstag
+    "freetime",     # Szenario 9 - Freizeit
+    "presentation"  # Szenario 10 - Präsentation
+]
+GAME2_OPTION_IMAGES = {}
+for _index, _file in enumerate(_GAME2_SCENARIO_FILES):
+    _names = {}
+    for _option in ("introvert", "extravert"):
+        _name = f"GAME2_{_file.upper()}_{_option.upper()}_IMAGE"
+        ASSETS.register(_name, f"assets/balancebar/{_file}_{_option}.png", (220, 220), fallback="BLOB_IMAGE")
+        _names[_option] = _name
+    GAME2_OPTION_IMAGES[_index] = LazyImageMap(ASSETS, _names)
+
+# Spiel 3: Stimulus-Bilder, alle auf die gleiche Grösse skaliert (600x300)
+_SCENARIO_NAMES = {}
+for _key in ("travel", "art", "cuisine", "learning", "social"):
+    _name = f"SCENARIO_{_key.upper()}_IMAGE"
+    ASSETS.register(_name, f"assets/scenarios/{_key}.png", (600, 300), smooth=False)
+    _SCENARIO_NAMES[_key] = _name
+SCENARIO_IMAGES = LazyImageMap(ASSETS, _SCENARIO_NAMES)
+
+# Bilder, die jeder Spielzustand benötigt (für das Vorladen im Hintergrund)
+STATE_ASSETS = {
+    "MENU": ["WINKEND_TIKTIK_IMAGE"],
+    "GAME1": ["FLIEGEND_TIKTIK_IMAGE", "SITZEND_TIKTIK_IMAGE"],
+    "GAME2": ["BALANCE_TIKTIK_IMAGE", "DAUMEN_TIKTIK_IMAGE"]
+             + [name for images in GAME2_OPTION_IMAGES.values() for name in images.asset_names()],
+    "GAME3": ["MALEN_TIKTIK_IMAGE", "DANCE_TIKTIK_IMAGE"] + SCENARIO_IMAGES.asset_names(),
+    "GAME4": ["ORGANISE_TIKTIK_IMAGE", "LAPTOP_TIKTIK_IMAGE"],
+    "GAME5": ["BIRD_TIKTIK_IMAGE", "FLOWER_TIKTIK_IMAGE"],
+    "RESULTS": ["CONGRATS_TIKTIK_IMAGE", "BLOB_IMAGE"] + list(_COMPANION_IMAGES),
+    "BFI10": ["STANDARD_TIKTIK_IMAGE"],
+    "BFI_RESULTS": ["END_TIKTIK_IMAGE"]
+}
+
+def get(name):
+    """Gibt ein registriertes Bild zurück"""
+    return ASSETS.get(name)
+
+def preload_state(state_name):
+    """Lädt die Bilder eines Spielzustands im Hintergrund vor"""
+    return ASSETS.preload(STATE_ASSETS.get(state_name, []))
+
+def __getattr__(name):
+    """Ermöglicht den Zugriff über die bisherigen Namen, z.B. assets.WINKEND_TIKTIK_IMAGE"""
+    if name in ASSETS:
+        return ASSETS.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+if __name__ == "__main__":
+    # Cache für alle skalierten Bilder vorab erstellen
+    pygame.init()
+    built, current = ASSETS.build_cache()
+    print(f"Asset-Cache in {ASSETS.cache_dir}: {built} erstellt, {current} bereits aktuell")
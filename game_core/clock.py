@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Clock
+Zeitdienst für die Spielzustände. Timer und Messungen laufen über die Spielzeit statt über
+gezählte Frames, damit sich die Spiele bei jeder Bildrate gleich verhalten.
+"""
+
+# Bibliotheken importieren
+import time
+
+class GameClock:
+    """
+    Spielzeit in Sekunden. tick() wird einmal pro Update aufgerufen und liefert die seit dem
+    letzten Update vergangene Zeit (dt). Mit fixed_step läuft die Uhr in festen Schritten
+    unabhängig von der echten Zeit (z.B. für automatisierte Durchläufe ohne Bildratenbegrenzung)
+    """
+    def __init__(self, max_step=0.25, fixed_step=None):
+        self.max_step = max_step        # Obergrenze für dt (z.B. nach langem Warten auf Eingaben)
+        self.fixed_step = fixed_step
+        self.dt = 0.0                   # Dauer des letzten Updates in Sekunden
+        self.time = 0.0                 # Spielzeit seit Start in Sekunden
+        self.last_tick = time.perf_counter()
+
+    def tick(self):
+        """Schreitet die Spielzeit um einen Update-Schritt fort und gibt dt zurück"""
+        now = time.perf_counter()
+        if self.fixed_step is not None:
+            self.dt = self.fixed_step
+        else:
+            self.dt = min(now - self.last_tick, self.max_step)
+        self.last_tick = now
+        self.time += self.dt
+        return self.dt
+
+    def now_ms(self):
+        """
+        Aktuelle Spielzeit in Millisekunden (Ersatz für pygame.time.get_ticks).
+        Zwischen zwei Updates wird die echte vergangene Zeit dazugezählt, damit Eingaben
+        genauer als auf ein Frame gemessen werden
+        """
+        if self.fixed_step is not None:
+            return int(self.time * 1000)
+        elapsed = min(time.perf_counter() - self.last_tick, self.max_step)
+        return int((self.time + elapsed) * 1000)
+
+    def ms_at(self, timestamp_ns):
+        """Spielzeit in Millisekunden zu einem Zeitstempel aus perf_counter_ns (z.B. eines Ereignisses)"""
+        if self.fixed_step is not None:
+            return int(self.time * 1000)
+        elapsed = min(timestamp_ns / 1e9 - self.last_tick, self.max_step)
+        return int((self.time + elapsed) * 1000)
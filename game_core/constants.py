@@ -20,6 +20,29 @@ SCREEN_HEIGHT = 620
 # Bilder pro Sekunde
 FPS = 90
 
+# Maximale Wartezeit (ms) auf Eingaben bei Zuständen ohne Animation
+IDLE_TIMEOUT = 1000
+
+# Profiler: Taste für die Einblendung der Frame-Zeiten, CSV-Export am Ende jeder Sitzung (nur zur
+# Diagnose, eine Datei pro Sitzung in data) und Anzahl Frames, die für den Export gehalten werden
+PROFILER_HOTKEY = pygame.K_F3
+PROFILER_CSV = False
+PROFILER_MAX_ROWS = 36000
+
+# Logging: Stufe (DEBUG, INFO, WARNING, ...) und Datei für die JSON-Zeilen (None = stderr)
+LOG_LEVEL = "INFO"
+LOG_FILE = None
+
+# Maximale Anzahl wartender Speicheraufträge für den Hintergrund-Thread (game_core/persistence.py)
+SAVE_QUEUE_SIZE = 16
+
+# Sitzungsspeicher (game_core/store.py): Unterverzeichnis in data und Grösse, ab der ein neues Segment beginnt
+SESSION_DIR = "sessions"
+SESSION_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# Schatten-Bewertung (game_core/shadow.py): Prozesse für alternative Formeln
+SHADOW_WORKERS = 1
+
 # Animation Constants
 TRANSITION_SPEED = 10
 
@@ -75,46 +98,8 @@ button_y = SCREEN_HEIGHT - 50
 button_width = 200
 button_height = 50
 
-# Tiktik Bild laden und Grösse anpassen
-STANDARD_TIKTIK_IMAGE = pygame.image.load("assets/images/standard_tiktik.png")
-STANDARD_TIKTIK_IMAGE = pygame.transform.smoothscale(STANDARD_TIKTIK_IMAGE, (150, 150))
-WINKEND_TIKTIK_IMAGE = pygame.image.load("assets/images/winkend_tiktik.png")
-WINKEND_TIKTIK_IMAGE = pygame.transform.smoothscale(WINKEND_TIKTIK_IMAGE, (150, 150))
-FLIEGEND_TIKTIK_IMAGE = pygame.image.load("assets/images/fliegend_tiktik.png")
-FLIEGEND_TIKTIK_IMAGE = pygame.transform.smoothscale(FLIEGEND_TIKTIK_IMAGE, (150, 150))
-SITZEND_TIKTIK_IMAGE = pygame.image.load("assets/images/sitzend_tiktik.png")
-SITZEND_TIKTIK_IMAGE = pygame.transform.smoothscale(SITZEND_TIKTIK_IMAGE, (150, 150))
-BALANCE_TIKTIK_IMAGE = pygame.image.load("assets/images/balance_tiktik.png")
-BALANCE_TIKTIK_IMAGE = pygame.transform.smoothscale(BALANCE_TIKTIK_IMAGE, (150, 150))
-DAUMEN_TIKTIK_IMAGE = pygame.image.load("assets/images/daumen_tiktik.png")
-DAUMEN_TIKTIK_IMAGE = pygame.transform.smoothscale(DAUMEN_TIKTIK_IMAGE, (150, 150))
-MALEN_TIKTIK_IMAGE = pygame.image.load("assets/images/malen_tiktik.png")
-MALEN_TIKTIK_IMAGE = pygame.transform.smoothscale(MALEN_TIKTIK_IMAGE, (150, 150))
-DANCE_TIKTIK_IMAGE = pygame.image.load("assets/images/dance_tiktik.png")
-DANCE_TIKTIK_IMAGE = pygame.transform.smoothscale(DANCE_TIKTIK_IMAGE, (150, 150))
-ORGANISE_TIKTIK_IMAGE = pygame.image.load("assets/images/organise_tiktik.png")
-ORGANISE_TIKTIK_IMAGE = pygame.transform.smoothscale(ORGANISE_TIKTIK_IMAGE, (150, 150))
-LAPTOP_TIKTIK_IMAGE = pygame.image.load("assets/images/laptop_tiktik.png")
-LAPTOP_TIKTIK_IMAGE = pygame.transform.smoothscale(LAPTOP_TIKTIK_IMAGE, (150, 150))
-BIRD_TIKTIK_IMAGE = pygame.image.load("assets/images/bird_tiktik.png")
-BIRD_TIKTIK_IMAGE = pygame.transform.smoothscale(BIRD_TIKTIK_IMAGE, (150, 150))
-FLOWER_TIKTIK_IMAGE = pygame.image.load("assets/images/flower_tiktik.png")
-FLOWER_TIKTIK_IMAGE = pygame.transform.smoothscale(FLOWER_TIKTIK_IMAGE, (150, 150))
-CONGRATS_TIKTIK_IMAGE = pygame.image.load("assets/images/congrats_tiktik.png")
-CONGRATS_TIKTIK_IMAGE = pygame.transform.smoothscale(CONGRATS_TIKTIK_IMAGE, (150, 150))
-END_TIKTIK_IMAGE = pygame.image.load("assets/images/end_tiktik.png")
-END_TIKTIK_IMAGE = pygame.transform.smoothscale(END_TIKTIK_IMAGE, (150, 150))
-
-BLOB_IMAGE = pygame.image.load("assets/images/happy_blob2.png")
-BLOB_IMAGE = pygame.transform.smoothscale(BLOB_IMAGE, (150, 150))  # Grösse anpassen
-
-# Begleiter-Bilder 
-COMPANION_ORGANIZATION_IMAGE = pygame.image.load("assets/images/companion_organization.png")
-COMPANION_INTERACTIVE_IMAGE = pygame.image.load("assets/images/companion_interactive.png")
-COMPANION_CALMING_IMAGE = pygame.image.load("assets/images/companion_calming.png")
-COMPANION_CREATIVE_IMAGE = pygame.image.load("assets/images/companion_creative.png")
-COMPANION_PERFORMANCE_IMAGE = pygame.image.load("assets/images/companion_performance.png")
-
+# Bilder (Tiktik, Begleiter, Szenarien) werden in game_core/assets.py registriert
+# und erst beim ersten Zugriff geladen
 
 # SPIEL 2: Szenarien, um Persönlichkeitstyp "Extravertiert vs. Introvertiert" abzufragen
 # Jede Situation zeigt eine Frage und zwei Antwortmöglichkeiten (A und B)
@@ -191,84 +176,6 @@ GAME2_SCENARIOS = [
     }
 ]
 
-# Funktion, um Bilder sicher zu laden (mit Fehlerbehandlung)
-def load_image_safely(path, fallback_image, size=(220, 220)):
-    try:
-        image = pygame.image.load(path)
-        return pygame.transform.smoothscale(image, size)
-    except (pygame.error, FileNotFoundError):
-        print(f"Konnte Bild nicht laden: {path}, verwende Fallback")
-        return fallback_image
-
-# Szenario-spezifische Bilder mit Fehlerbehandlung
-GAME2_OPTION_IMAGES = {}
-
-# Versuche, die szenariospezifischen Bilder zu laden
-try:
-    # Szenario 1 - Networking-Event
-    GAME2_OPTION_IMAGES[0] = {
-        "introvert": load_image_safely("assets/balancebar/networking_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/networking_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 2 - Abend ausgehen
-    GAME2_OPTION_IMAGES[1] = {
-        "introvert": load_image_safely("assets/balancebar/evening_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/evening_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 3 - Wartezimmer
-    GAME2_OPTION_IMAGES[2] = {
-        "introvert": load_image_safely("assets/balancebar/waiting_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/waiting_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 4 - Gruppenarbeit
-    GAME2_OPTION_IMAGES[3] = {
-        "introvert": load_image_safely("assets/balancebar/group_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/group_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 5 - Wochenende
-    GAME2_OPTION_IMAGES[4] = {
-        "introvert": load_image_safely("assets/balancebar/weekend_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/weekend_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 6 - Diskussionen
-    GAME2_OPTION_IMAGES[5] = {
-        "introvert": load_image_safely("assets/balancebar/discussion_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/discussion_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 7 - Fremde Umgebung
-    GAME2_OPTION_IMAGES[6] = {
-        "introvert": load_image_safely("assets/balancebar/travel_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/travel_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 8 - Nach dem Arbeitstag
-    GAME2_OPTION_IMAGES[7] = {
-        "introvert": load_image_safely("assets/balancebar/afterwork_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/afterwork_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 9 - Freizeit
-    GAME2_OPTION_IMAGES[8] = {
-        "introvert": load_image_safely("assets/balancebar/freetime_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/freetime_extravert.png", BLOB_IMAGE)
-    }
-    
-    # Szenario 10 - Präsentation
-    GAME2_OPTION_IMAGES[9] = {
-        "introvert": load_image_safely("assets/balancebar/presentation_introvert.png", BLOB_IMAGE),
-        "extravert": load_image_safely("assets/balancebar/presentation_extravert.png", BLOB_IMAGE)
-    }
-    
-except Exception as e:
-    print(f"Fehler beim Laden der Szenario-Bilder: {e}")
-    # Im Fehlerfall wird ein leeres Dictionary verwendet, und der Code fällt auf Fallback-Bilder zurück
-
 # SPIEL 3: Muster fertig malen
 # Szenarien und Aufgaben für Game 3 - Creative Explorer
 GAME3_TASKS = [
@@ -292,22 +199,6 @@ GAME3_TASKS = [
     }
 ]
 
-# Stimulus-Bilder laden
-SCENARIO_IMAGES = {
-    "travel": pygame.image.load("assets/scenarios/travel.png"),
-    "art": pygame.image.load("assets/scenarios/art.png"),
-    "cuisine": pygame.image.load("assets/scenarios/cuisine.png"),
-    "learning": pygame.image.load("assets/scenarios/learning.png"),
-    "social": pygame.image.load("assets/scenarios/social.png")
-}
-
-# Szenario-Bilder auf einheitliche Grösse skalieren
-for key in SCENARIO_IMAGES:
-    SCENARIO_IMAGES[key] = pygame.transform.scale(
-        SCENARIO_IMAGES[key], 
-        (600, 300)  # Alle Szenariobilder auf die gleiche Grösse skalieren
-    )
-
 # SPIEL 5: Szenarien zur Messung von "Verträglichkeit"
 # Wie viel gibst du ab vs. wie viel behältst du?
 GAME5_SCENARIOS = [
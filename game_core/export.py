@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Export
+Überführt die Sitzungen aus dem Sitzungsspeicher (game_core/store.py) in Parquet-Tabellen für
+die Auswertung über viele Sitzungen:
+
+    sessions                 Traits, BFI-Scores, Neurotizismus-Komponenten und Reaktionszeiten (Spiel 1)
+    game1_phases             Treffer, Fehler und Reaktionszeiten pro Phase
+    game2_answers            Antworten pro Szenario
+    game3_tasks              Bewertung pro Zeichenaufgabe
+    game4_categorizations    Gewählte und ideale Kategorie pro Aufgabe
+    game5_choices            Wahl pro Runde
+
+Jede Tabelle ist ein Verzeichnis mit Parquet-Dateien (eine pro Lauf), das z.B. mit
+pyarrow.dataset oder pandas.read_parquet als Ganzes gelesen wird. Der Export läuft inkrementell:
+export_state.json merkt sich pro Segment, bis zu welchem Byte es bereits exportiert ist, ein Lauf
+liest nur neu angehängte Sitzungen. Zeilen werden in Blöcken von batch_rows geschrieben, der
+Speicherbedarf hängt damit nicht von der Anzahl Sitzungen ab.
+
+Eine Sitzung wird mehrmals gespeichert (beim Öffnen der Ergebnisse und bei der Rückkehr ins Menü).
+Exportiert wird nur ihre letzte Fassung laut Index (siehe game_core/store.py); gelesen wird deshalb
+nur, was bereits im Index steht. Findet ein späterer Lauf eine neuere Fassung, werden die Zeilen der
+Sitzung aus den Dateien früherer Läufe entfernt, jede session_id kommt in einer Tabelle nur aus einer
+Fassung vor. Betroffen sind nur Sitzungen, von denen schon eine frühere Fassung vor den gemerkten
+Positionen liegt; ihre Dateien werden blockweise neu geschrieben. Eine Sitzung, die vor Abschluss
+des BFI-10 gespeichert wurde, hat keine BFI-Scores.
+
+Aufruf:  python -m game_core.export data/sessions data/export
+"""
+
+# Bibliotheken importieren
+import argparse
+import datetime
+import json
+import os
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from game_core.persistence import write_atomic
+from game_core.store import SessionStore, is_latest
+
+# Zeilen pro Tabelle, die im Speicher gesammelt werden, bevor sie geschrieben werden
+BATCH_ROWS = 50000
+STATE_FILE = "export_state.json"
+
+TRAITS = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+NEUROTICISM_COMPONENTS = ("anxiety", "vulnerability", "depression", "self_consciousness", "impulsiveness")
+
+# Gemeinsame Spalten aller Tabellen
+_KEY = [("session_id", pa.string()), ("user_name", pa.string()), ("timestamp", pa.string()), ("day", pa.string())]
+
+SCHEMAS = {
+    "sessions": pa.schema(_KEY
+        + [(f"trait_{trait}", pa.float64()) for trait in TRAITS]
+        + [(f"bfi_{trait}", pa.float64()) for trait in TRAITS]
+        + [(f"game1_{component}", pa.float64()) for component in NEUROTICISM_COMPONENTS]
+        + [("game1_mean_reaction_ms", pa.float64()), ("game1_mean_error_ms", pa.float64()),
+           ("game1_max_error_ms", pa.float64())]),
+    "game1_phases": pa.schema(_KEY + [
+        ("phase", pa.string()), ("correct", pa.int64()), ("incorrect", pa.int64()),
+        ("accuracy", pa.float64()), ("reaction_times_ms", pa.list_(pa.float64()))]),
+    "game2_answers": pa.schema(_KEY + [
+        ("scenario", pa.int64()), ("value", pa.float64()), ("classification", pa.string()),
+        ("weight", pa.float64())]),
+    "game3_tasks": pa.schema(_KEY + [
+        ("task", pa.int64()), ("score", pa.float64()), ("max_score", pa.float64()), ("strokes", pa.int64()),
+        ("colors", pa.int64()), ("coverage", pa.float64()), ("colors_used", pa.int64()), ("spread", pa.float64())]),
+    "game4_categorizations": pa.schema(_KEY + [
+        ("task_id", pa.int64()), ("name", pa.string()), ("importance", pa.int64()), ("urgency", pa.int64()),
+        ("ideal_category", pa.string()), ("container", pa.string())]),
+    "game5_choices": pa.schema(_KEY + [
+        ("round", pa.int64()), ("scenario", pa.string()), ("value", pa.float64())])
+}
+
+def _ratio(part, total):
+    return part / total if total else None
+
+def session_rows(session):
+    """Zerlegt eine gespeicherte Sitzung in Zeilen pro Tabelle: {Tabelle: [Zeile, ...]}"""
+    key = {
+        "session_id": session.get("session_id"),
+        "user_name": session.get("user_name"),
+        "timestamp": session["timestamp"],
+        "day": session["timestamp"][:8]
+    }
+    traits = session.get("personality_traits", {})
+    bfi_scores = session.get("bfi_scores", {})
+    # Vor Abschluss des BFI-10 enthält bfi_scores nur Platzhalter
+    answers = session.get("measurements", {}).get("bfi", {}).get("answers")
+    if answers is not None and None in answers:
+        bfi_scores = {}
+    components = session.get("game1_neuroticism_components", {})
+    timing = session.get("game1_timing", {})
+
+    summary = dict(key)
+    summary.update({f"trait_{trait}": traits.get(trait) for trait in TRAITS})
+    summary.update({f"bfi_{trait}": bfi_scores.get(trait) for trait in TRAITS})
+    summary.update({f"game1_{component}": components.get(component) for component in NEUROTICISM_COMPONENTS})
+    summary.update({f"game1_{field}": timing.get(field) for field in ("mean_reaction_ms", "mean_error_ms", "max_error_ms")})
+
+    return {
+        "sessions": [summary],
+        "game1_phases": [
+            dict(key, phase=phase, correct=data["correct"], incorrect=data["incorrect"],
+                 accuracy=_ratio(data["correct"], data["correct"] + data["incorrect"]),
+                 reaction_times_ms=data["reaction_times"])
+            for phase, data in session.get("game1_phase_data", {}).items()
+        ],
+        "game2_answers": [
+            dict(key, scenario=answer.get("scenario"), value=answer.get("value"),
+                 classification=answer.get("classification"), weight=answer.get("weight"))
+            for answer in session.get("game2_answers", [])
+        ],
+        "game3_tasks": [
+            dict(key, **{field: result.get(field) for field in SCHEMAS["game3_tasks"].names[len(_KEY):]})
+            for result in session.get("game3_task_results", [])
+        ],
+        "game4_categorizations": [
+            dict(key, task_id=task.get("id"), name=task.get("name"), importance=task.get("importance"),
+                 urgency=task.get("urgency"), ideal_category=task.get("ideal_category"), container=task.get("container"))
+            for task in session.get("game4_categorizations", [])
+        ],
+        "game5_choices": [
+            dict(key, round=choice.get("round"), scenario=choice.get("scenario"), value=choice.get("value"))
+            for choice in session.get("game5_choices", [])
+        ]
+    }
+
+class TableWriter:
+    """
+    Schreibt die Zeilen einer Tabelle blockweise in eine neue Parquet-Datei. Die Datei bekommt
+    ihren endgültigen Namen erst mit commit(), ein abgebrochener Lauf hinterlässt nur eine versteckte .tmp-Datei
+    """
+    def __init__(self, directory, name, run, batch_rows=BATCH_ROWS):
+        self.schema = SCHEMAS[name]
+        self.filename = os.path.join(directory, name, f"part-{run}.parquet")
+        # Mit Punkt beginnende Dateien werden von pyarrow.dataset übersprungen
+        self.temp_name = os.path.join(directory, name, f".part-{run}.parquet.tmp")
+        self.batch_rows = batch_rows
+        self.rows = []
+        self.count = 0
+        self.writer = None
+
+    def add(self, rows):
+        self.rows.extend(rows)
+        if len(self.rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        if self.writer is None:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            self.writer = pq.ParquetWriter(self.temp_name, self.schema)
+        self.writer.write_table(pa.Table.from_pylist(self.rows, schema=self.schema))
+        self.count += len(self.rows)
+        self.rows = []
+
+    def commit(self):
+        """Schreibt die restlichen Zeilen und gibt der Datei ihren endgültigen Namen"""
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            os.replace(self.temp_name, self.filename)
+        return self.count
+
+def read_new_sessions(store, positions, latest, ends):
+    """
+    Liest alle Sitzungen, die nach den gemerkten Positionen angehängt und bereits im Index
+    eingetragen wurden (latest und ends aus store.index_summary()), von jeder Sitzung nur die
+    letzte Fassung. positions wird dabei fortgeschrieben; noch nicht indexierte Zeilen bleiben
+    für den nächsten Lauf
+    """
+    for segment in store.segments():
+        position = positions.get(segment, 0)
+        end = ends.get(segment, 0)
+        with open(os.path.join(store.directory, segment), "rb") as f:
+            f.seek(position)
+            for line in f:
+                if not line.endswith(b"\n") or position + len(line) > end:
+                    break
+                offset = position
+                position += len(line)
+                positions[segment] = position
+                try:
+                    session = json.loads(line)
+                except ValueError:
+                    continue
+                if is_latest(latest, session.get("session_id"), segment, offset):
+                    yield session
+
+def resaved_sessions(store, positions, latest):
+    """
+    Sitzungen, deren letzte Fassung noch nicht exportiert ist, von denen aber eine frühere Fassung
+    vor den gemerkten Positionen liegt: nur sie können Zeilen in Dateien früherer Läufe haben
+    """
+    resaved = set()
+    for entry in store.index_entries():
+        session_id = entry["session_id"]
+        if session_id is None or entry["offset"] >= positions.get(entry["segment"], 0):
+            continue
+        segment, offset = latest[session_id]
+        if offset >= positions.get(segment, 0):
+            resaved.add(session_id)
+    return resaved
+
+def remove_sessions(directory, session_ids):
+    """
+    Entfernt die Zeilen der angegebenen Sitzungen aus den bisherigen Dateien einer Tabelle. Gelesen
+    wird zuerst nur die Spalte session_id, betroffene Dateien werden blockweise neu geschrieben
+    """
+    if not os.path.isdir(directory):
+        return 0
+    value_set = pa.array(sorted(session_ids), pa.string())
+    removed = 0
+    for name in sorted(os.listdir(directory)):
+        if not (name.startswith("part-") and name.endswith(".parquet")):
+            continue
+        path = os.path.join(directory, name)
+        with pq.ParquetFile(path) as part:
+            total = part.metadata.num_rows
+            matches = sum(pc.sum(pc.is_in(batch.column("session_id"), value_set=value_set)).as_py() or 0
+                          for batch in part.iter_batches(columns=["session_id"]))
+            if not matches:
+                continue
+            removed += matches
+            if matches < total:
+                # Wie neue Dateien über eine versteckte temporäre Datei ersetzen
+                temp_name = os.path.join(directory, f".{name}.tmp")
+                with pq.ParquetWriter(temp_name, part.schema_arrow) as writer:
+                    for batch in part.iter_batches():
+                        writer.write_batch(batch.filter(pc.invert(pc.is_in(batch.column("session_id"), value_set=value_set))))
+        if matches == total:
+            os.remove(path)
+        else:
+            os.replace(temp_name, path)
+    return removed
+
+def export_sessions(store_dir, export_dir, batch_rows=BATCH_ROWS):
+    """Exportiert alle neuen Sitzungen aus store_dir nach export_dir und gibt die Zeilen pro Tabelle zurück"""
+    state_file = os.path.join(export_dir, STATE_FILE)
+    state = {"segments": {}}
+    if os.path.exists(state_file):
+        with open(state_file, encoding="utf-8") as f:
+            state = json.load(f)
+
+    # Dateien eines abgebrochenen Laufs ohne gespeicherte Positionen exportiert dieser Lauf erneut
+    if state.pop("committing", None):
+        crashed_run = state.pop("run")
+        for name in SCHEMAS:
+            path = os.path.join(export_dir, name, f"part-{crashed_run}.parquet")
+            if os.path.exists(path):
+                os.remove(path)
+
+    store = SessionStore(store_dir)
+    latest, ends = store.index_summary()
+    positions = dict(state["segments"])
+    resaved = resaved_sessions(store, positions, latest)
+    run = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    writers = {name: TableWriter(export_dir, name, run, batch_rows) for name in SCHEMAS}
+    for session in read_new_sessions(store, positions, latest, ends):
+        for name, rows in session_rows(session).items():
+            writers[name].add(rows)
+
+    # Ältere Fassungen neu gespeicherter Sitzungen aus früheren Läufen entfernen, bevor die neuen
+    # Dateien sichtbar werden. Bricht der Lauf danach ab, exportiert der nächste Lauf sie erneut
+    if resaved:
+        for name in SCHEMAS:
+            remove_sessions(os.path.join(export_dir, name), resaved)
+    write_atomic(state_file, lambda f: json.dump(dict(state, committing=True, run=run), f, indent=4))
+    counts = {name: writer.commit() for name, writer in writers.items()}
+
+    # Positionen erst nach dem Schreiben aller Tabellen übernehmen
+    state["segments"] = positions
+    write_atomic(state_file, lambda f: json.dump(state, f, indent=4))
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exportiert neue Sitzungen als Parquet-Tabellen")
+    parser.add_argument("store", help="Verzeichnis des Sitzungsspeichers (z.B. data/sessions)")
+    parser.add_argument("output", help="Zielverzeichnis der Tabellen (z.B. data/export)")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS, help="Zeilen pro Schreibblock")
+    args = parser.parse_args()
+
+    for name, count in export_sessions(args.store, args.output, args.batch_rows).items():
+        print(f"{name}: {count} neue Zeilen")
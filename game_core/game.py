@@ -10,8 +10,21 @@ Verwaltet Spielfluss, Benutzerzustände und Übergänge zwischen den Modulen.
 # Bibliotheken importieren
 import pygame
 import sys
+import time
+import datetime
+import os
+import uuid
 from game_core.utilities import auto_save_data
 from game_core.constants import *
+from game_core import assets
+from game_core.text import TextCache, wrap_words
+from game_core.clock import GameClock
+from game_core.input import InputSampler
+from game_core.profiler import FrameProfiler
+from game_core.persistence import SessionWriter
+from game_core.store import SessionStore
+from game_core.shadow import ShadowScoring
+from game_core.log import get_logger
 
 # Spielzustände importieren
 from game_states.menu import MenuState
@@ -24,13 +37,29 @@ from game_states.results import ResultsState
 from game_states.bfi_validation import BFI10State
 from game_states.bfi_results import BFIResultsState
 
+logger = get_logger(__name__)
+
 class Game:
     def __init__(self):
         """Initialisiert das Spiel und seine Hauptkomponenten"""
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Persona Companion")
-        self.clock = pygame.time.Clock()
+        self.game_clock = GameClock()          # Spielzeit für Timer und Messungen der Zustände
+        self.input = InputSampler()            # Gestempelte Eingaben, auch während gewartet wird
+        self.profiler = FrameProfiler()        # Frame-Zeiten pro Zustand (Einblendung mit PROFILER_HOTKEY)
+        self.next_frame_ns = time.perf_counter_ns()  # Frühester Beginn des nächsten Frames
         
+        # Verzeichnis für gespeicherte Sitzungen, geschrieben wird im Hintergrund
+        self.data_dir = "data"
+        self.writer = SessionWriter()
+        self.store = None
+
+        # Alternative Formeln an den Rohdaten jedes Spiels erproben, in eigenen Prozessen
+        self.shadow = ShadowScoring()
+
+        # Cache für gerenderte Texte, damit statische Texte nicht jedes Frame neu gerastert werden
+        self.text_cache = TextCache()
+
         # Lade Schriftarten und Variablen
         self.load_fonts()
         self.initialize_variables()
@@ -48,8 +77,17 @@ class Game:
             "BFI_RESULTS": BFIResultsState(self)
         }
         
-        # Spiel beginnt im Menü
+        # Reihenfolge der Zustände, um die Bilder des nächsten Zustands vorzuladen
+        self.state_sequence = ["MENU", "GAME1", "GAME2", "GAME3", "GAME4", "GAME5", "RESULTS", "BFI10", "BFI_RESULTS"]
+
+        # Dirty-Rect-Rendering: Ereignistypen des aktuellen Frames und zuletzt dargestellte Ansicht
+        self.input_types = set()
+        self.presented_state = None
+        self.presented_view = None
+
+        # Spiel beginnt im Menü, die Bilder für Spiel 1 werden im Hintergrund geladen
         self.current_state = "MENU"
+        self.preload_next_state(self.current_state)
 
         # Persönlichkeitsdaten (Spiel-Score & Fragebogenvergleich)
         # Standardwerte für die Persönlichkeitsmerkmale
@@ -105,49 +143,163 @@ class Game:
             "agreeableness": 0,
             "neuroticism": 0
         }
+
+        # Reaktionszeiten aus Spiel 1 mit Messfehler
+        self.game1_timing = {}
+
+        # Strich-Protokolle der Zeichnungen aus Spiel 3
+        self.game3_drawings = []
         
         # Flag für automatisches Speichern zurücksetzen
         self.auto_save_needed = False
+
+        # Kennung der Sitzung im Sitzungsspeicher (neu bei jeder Rückkehr ins Menü)
+        self.session_id = uuid.uuid4().hex
     
     def run(self):
         """Hauptspielschleife"""
         running = True
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    # Speichere Daten vor dem Beenden, wenn notwendig
-                    if self.auto_save_needed:
-                        self.save_data_automatically()
-                    running = False
-                else:
-                    self.states[self.current_state].handle_event(event)
-
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            running = self.process_frame(self.wait_for_events())
+
+    def process_frame(self, events):
+        """
+        Verarbeitet einen Frame: Ereignisse an den aktuellen Zustand weitergeben, aktualisieren
+        und zeichnen. Gibt False zurück, wenn das Spiel beendet werden soll
+        """
+        running = True
+        profiler = self.profiler
+        profiler.begin_frame(self.current_state)
+        self.input_types = set()
+        for event in events:
+            self.input_types.add(event.type)
+            if event.type == pygame.QUIT:
+                # Speichere Daten vor dem Beenden, wenn notwendig
+                if self.auto_save_needed:
+                    self.save_data_automatically()
+                self.export_profile()
+                # Ausstehende Schatten-Bewertungen abschliessen, dann warten, bis alle Dateien geschrieben sind
+                self.shadow.close()
+                self.writer.close()
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == PROFILER_HOTKEY:
+                # Einblendung umschalten, danach den ganzen Bildschirm neu zeichnen
+                profiler.visible = not profiler.visible
+                self.presented_state = None
+            else:
+                start = time.perf_counter()
+                self.states[self.current_state].handle_event(event)
+                profiler.measure("handle_event", start)
+
+        start = time.perf_counter()
+        self.update()
+        profiler.measure("update", start)
+        start = time.perf_counter()
+        self.render()
+        profiler.measure("render", start)
+        profiler.end_frame(len(events))
+        return running
+
+    def wait_for_events(self):
+        """
+        Wartet entsprechend der Bildrate des aktuellen Zustands auf den nächsten Frame und gibt
+        die angefallenen Ereignisse zurück. Zustände melden ihre Bildrate über frame_rate()
+        (None = nur bei Eingaben neu zeichnen), ohne diese Methode läuft der Zustand mit FPS.
+        Während des Wartens werden Eingaben laufend abgeholt und beim Eintreffen gestempelt
+        """
+        state = self.states[self.current_state]
+        rate = state.frame_rate() if hasattr(state, "frame_rate") else FPS
+        if rate is None or rate < FPS:
+            # Blockierend auf das nächste Ereignis warten, höchstens bis zum nächsten Frame
+            timeout = IDLE_TIMEOUT if rate is None else int(1000 / rate)
+            self.input.sample_until(time.perf_counter_ns() + timeout * 1_000_000, stop_on_input=True)
+
+        # Begrenzt die Bildrate auch bei vielen Eingaben. Der nächste Termin wird vom letzten aus
+        # gerechnet, damit sich Verspätungen beim Aufwachen nicht aufsummieren
+        frame_ns = 1_000_000_000 // FPS
+        self.input.sample_until(self.next_frame_ns)
+        self.next_frame_ns = max(self.next_frame_ns + frame_ns, time.perf_counter_ns() + frame_ns // 2)
+        return self.input.drain()
+
+    def event_time_ms(self, event):
+        """Spielzeit eines Ereignisses in ms (Eintreffen statt Verarbeitung, siehe game_core/input.py)"""
+        if hasattr(event, "timestamp_ns"):
+            return self.game_clock.ms_at(event.timestamp_ns)
+        return self.game_clock.now_ms()
     
     def update(self):
         """Aktualisiert den Spielzustand"""
+        self.game_clock.tick()
         self.states[self.current_state].update()
  
     def render(self):
-        """Zeichnet den aktuellen Spielzustand"""
+        """
+        Zeichnet den aktuellen Spielzustand.
+        Zustände mit einer Methode dirty_rects() melden selbst, was sich geändert hat:
+        None = ganzer Bildschirm, Liste von Rechtecken = nur diese Bereiche, leere Liste = nichts
+        """
+        state = self.states[self.current_state]
+        rects = None
+        if hasattr(state, "dirty_rects"):
+            rects = state.dirty_rects()
+
+        # Nach einem Zustandswechsel und mit Profiler-Einblendung immer den ganzen Bildschirm zeichnen
+        if self.current_state != self.presented_state or self.profiler.visible:
+            rects = None
+        self.presented_state = self.current_state
+
+        # Statischer Bildschirm ohne Änderungen - nichts zeichnen und nichts darstellen
+        if rects is not None and not rects:
+            return
+
         # Hintergrund zeichnen
         self.screen.fill(BACKGROUND)
         
         # Aktuellen Spielzustand zeichnen
-        self.states[self.current_state].render()
+        state.render()
+        if self.profiler.visible:
+            self.profiler.draw(self.screen, self.caption_font)
+
+        # Eingaben, die während des Zeichnens eingetroffen sind, vor der Darstellung abholen
+        self.input.sample()
         
         # Bildschirm aktualisieren
-        pygame.display.flip()
+        before = time.perf_counter_ns()
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        presented = time.perf_counter_ns()
+
+        # Zustände mit einer Methode presented() erfahren, wann das Bild dargestellt wurde
+        # (Fehler = Dauer der Darstellung, der genaue Zeitpunkt liegt dazwischen)
+        if hasattr(state, "presented"):
+            state.presented(presented, presented - before)
+
+    def static_dirty_rects(self, view=None, ignore=()):
+        """
+        Dirty-Rects für Bildschirme, die sich nur durch Eingaben ändern: None (alles neu zeichnen)
+        nach einer Eingabe (ausser den Ereignistypen in ignore) oder wenn sich die Ansicht view
+        geändert hat, sonst eine leere Liste
+        """
+        view = (self.current_state, view)
+        changed = view != self.presented_view or any(event_type not in ignore for event_type in self.input_types)
+        self.presented_view = view
+        return None if changed else []
 
     def transition_to(self, new_state):
         """Wechselt zu einem anderen Spielzustand"""
-        print(f"\n==== Wechsel von {self.current_state} zu {new_state} ====")
+        logger.info("Wechsel von %s zu %s", self.current_state, new_state, extra={"data": {
+            "event": "transition", "from": self.current_state, "to": new_state}})
+
+        # Rohdaten des beendeten Spiels an die Schatten-Bewertung übergeben (game_core/shadow.py)
+        state = self.states.get(self.current_state)
+        if self.shadow.has_scorers(self.current_state) and hasattr(state, "measurements"):
+            self.shadow.submit(self.current_state, state.measurements())
         
         # Debug-Informationen vor dem Zustandswechsel
-        print("Personality Traits vor dem Wechsel:", self.personality_traits)
-        print("BFI Scores vor dem Wechsel:", self.bfi_scores)
+        logger.debug("Werte vor dem Wechsel", extra={"data": {
+            "personality_traits": dict(self.personality_traits), "bfi_scores": dict(self.bfi_scores)}})
         
         # Prüfe, ob wir zu einem Ergebnisbildschirm wechseln
         if new_state in ["RESULTS", "BFI_RESULTS"]:
@@ -158,14 +310,17 @@ class Game:
         if self.current_state in ["RESULTS", "BFI_RESULTS"] and new_state == "MENU":
             # Speichere Daten automatisch, bevor wir zum Menü zurückkehren
             self.save_data_automatically()
+            self.export_profile()
             # Zurücksetzen, da wir gerade gespeichert haben
             self.auto_save_needed = False
+            self.session_id = uuid.uuid4().hex
+            self.shadow.reset()
         
         # Prüfe, ob ein spezieller Zustandswechsel vorliegt
         if new_state == "BFI_RESULTS":
             # Stelle sicher, dass die personality_traits nicht leer oder alle 0 sind
             if not any(self.personality_traits.values()):
-                print("WARNUNG: Alle personality_traits sind 0 oder leer! Setze Standardwerte...")
+                logger.warning("Alle personality_traits sind 0 oder leer, setze Standardwerte")
                 self.personality_traits = {
                     "openness": 50,
                     "conscientiousness": 50,
@@ -176,7 +331,7 @@ class Game:
             
             # Stelle sicher, dass die BFI-Scores vorhanden sind
             if not hasattr(self, 'bfi_scores') or not self.bfi_scores:
-                print("WARNUNG: Keine BFI-Scores gefunden! Setze Standardwerte...")
+                logger.warning("Keine BFI-Scores gefunden, setze Standardwerte")
                 self.bfi_scores = {
                     "openness": 3.0,
                     "conscientiousness": 3.0,
@@ -186,25 +341,64 @@ class Game:
                 }
         
         self.current_state = new_state
-        print(f"==== Ende des Wechsels von {self.current_state} zu {new_state} ====\n")
+        self.preload_next_state(new_state)
+
+    def preload_next_state(self, state):
+        """Lädt die Bilder des auf state folgenden Zustands im Hintergrund"""
+        if state in self.state_sequence:
+            index = self.state_sequence.index(state)
+            if index + 1 < len(self.state_sequence):
+                assets.preload_state(self.state_sequence[index + 1])
     
     def save_data_automatically(self):
-        """Speichert die Benutzerdaten automatisch als CSV"""
+        """Speichert die Benutzerdaten automatisch als JSON (im Hintergrund)"""
         try:
             if self.user_name and any(self.personality_traits.values()):
                 from game_core.utilities import auto_save_data
                 filename = auto_save_data(self)
                 if filename:
-                    print(f"Daten automatisch gespeichert in: {filename}")
+                    logger.debug("Automatisches Speichern nach %s übergeben", filename)
                     return True
-        except Exception as e:
-            print(f"Fehler beim automatischen Speichern: {e}")
+        except Exception:
+            logger.exception("Fehler beim automatischen Speichern")
         return False
 
+    def session_store(self):
+        """Sitzungsspeicher im aktuellen Datenverzeichnis (siehe game_core/store.py)"""
+        directory = os.path.join(self.data_dir, SESSION_DIR)
+        if self.store is None or self.store.directory != directory:
+            self.store = SessionStore(directory)
+        return self.store
+
+    def export_profile(self):
+        """Speichert die Frame-Zeiten der Sitzung als CSV im Hintergrund (siehe game_core/profiler.py)"""
+        if not PROFILER_CSV or not self.profiler.rows:
+            return
+        try:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = os.path.join(self.data_dir, f"profile_{self.user_name or 'session'}_{timestamp}.csv")
+            rows = self.profiler.take_rows()
+            self.writer.submit(filename, lambda f: FrameProfiler.write_csv(f, rows), newline="",
+                               message="Frame-Zeiten gespeichert in %s")
+        except Exception:
+            logger.exception("Fehler beim Speichern der Frame-Zeiten")
+
 # =============================================================================
 #  UI Komponenten
 # =============================================================================
 
+    def render_text(self, font, text, antialias, color):
+        """Rendert Text über den Text-Cache (gleiche Argumente wie font.render)"""
+        return self.text_cache.render(font, text, antialias, color)
+
+    def layout_text(self, text, font, color, max_width, line_height=None, wrap=wrap_words):
+        """Gibt einen umgebrochenen, zwischengespeicherten Textblock (TextLayout) zurück"""
+        return self.text_cache.layout(font, text, color, max_width, line_height, wrap)
+
+    def render_multiline_text(self, text, font, color, x, y, max_width, line_height=None):
+        """Zeichnet mehrzeiligen Text automatisch umgebrochen und gibt die Y-Position unter dem Text zurück"""
+        return self.layout_text(text, font, color, max_width, line_height).draw(self.screen, x, y)
+
     def draw_button(self, text, x, y, width, height, color, text_color=TEXT_COLOR, font=None, border_radius=10, hover=False):
         """Zeichnet einen  Button mit Schatten und Hover-Effekt"""
         if font is None:
@@ -226,7 +420,7 @@ class Game:
             pygame.draw.rect(self.screen, color, button_rect, border_radius=border_radius)
                 
         # Text auf dem Button
-        text_surf = font.render(text, True, text_color)
+        text_surf = self.render_text(font, text, True, text_color)
         text_rect = text_surf.get_rect(center=(x, y))
         self.screen.blit(text_surf, text_rect)
         
@@ -276,7 +470,7 @@ class Game:
         pygame.draw.rect(self.screen, border_color, dropdown_rect, 2)
         
         # Ausgewählter Text
-        selected_text = self.caption_font.render(selected_option, True, TEXT_COLOR)
+        selected_text = self.render_text(self.caption_font, selected_option, True, TEXT_COLOR)
         self.screen.blit(selected_text, (x + 10, y + (height - selected_text.get_height()) // 2))
         
         # Pfeil nach unten zeichnen
@@ -308,7 +502,7 @@ class Game:
                     pygame.draw.rect(self.screen, NEUTRAL_LIGHT, option_rect)
                 
                 # Zeichne die Option
-                option_text = self.caption_font.render(option, True, TEXT_DARK)
+                option_text = self.render_text(self.caption_font, option, True, TEXT_DARK)
                 self.screen.blit(option_text, (x + 10, option_y + (option_height - option_text.get_height()) // 2))
                 
                 # Trennlinie zwischen Optionen
@@ -321,8 +515,7 @@ class Game:
 
     def debug_values(self):
         """Gibt Spielvariablen für Debugging-Zwecke aus"""
-        print("\n--- DEBUG WERTE ---")
-        print("Personality Traits:", self.personality_traits)
-        print("BFI Scores:", self.bfi_scores)
-        print("Aktueller Zustand:", self.current_state)
-        print("------------------\n")
\ No newline at end of file
+        logger.debug("Debug-Werte", extra={"data": {
+            "personality_traits": dict(self.personality_traits),
+            "bfi_scores": dict(self.bfi_scores),
+            "current_state": self.current_state}})
\ No newline at end of file
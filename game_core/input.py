@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Input
+Abtastung der Eingaben unabhängig vom Zeichnen. Während der Wartezeit bis zum nächsten Frame werden
+Ereignisse sofort beim Eintreffen abgeholt, mit perf_counter_ns gestempelt und in einen Ringpuffer
+gelegt, aus dem die Zustände sie mit ihrem ursprünglichen Zeitstempel erhalten.
+
+SDL erlaubt das Abholen von Ereignissen des Betriebssystems nur im Thread, dem das Fenster gehört.
+Deshalb tastet der Hauptthread selbst ab (beim Warten auf den nächsten Frame und vor jeder
+Darstellung) statt eines eigenen Threads.
+"""
+
+# Bibliotheken importieren
+import collections
+import time
+import pygame
+
+class InputBuffer:
+    """
+    Ringpuffer fester Grösse für gestempelte Ereignisse. Ein deque mit maxlen braucht für einen
+    Schreiber und einen Leser keine Sperre, bei vollem Puffer fällt das älteste Ereignis heraus
+    """
+    def __init__(self, capacity=1024):
+        self.events = collections.deque(maxlen=capacity)
+        self.dropped = 0    # Anzahl verworfener Ereignisse
+
+    def __len__(self):
+        return len(self.events)
+
+    def push(self, event):
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append(event)
+
+    def drain(self):
+        """Gibt alle gepufferten Ereignisse in Eingangsreihenfolge zurück und leert den Puffer"""
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+class InputSampler:
+    """
+    Holt Ereignisse ab und stempelt sie (timestamp_ns). Als Messfehler (timing_error_ns) gilt die
+    Zeit seit der letzten Abfrage, in der das Ereignis eingetroffen sein kann
+    """
+    def __init__(self, buffer=None):
+        self.buffer = buffer if buffer is not None else InputBuffer()
+        self.last_poll_ns = time.perf_counter_ns()
+
+    def _push(self, event, now):
+        event.timestamp_ns = now
+        event.timing_error_ns = now - self.last_poll_ns
+        self.buffer.push(event)
+
+    def sample(self):
+        """Holt alle anstehenden Ereignisse ab, ohne zu warten"""
+        now = time.perf_counter_ns()
+        for event in pygame.event.get():
+            self._push(event, now)
+        self.last_poll_ns = now
+
+    def sample_until(self, deadline_ns, stop_on_input=False):
+        """
+        Wartet bis deadline_ns (perf_counter_ns) auf Ereignisse und stempelt jedes beim Eintreffen.
+        Mit stop_on_input endet das Warten, sobald ein Ereignis im Puffer liegt
+        """
+        self.sample()
+        while True:
+            remaining = deadline_ns - time.perf_counter_ns()
+            if remaining <= 0 or (stop_on_input and self.buffer):
+                return
+            # Timeout 0 würde unbegrenzt warten
+            event = pygame.event.wait(max(1, remaining // 1_000_000))
+            now = time.perf_counter_ns()
+            if event.type != pygame.NOEVENT:
+                # Beim Eintreffen geweckt, der Zeitpunkt ist also bis auf die Weckzeit genau
+                self.last_poll_ns = now
+                self._push(event, now)
+                self.sample()
+            else:
+                self.last_poll_ns = now
+
+    def drain(self):
+        return self.buffer.drain()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Log
+Strukturiertes Logging für das Spiel. Die Zustände übergeben ihre Meldungen an eine Warteschlange
+(QueueHandler), ein Hintergrund-Thread (QueueListener) schreibt sie als JSON-Zeilen. Die
+Spielschleife wartet damit nie auf die Konsole. Strukturierte Daten (Zustandswechsel, Scores)
+werden über extra={"data": {...}} mitgegeben.
+
+Stufe und Ziel kommen aus LOG_LEVEL und LOG_FILE (game_core/constants.py), Debug-Meldungen
+sind standardmässig aus.
+"""
+
+# Bibliotheken importieren
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from game_core.constants import LOG_LEVEL, LOG_FILE
+
+# Gemeinsamer Name aller Logger des Spiels
+ROOT_LOGGER = "persona"
+
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """Formatiert einen Datensatz als eine JSON-Zeile"""
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if hasattr(record, "data"):
+            entry["data"] = record.data
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+def setup_logging(level=LOG_LEVEL, filename=LOG_FILE, stream=None):
+    """
+    Richtet das Logging einmalig ein: Stufenfilter, Warteschlange und Hintergrund-Thread, der
+    in filename (oder stream, Standard stderr) schreibt. Beim Beenden wird die Warteschlange geleert
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    if filename:
+        handler = logging.FileHandler(filename, encoding="utf-8")
+    else:
+        handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter())
+
+    # Unbegrenzte Warteschlange: put() blockiert nie
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(level)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+def shutdown_logging():
+    """Schreibt alle wartenden Meldungen und beendet den Hintergrund-Thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def get_logger(name):
+    """Logger für ein Modul (unterhalb von ROOT_LOGGER)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
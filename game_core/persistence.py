@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Persistence
+Speichern von Dateien ausserhalb der Spielschleife. Die Spielschleife legt nur einen Auftrag
+(Dateiname und Schreibfunktion) in eine begrenzte Warteschlange, ein Hintergrund-Thread schreibt
+ihn zuerst in eine temporäre Datei im Zielverzeichnis und benennt sie danach um. Eine Datei ist
+damit entweder vollständig oder gar nicht vorhanden, auch wenn das Spiel mitten im Schreiben endet.
+Sitzungen werden an den Sitzungsspeicher angehängt (game_core/store.py).
+
+Beim Beenden (close() bzw. atexit) werden alle noch wartenden Aufträge geschrieben.
+"""
+
+# Bibliotheken importieren
+import atexit
+import os
+import queue
+import threading
+import uuid
+from game_core.constants import SAVE_QUEUE_SIZE
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Markiert das Ende der Warteschlange
+_STOP = object()
+
+def write_atomic(filename, write, newline=None):
+    """
+    Schreibt eine Textdatei über eine temporäre Datei im selben Verzeichnis und benennt sie
+    danach um. write(f) erhält die geöffnete Datei
+    """
+    directory = os.path.dirname(filename) or "."
+    os.makedirs(directory, exist_ok=True)
+    # Rechte wie bei open(): der Kernel wendet die umask auf 0666 an (mkstemp legt 0600 an)
+    temp_name = os.path.join(directory, f".tmp_{uuid.uuid4().hex}")
+    fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline=newline) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, filename)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+class SessionWriter:
+    """
+    Hintergrund-Thread zum Schreiben von Dateien und Sitzungen. submit() und append() kehren
+    sofort zurück, solange die Warteschlange (maxsize Aufträge) nicht voll ist; bei voller
+    Warteschlange warten sie, statt Daten zu verwerfen. Alle wartenden Sitzungen eines
+    Speichers werden mit einem Schreibvorgang angehängt
+    """
+    def __init__(self, maxsize=SAVE_QUEUE_SIZE):
+        self.queue = queue.Queue(maxsize)
+        self.thread = threading.Thread(target=self._run, name="SessionWriter", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def _put(self, job):
+        if self.thread is None:
+            raise RuntimeError("SessionWriter ist bereits geschlossen")
+        try:
+            self.queue.put_nowait(job)
+        except queue.Full:
+            logger.warning("Speicher-Warteschlange voll, warte auf den Hintergrund-Thread")
+            self.queue.put(job)
+
+    def submit(self, filename, write, newline=None, message=None, data=None):
+        """
+        Schreibt eine Datei (siehe write_atomic). message und data werden nach dem Schreiben
+        protokolliert. Die übergebenen Daten dürfen danach nicht mehr verändert werden
+        """
+        self._put(("file", filename, write, newline, message, data))
+        return filename
+
+    def append(self, store, record, message=None, data=None):
+        """Hängt eine Sitzung an einen SessionStore an (siehe game_core/store.py)"""
+        self._put(("append", store, record, None, message, data))
+        return record.get("session_id")
+
+    def _run(self):
+        while True:
+            jobs = [self.queue.get()]
+            # Was inzwischen wartet, gleich mitnehmen
+            while jobs[-1] is not _STOP and len(jobs) < self.queue.maxsize:
+                try:
+                    jobs.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write([job for job in jobs if job is not _STOP])
+            finally:
+                for _ in jobs:
+                    self.queue.task_done()
+            if jobs[-1] is _STOP:
+                return
+
+    def _write(self, jobs):
+        batches = {}
+        for kind, target, payload, newline, message, data in jobs:
+            if kind == "append":
+                batches.setdefault(target, []).append((payload, message, data))
+                continue
+            try:
+                write_atomic(target, payload, newline)
+                if message:
+                    logger.info(message, target, extra={"data": data} if data else None)
+            except Exception:
+                logger.exception("Fehler beim Speichern von %s", target)
+
+        for store, batch in batches.items():
+            try:
+                store.append([record for record, _, _ in batch])
+                for record, message, data in batch:
+                    if message:
+                        logger.info(message, store.directory, extra={"data": data} if data else None)
+            except Exception:
+                logger.exception("Fehler beim Speichern in %s", store.directory)
+
+    def flush(self):
+        """Wartet, bis alle bisher übergebenen Aufträge geschrieben sind"""
+        self.queue.join()
+
+    def close(self):
+        """Schreibt alle wartenden Aufträge und beendet den Hintergrund-Thread"""
+        if self.thread is None:
+            return
+        self.queue.put(_STOP)
+        self.thread.join()
+        self.thread = None
+        atexit.unregister(self.close)
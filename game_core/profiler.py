@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Profiler
+Misst pro Frame die Zeit für handle_event, update und render des aktuellen Zustands. Pro Zustand
+werden die letzten Frames für Perzentile (p50/p95/p99/max) gehalten, die als Einblendung angezeigt
+werden können (PROFILER_HOTKEY). Am Ende einer Sitzung können die Frame-Zeiten als CSV gespeichert
+werden (PROFILER_CSV), dafür werden höchstens die letzten max_rows Frames gehalten.
+"""
+
+# Bibliotheken importieren
+import collections
+import csv
+import time
+import numpy as np
+import pygame
+from game_core.constants import PROFILER_MAX_ROWS
+
+# Gemessene Abschnitte eines Frames
+PHASES = ("handle_event", "update", "render")
+
+class FrameProfiler:
+    """
+    Zeitmessung pro Frame. begin_frame() startet einen Frame, measure() addiert die Dauer eines
+    Abschnitts, end_frame() legt den Frame ab. window bestimmt, über wie viele Frames pro
+    Zustand die Perzentile gerechnet werden, max_rows wie viele Frames für den CSV-Export gehalten werden
+    """
+    def __init__(self, window=600, max_rows=PROFILER_MAX_ROWS):
+        self.window = window
+        self.history = {}       # Zustand -> {Abschnitt: deque der letzten Zeiten in ms}
+        self.rows = collections.deque(maxlen=max_rows)  # Letzte Frames seit dem Abholen (für CSV)
+        self.visible = False
+        self.frame = 0
+        self.start = time.perf_counter()
+        self.state = None
+        self.current = dict.fromkeys(PHASES, 0.0)
+
+    def begin_frame(self, state):
+        self.state = state
+        self.current = dict.fromkeys(PHASES, 0.0)
+
+    def measure(self, phase, start):
+        """Addiert die Zeit seit start (perf_counter) zum Abschnitt phase"""
+        self.current[phase] += (time.perf_counter() - start) * 1000
+
+    def end_frame(self, event_count):
+        history = self.history.get(self.state)
+        if history is None:
+            history = self.history[self.state] = {phase: collections.deque(maxlen=self.window) for phase in PHASES}
+        for phase in PHASES:
+            history[phase].append(self.current[phase])
+
+        self.frame += 1
+        self.rows.append((self.frame, round(time.perf_counter() - self.start, 4), self.state, event_count,
+                          *(round(self.current[phase], 4) for phase in PHASES)))
+
+    def stats(self, state):
+        """Perzentile der letzten Frames eines Zustands: {Abschnitt: (p50, p95, p99, max)}"""
+        result = {}
+        for phase, times in self.history.get(state, {}).items():
+            if times:
+                values = np.fromiter(times, dtype=float)
+                p50, p95, p99 = np.percentile(values, (50, 95, 99))
+                result[phase] = (float(p50), float(p95), float(p99), float(values.max()))
+        return result
+
+    def draw(self, screen, font):
+        """Zeichnet die Perzentile des aktuellen Zustands oben links über das Bild"""
+        rows = [(str(self.state), "p50 / p95 / p99 / max (ms)")]
+        for phase, values in self.stats(self.state).items():
+            rows.append((phase, " / ".join(f"{value:.2f}" for value in values)))
+
+        # Wechselnde Zahlen nicht über den Text-Cache rendern, damit er nicht verdrängt wird
+        rows = [(font.render(label, True, (255, 255, 255)), font.render(values, True, (255, 255, 255)))
+                for label, values in rows]
+        label_width = max(label.get_width() for label, _ in rows) + 15
+        line_height = font.get_linesize()
+        panel = pygame.Surface((label_width + max(values.get_width() for _, values in rows) + 20,
+                                line_height * len(rows) + 20), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, (label, values) in enumerate(rows):
+            panel.blit(label, (10, 10 + i * line_height))
+            panel.blit(values, (10 + label_width, 10 + i * line_height))
+        screen.blit(panel, (10, 10))
+
+    def take_rows(self):
+        """Gibt die Frames seit dem letzten Abholen zurück und leert den Puffer"""
+        rows = list(self.rows)
+        self.rows.clear()
+        return rows
+
+    @staticmethod
+    def write_csv(f, rows):
+        """Schreibt Frames (aus take_rows) als CSV in die geöffnete Datei f"""
+        writer = csv.writer(f)
+        writer.writerow(["frame", "time_s", "state", "events", *(f"{phase}_ms" for phase in PHASES)])
+        writer.writerows(rows)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Rescore
+Bewertet alle gespeicherten Sitzungen (game_core/store.py) mit den aktuellen Formeln neu, z.B. nach
+einer Änderung der Gewichte in game_core/scoring.py oder der Persona-Profile. Die Segmente werden
+blockweise gelesen (chunk_size Sitzungen) und die Blöcke auf einen Prozess-Pool verteilt, höchstens
+zwei Blöcke pro Prozess sind gleichzeitig unterwegs. Der Speicherbedarf hängt damit nicht von der
+Grösse des Archivs ab.
+
+Die Ergebnisse landen im Verzeichnis des Speichers in scores_v<SCORING_VERSION>/ mit einer Datei pro
+Segment (eine Zeile pro Sitzung mit neuen und bisherigen Scores). checkpoint.json merkt sich pro
+Segment, bis wohin gelesen und geschrieben ist: ein abgebrochener Lauf setzt dort fort, ein späterer
+Lauf bewertet nur neu angehängte Sitzungen.
+
+Bewertet wird von jeder Sitzung nur die letzte Fassung laut Index (siehe game_core/store.py), gelesen
+wird deshalb nur, was bereits im Index steht. Jede Ergebniszeile nennt Segment und Offset der
+bewerteten Fassung: wurde eine Sitzung erst nach einem Lauf erneut gespeichert, gilt wie im Speicher
+die Zeile mit dem grössten (segment, offset).
+
+Sitzungen ohne Rohdaten ("measurements", vor Einführung von game_core/scoring.py gespeichert)
+werden übersprungen. Offenheit (Spiel 3) wird aus der gespeicherten Sitzung übernommen.
+
+Aufruf:  python -m game_core.rescore data/sessions --workers 8
+"""
+
+# Bibliotheken importieren
+import argparse
+import collections
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from game_core import scoring
+from game_core.persistence import write_atomic
+from game_core.store import SessionStore, is_latest
+from game_core.utilities import PERSONA_NAMES, TRAIT_ORDER, classify_personas
+
+# Sitzungen pro Block, der an einen Prozess geht
+CHUNK_SIZE = 2000
+CHECKPOINT_FILE = "checkpoint.json"
+
+# Letzte Fassung jeder Sitzung (store.latest_locations()), in jedem Prozess einmal gesetzt
+_latest = {}
+
+def _set_latest(latest):
+    global _latest
+    _latest = latest
+
+def _personas(traits):
+    """Persona-Namen für eine Liste von Trait-Dictionaries"""
+    indices = classify_personas(np.array([[row[trait] for trait in TRAIT_ORDER] for row in traits], dtype=float).reshape(-1, 5))
+    return [PERSONA_NAMES[index] for index in indices]
+
+def score_chunk(segment, offset, lines):
+    """
+    Bewertet einen Block gespeicherter Sitzungen (JSON-Zeilen ab Byte offset im Segment) neu.
+    Ersetzte Fassungen einer Sitzung werden ausgelassen. Läuft in einem Prozess des Pools
+
+    Returns:
+        tuple: (Ergebniszeilen als Bytes, Anzahl bewertet, Anzahl übersprungen)
+    """
+    sessions = []
+    offsets = []
+    superseded = 0
+    for line in lines:
+        position, offset = offset, offset + len(line)
+        try:
+            session = json.loads(line)
+        except ValueError:
+            continue
+        if not is_latest(_latest, session.get("session_id"), segment, position):
+            superseded += 1
+        elif "measurements" in session:
+            sessions.append(session)
+            offsets.append(position)
+    skipped = len(lines) - len(sessions) - superseded
+    if not sessions:
+        return b"", 0, skipped
+
+    scores = scoring.score_sessions([session["measurements"] for session in sessions])
+    traits = [
+        {trait: int(scores[trait][i]) if trait in scores else session["personality_traits"][trait] for trait in TRAIT_ORDER}
+        for i, session in enumerate(sessions)
+    ]
+    personas = _personas(traits)
+    previous_personas = _personas([session["personality_traits"] for session in sessions])
+
+    output = []
+    for i, session in enumerate(sessions):
+        bfi = {trait: float(scores[f"bfi_{trait}"][i]) for trait in TRAIT_ORDER}
+        output.append(json.dumps({
+            "session_id": session.get("session_id"),
+            "segment": segment,
+            "offset": offsets[i],
+            "user_name": session.get("user_name"),
+            "timestamp": session["timestamp"],
+            "scoring_version": scoring.SCORING_VERSION,
+            "personality_traits": traits[i],
+            "bfi_scores": {trait: None if np.isnan(value) else value for trait, value in bfi.items()},
+            "persona": personas[i],
+            "previous": {
+                "scoring_version": session.get("scoring_version"),
+                "personality_traits": session["personality_traits"],
+                "bfi_scores": session.get("bfi_scores"),
+                "persona": previous_personas[i]
+            }
+        }, ensure_ascii=False) + "\n")
+    return "".join(output).encode("utf-8"), len(sessions), skipped
+
+def read_chunks(f, chunk_size, end):
+    """
+    Liest vollständige Zeilen bis Byte end blockweise, gibt (Position vor dem Block, Zeilen,
+    Position nach dem Block) zurück
+    """
+    lines = []
+    start = position = f.tell()
+    for line in f:
+        if not line.endswith(b"\n") or position + len(line) > end:
+            break
+        lines.append(line)
+        position += len(line)
+        if len(lines) >= chunk_size:
+            yield start, lines, position
+            start, lines = position, []
+    if lines:
+        yield start, lines, position
+
+def rescore(store_dir, output_dir=None, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Bewertet alle noch nicht bewerteten Sitzungen aus store_dir neu
+
+    Returns:
+        dict: Anzahl bewerteter, ohne Rohdaten übersprungener und ersetzter Sitzungen
+    """
+    store = SessionStore(store_dir)
+    output_dir = output_dir or os.path.join(store_dir, f"scores_v{scoring.SCORING_VERSION}")
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint_file = os.path.join(output_dir, CHECKPOINT_FILE)
+    checkpoint = {"scoring_version": scoring.SCORING_VERSION, "segments": {}}
+    if os.path.exists(checkpoint_file):
+        with open(checkpoint_file, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+
+    workers = workers or os.cpu_count() or 1
+    totals = {"scored": 0, "skipped": 0, "superseded": 0}
+    latest, ends = store.index_summary()
+    with ProcessPoolExecutor(workers, initializer=_set_latest, initargs=(latest,)) as pool:
+        for segment in store.segments():
+            progress = checkpoint["segments"].setdefault(segment, {"offset": 0, "output_size": 0})
+            output_file = os.path.join(output_dir, segment)
+
+            # Ergebnisse nach dem letzten Checkpoint stammen aus einem abgebrochenen Lauf
+            if os.path.exists(output_file):
+                os.truncate(output_file, progress["output_size"])
+
+            with open(os.path.join(store_dir, segment), "rb") as f, open(output_file, "ab") as out:
+                f.seek(progress["offset"])
+                pending = collections.deque()
+
+                def write_oldest():
+                    future, position, count = pending.popleft()
+                    data, scored, skipped = future.result()
+                    out.write(data)
+                    out.flush()
+                    os.fsync(out.fileno())
+                    progress["offset"] = position
+                    progress["output_size"] += len(data)
+                    write_atomic(checkpoint_file, lambda c: json.dump(checkpoint, c, indent=4))
+                    totals["scored"] += scored
+                    totals["skipped"] += skipped
+                    totals["superseded"] += count - scored - skipped
+
+                # Blöcke in Lesereihenfolge schreiben, damit der Checkpoint eine einfache Position bleibt
+                for start, lines, position in read_chunks(f, chunk_size, ends.get(segment, 0)):
+                    pending.append((pool.submit(score_chunk, segment, start, lines), position, len(lines)))
+                    if len(pending) >= workers * 2:
+                        write_oldest()
+                while pending:
+                    write_oldest()
+    return totals
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bewertet gespeicherte Sitzungen mit den aktuellen Formeln neu")
+    parser.add_argument("store", help="Verzeichnis des Sitzungsspeichers (z.B. data/sessions)")
+    parser.add_argument("--output", help="Zielverzeichnis (Standard: <store>/scores_v<Version>)")
+    parser.add_argument("--workers", type=int, help="Anzahl Prozesse (Standard: Anzahl Kerne)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Sitzungen pro Block")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    totals = rescore(args.store, args.output, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(f"Version {scoring.SCORING_VERSION}: {totals['scored']} Sitzungen neu bewertet, "
+          f"{totals['skipped']} ohne Rohdaten übersprungen, {totals['superseded']} ersetzte Fassungen "
+          f"ausgelassen ({elapsed:.1f} s)")
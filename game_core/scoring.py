@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Scoring
+Berechnung der Scores aus den Rohdaten der Spiele, unabhängig von der Darstellung. Jede Funktion
+bewertet N Sitzungen auf einmal: Eingaben sind Arrays mit einer Zeile pro Sitzung, Ausgaben ein
+Array mit einem Score pro Sitzung. Die Spielzustände rufen dieselben Funktionen mit N = 1 auf,
+damit Spiel und Neubewertung älterer Sitzungen immer dieselben Ergebnisse liefern.
+
+Summen über Antworten werden Spalte für Spalte in derselben Reihenfolge gebildet wie früher in den
+Spielzuständen (sum() über die Liste), sodass auch die Rundung identisch ist.
+
+Die Rohdaten liefern die Spielzustände über measurements(), sie werden mit der Sitzung gespeichert
+(Schlüssel "measurements"). score_sessions() bewertet eine Liste solcher Sitzungen.
+"""
+
+# Bibliotheken importieren
+import numpy as np
+
+# Version der Formeln: bei jeder Änderung an Formeln oder Gewichten erhöhen. Gespeicherte Sitzungen
+# und neu bewertete Ergebnisse (game_core/rescore.py) tragen diese Version
+SCORING_VERSION = 1
+
+# Rohdaten von Spiel 1 (Zähler und Summen pro Sitzung)
+GAME1_FIELDS = (
+    "correct_clicks", "incorrect_clicks", "panic_clicks", "rapid_clicks", "missed_targets",
+    "missed_easy_targets", "hesitations", "time_remaining", "normal_correct", "normal_incorrect",
+    "stress_correct", "stress_incorrect", "error_reaction_sum", "error_reaction_count"
+)
+
+# Gewichte der Neurotizismus-Komponenten (Reihenfolge = Summationsreihenfolge)
+NEUROTICISM_WEIGHTS = {
+    "vulnerability": 0.25,
+    "depression": 0.2,
+    "impulsiveness": 0.15,
+    "anxiety": 0.25,
+    "self_consciousness": 0.15
+}
+
+# Kategorien von Spiel 4 in Prioritätsreihenfolge: benachbarte Kategorien geben Teilpunkte
+PRIORITY_CATEGORIES = ("Hohe Priorität", "Mittlere Priorität", "Niedrige Priorität", "Delegieren/Verschieben")
+
+# Spiel 2: Klassen der Schieberegler-Position (0-100) und Untergrenze jeder Klasse ab der zweiten
+POSITION_CLASSES = ("introvert_strong", "introvert_leaning", "balanced", "extravert_leaning", "extravert_strong")
+POSITION_THRESHOLDS = (25, 45, 56, 76)
+
+# BFI-10: umgekehrt gepolte Items und Item-Paare pro Dimension
+BFI_REVERSE_ITEMS = (0, 2, 3, 4, 6, 8)
+BFI_ITEMS = {
+    "openness": (4, 9),
+    "conscientiousness": (2, 7),
+    "extraversion": (0, 5),
+    "agreeableness": (1, 6),
+    "neuroticism": (3, 8)
+}
+
+def pad_rows(rows, fill=np.nan):
+    """Liste unterschiedlich langer Listen als 2D-Array, aufgefüllt mit fill"""
+    width = max((len(row) for row in rows), default=0)
+    result = np.full((len(rows), width), fill, dtype=float)
+    for i, row in enumerate(rows):
+        result[i, :len(row)] = row
+    return result
+
+def _column_sum(values):
+    """Zeilensummen, Spalte für Spalte von links addiert (wie sum() über eine Liste)"""
+    total = np.zeros(len(values))
+    for column in values.T:
+        total = total + column
+    return total
+
+def neuroticism_scores(m, weights=NEUROTICISM_WEIGHTS):
+    """
+    Neurotizismus aus den Rohdaten von Spiel 1
+
+    Args:
+        m: Dictionary mit einem Array pro Feld aus GAME1_FIELDS
+        weights: Gewicht pro Komponente (Standard: NEUROTICISM_WEIGHTS)
+
+    Returns:
+        tuple: (Scores 0-100, {Komponente: Scores})
+    """
+    m = {field: np.asarray(m[field], dtype=float) for field in GAME1_FIELDS}
+    clicks = m["correct_clicks"] + m["incorrect_clicks"]
+    accuracy = m["correct_clicks"] / np.maximum(1, clicks)
+
+    # (a) Leistungsunterschied zwischen normaler und Stress-Phase
+    normal_total = m["normal_correct"] + m["normal_incorrect"]
+    stress_total = m["stress_correct"] + m["stress_incorrect"]
+    both = (normal_total > 0) & (stress_total > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        difference = np.abs(m["normal_correct"] / normal_total - m["stress_correct"] / stress_total)
+    performance_stability = np.where(both, 1.0 - np.minimum(1.0, difference * 2), 0.5)
+
+    # (b) Frustrations-Indikatoren
+    panic_rate = np.minimum(1.0, m["panic_clicks"] / np.maximum(10, clicks))
+    rapid_click_rate = np.minimum(1.0, m["rapid_clicks"] / np.maximum(10, clicks))
+    missed_easy_rate = np.minimum(1.0, m["missed_easy_targets"] / np.maximum(5, m["missed_targets"]))
+    frustration_indicator = panic_rate * 0.4 + rapid_click_rate * 0.3 + missed_easy_rate * 0.3
+
+    # (c) Erholung nach Fehlern
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_recovery_time = m["error_reaction_sum"] / m["error_reaction_count"]
+    recovery_factor = np.where(m["error_reaction_count"] > 0,
+                               np.maximum(0.0, np.minimum(1.0, 1.0 - (avg_recovery_time - 500) / 1500)), 0.5)
+
+    # (d) Zögern und Grübeln
+    hesitation_factor = np.minimum(1.0, m["hesitations"] / np.maximum(5, m["time_remaining"] // 5))
+
+    components = {
+        "vulnerability": 100 - (performance_stability * 100).astype(np.int64),
+        "depression": ((1.0 - recovery_factor) * 60 + frustration_indicator * 40).astype(np.int64),
+        "impulsiveness": (rapid_click_rate * 60 + panic_rate * 40).astype(np.int64),
+        "anxiety": (hesitation_factor * 70 + (1.0 - accuracy) * 30).astype(np.int64),
+        "self_consciousness": ((1.0 - recovery_factor) * 100).astype(np.int64)
+    }
+    total = np.zeros(len(accuracy))
+    for component, weight in weights.items():
+        total = total + components[component] * weight
+    return total.astype(np.int64), components
+
+def extraversion_scores(values, weights):
+    """
+    Gewichteter Mittelwert der Antworten aus Spiel 2 in Prozent
+
+    Args:
+        values: Array (N, Antworten) mit Werten 0-1, fehlende Antworten NaN
+        weights: Array (N, Antworten) mit den Gewichten
+
+    Returns:
+        np.ndarray: Scores 0-100 (0 für Sitzungen ohne Antwort)
+    """
+    values = np.asarray(values, dtype=float)
+    answered = ~np.isnan(values)
+    sum_weighted_scores = _column_sum(np.where(answered, values * np.asarray(weights, dtype=float), 0.0))
+    sum_weights = _column_sum(np.where(answered, weights, 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage = sum_weighted_scores / sum_weights * 100
+    return np.where(sum_weights > 0, percentage, 0).astype(np.int64)
+
+def conscientiousness_scores(ideal, container, partial_credit=0.5, max_distance=1):
+    """
+    Gewissenhaftigkeit aus der Sortierung in Spiel 4
+
+    Args:
+        ideal: Array (N, Aufgaben) mit dem Index der idealen Kategorie (PRIORITY_CATEGORIES),
+               -1 für nicht vorhandene Aufgaben
+        container: Array (N, Aufgaben) mit dem Index der gewählten Kategorie, -1 = nicht sortiert
+        partial_credit: Punkte für eine Kategorie, die höchstens max_distance Stufen neben der idealen liegt
+
+    Returns:
+        np.ndarray: Scores 0-100 (Gleitkomma, wie im Spiel)
+    """
+    ideal = np.asarray(ideal)
+    container = np.asarray(container)
+    tasks = ideal >= 0
+    organized = tasks & (container >= 0)
+    organized_count = organized.sum(axis=1)
+
+    # Volle Punkte für die ideale, Teilpunkte für eine benachbarte Kategorie
+    distance = np.abs(ideal - container)
+    points = np.where(organized & (distance == 0), 1.0,
+                      np.where(organized & (distance <= max_distance), partial_credit, 0.0))
+    organization_rate = organized_count / tasks.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        categorization_quality = np.where(organized_count > 0, points.sum(axis=1) / organized_count, 0)
+
+    raw_score = (organization_rate * 0.4 + categorization_quality * 0.6) * 100
+    return np.clip(raw_score, 0, 100)
+
+def classify_positions(positions, thresholds=POSITION_THRESHOLDS):
+    """
+    Klasse (Index in POSITION_CLASSES) für ganzzahlige Schieberegler-Positionen aus Spiel 2
+
+    Args:
+        positions: Array mit Positionen 0-100
+        thresholds: aufsteigende Untergrenzen der Klassen 2-5
+    """
+    return np.searchsorted(np.asarray(thresholds), np.asarray(positions), side="right")
+
+def agreeableness_scores(values, rounds):
+    """
+    Verträglichkeit aus den Wahlen in Spiel 5 (niedriger Wert = grosszügiger)
+
+    Args:
+        values: Array (N, Runden) mit den Schieberegler-Werten 0-100, fehlende Runden NaN
+        rounds: Anzahl Runden des Spiels (Maximum = 100 pro Runde)
+
+    Returns:
+        np.ndarray: Scores 0-100
+    """
+    values = np.asarray(values, dtype=float)
+    cooperation = _column_sum(np.where(np.isnan(values), 0.0, 100 - values))
+    return (cooperation / (100 * np.asarray(rounds)) * 100).astype(np.int64)
+
+def bfi_scores(answers):
+    """
+    BFI-10-Scores pro Dimension
+
+    Args:
+        answers: Array (N, 10) mit den Antworten 1-5
+
+    Returns:
+        dict: {Dimension: Scores 1-5}
+    """
+    answers = np.array(answers, dtype=float)
+    answers[:, BFI_REVERSE_ITEMS] = 6 - answers[:, BFI_REVERSE_ITEMS]
+    return {trait: (answers[:, first] + answers[:, second]) / 2 for trait, (first, second) in BFI_ITEMS.items()}
+
+def score_sessions(sessions):
+    """
+    Bewertet gespeicherte Sitzungen anhand ihrer Rohdaten (Schlüssel "measurements")
+
+    Args:
+        sessions: Liste von Dictionaries {"game1": {...}, "game2": {...}, "game4": {...},
+                  "game5": {...}, "bfi": {...}} wie von measurements() der Spielzustände
+
+    Returns:
+        dict: {Score: Array}, mit den Traits und bfi_<Dimension>
+    """
+    game1 = {field: [session["game1"][field] for session in sessions] for field in GAME1_FIELDS}
+    neuroticism, components = neuroticism_scores(game1)
+    result = {
+        "neuroticism": neuroticism,
+        "extraversion": extraversion_scores(pad_rows([session["game2"]["values"] for session in sessions]),
+                                            pad_rows([session["game2"]["weights"] for session in sessions], 0.0)),
+        "conscientiousness": conscientiousness_scores(
+            pad_rows([session["game4"]["ideal"] for session in sessions], -1).astype(np.int64),
+            pad_rows([session["game4"]["container"] for session in sessions], -1).astype(np.int64)).astype(np.int64),
+        "agreeableness": agreeableness_scores(pad_rows([session["game5"]["values"] for session in sessions]),
+                                              [session["game5"]["rounds"] for session in sessions])
+    }
+    result.update({f"game1_{component}": scores for component, scores in components.items()})
+
+    # BFI nur für Sitzungen mit vollständigen Antworten
+    answered = [i for i, session in enumerate(sessions) if None not in session["bfi"]["answers"]]
+    for trait, scores in bfi_scores(np.array([sessions[i]["bfi"]["answers"] for i in answered]).reshape(-1, 10)).items():
+        column = np.full(len(sessions), np.nan)
+        column[answered] = scores
+        result[f"bfi_{trait}"] = column
+    return result
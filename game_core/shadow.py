@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shadow
+Schatten-Bewertung: alternative Formeln (z.B. neue Gewichte für Spiel 1) werden an echten
+Sitzungen erprobt, ohne dass sich für die Spieler etwas ändert. Am Ende jedes Spiels übergibt
+Game.transition_to() die Rohdaten des Zustands (measurements()) an die dafür registrierten
+Bewerter. Diese laufen in einem eigenen Prozess-Pool (SHADOW_WORKERS), nie in der Spielschleife,
+auch nicht in einem Thread daneben, der um den GIL konkurrieren würde. Die Ergebnisse werden neben
+den offiziellen personality_traits gespeichert (Schlüssel "shadow_scores": {Zustand: {Bewerter:
+Ergebnis}}). Beim Speichern wird auf keinen Bewerter gewartet: sind noch nicht alle fertig, wird die
+Sitzung zuerst ohne Ergebnisse gespeichert und später eine vollständige Fassung angehängt (im
+Sitzungsspeicher gilt die letzte Fassung einer Sitzung).
+
+Ein Bewerter erhält die Rohdaten als Dictionary und gibt ein JSON-taugliches Ergebnis zurück. Er
+muss sich an einen anderen Prozess übergeben lassen (Funktion auf Modulebene, ggf. mit
+functools.partial), Lambdas funktionieren nicht. Registriert wird vor dem Erstellen des Spiels,
+z.B. in main.py:
+
+    from functools import partial
+    from game_core import shadow
+    shadow.register("GAME1", "weights_v2", partial(shadow.neuroticism_variant, weights={
+        "vulnerability": 0.2, "depression": 0.2, "impulsiveness": 0.2, "anxiety": 0.25, "self_consciousness": 0.15}))
+    shadow.register("GAME4", "adjacent_0.25", partial(shadow.conscientiousness_variant, partial_credit=0.25))
+    shadow.register("GAME2", "thresholds_v2", partial(shadow.position_classes_variant, thresholds=(20, 40, 61, 81)))
+
+Ohne registrierte Bewerter wird kein Pool gestartet.
+"""
+
+# Bibliotheken importieren
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from game_core import scoring
+from game_core.constants import SHADOW_WORKERS
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Registrierte Bewerter pro Spielzustand: {Zustand: [(Name, Bewerter), ...]}
+SCORERS = {}
+
+def register(state, name, scorer):
+    """Registriert einen Bewerter für die Rohdaten eines Spielzustands (z.B. "GAME1")"""
+    SCORERS.setdefault(state, []).append((name, scorer))
+
+# =============================================================================
+# Varianten der offiziellen Formeln (game_core/scoring.py) für eine Sitzung
+# =============================================================================
+
+def neuroticism_variant(measurements, weights):
+    """Neurotizismus aus Spiel 1 mit anderen Gewichten der Komponenten"""
+    scores, _ = scoring.neuroticism_scores({field: [measurements[field]] for field in scoring.GAME1_FIELDS}, weights)
+    return int(scores[0])
+
+def conscientiousness_variant(measurements, partial_credit=0.5, max_distance=1):
+    """Gewissenhaftigkeit aus Spiel 4 mit anderen Teilpunkten für benachbarte Kategorien"""
+    scores = scoring.conscientiousness_scores([measurements["ideal"]], [measurements["container"]],
+                                              partial_credit, max_distance)
+    return int(scores[0])
+
+def position_classes_variant(measurements, thresholds):
+    """Klassen der Antworten aus Spiel 2 mit anderen Grenzen, Anzahl Antworten pro Klasse"""
+    positions = np.rint(np.asarray(measurements["values"], dtype=float) * 100).astype(np.int64)
+    counts = np.bincount(scoring.classify_positions(positions, thresholds), minlength=len(scoring.POSITION_CLASSES))
+    return dict(zip(scoring.POSITION_CLASSES, counts.tolist()))
+
+# =============================================================================
+# Ausführung im Prozess-Pool
+# =============================================================================
+
+def run_scorers(scorers, measurements):
+    """Führt alle Bewerter eines Zustands aus. Läuft in einem Prozess des Pools"""
+    results = {}
+    for name, scorer in scorers:
+        try:
+            result = scorer(measurements)
+            results[name] = result.tolist() if isinstance(result, (np.ndarray, np.generic)) else result
+        except Exception as e:
+            results[name] = {"error": repr(e)}
+    return results
+
+def resolve(pending):
+    """
+    Ergebnisse fertiger Aufträge als {Zustand: {Bewerter: Ergebnis}}. Fehlgeschlagene oder
+    abgebrochene Aufträge werden als Fehler eingetragen
+    """
+    results = {}
+    for state, future in pending.items():
+        try:
+            results[state] = future.result(0)
+        except Exception as e:
+            logger.warning("Schatten-Bewertung von %s fehlgeschlagen: %r", state, e)
+            results[state] = {"error": repr(e)}
+    return results
+
+class ShadowScoring:
+    """
+    Verteilt die Rohdaten beendeter Spiele an die registrierten Bewerter. submit() und save()
+    kehren sofort zurück
+    """
+    def __init__(self, scorers=SCORERS, workers=SHADOW_WORKERS):
+        self.scorers = scorers
+        self.workers = workers
+        self.pool = None
+        self.pending = {}           # Aufträge der laufenden Sitzung: {Zustand: Future}
+        self.follow_ups = {}        # session_id -> Kennung des Speicherns, dessen Ergebnisse noch ausstehen
+        self.lock = threading.RLock()
+        if any(scorers.values()):
+            # Prozesse schon jetzt starten, nicht erst am Ende des ersten Spiels
+            for _ in range(workers):
+                self._pool().submit(int)
+
+    def _pool(self):
+        if self.pool is None:
+            # spawn statt fork: der Spielprozess hat bereits Threads (Speichern, Logging)
+            self.pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self.pool
+
+    def has_scorers(self, state):
+        return bool(self.scorers.get(state))
+
+    def submit(self, state, measurements):
+        """Übergibt die Rohdaten eines Zustands an seine Bewerter (ein erneutes Spiel ersetzt den Auftrag)"""
+        self.pending[state] = self._pool().submit(run_scorers, list(self.scorers[state]), measurements)
+
+    def save(self, record, append):
+        """
+        Speichert record über append(record) mit den Ergebnissen der Sitzung, ohne zu warten. Sind
+        noch nicht alle Aufträge fertig, wird record ohne Ergebnisse gespeichert und eine Kopie mit
+        Ergebnissen angehängt, sobald der letzte fertig ist (aus einem Thread des Pools). Wird die
+        Sitzung vorher erneut gespeichert, entfällt diese Kopie, die neuere Fassung ersetzt sie
+        """
+        pending = dict(self.pending)
+        if not pending:
+            return append(record)
+        session_id = record.get("session_id")
+        with self.lock:
+            if all(future.done() for future in pending.values()):
+                self.follow_ups.pop(session_id, None)
+                return append(dict(record, shadow_scores=resolve(pending)))
+            result = append(record)
+            token = self.follow_ups[session_id] = object()
+
+        remaining = [len(pending)]
+        def done(_):
+            with self.lock:
+                remaining[0] -= 1
+                if remaining[0] or self.follow_ups.get(session_id) is not token:
+                    return
+                del self.follow_ups[session_id]
+                try:
+                    append(dict(record, shadow_scores=resolve(pending)))
+                except Exception:
+                    logger.exception("Ergebnisse der Schatten-Bewertung für %s nicht gespeichert", session_id)
+        for future in pending.values():
+            future.add_done_callback(done)
+        return result
+
+    def reset(self):
+        """Beginnt eine neue Sitzung"""
+        self.pending = {}
+
+    def close(self):
+        """
+        Beendet den Prozess-Pool, noch nicht begonnene Aufträge werden verworfen (als Fehler
+        gespeichert). Vor SessionWriter.close() aufrufen, damit ausstehende Ergebnisse noch
+        geschrieben werden
+        """
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shapes
+Speicher für die Formen aus Spiel 1 als parallele Arrays (Struct of Arrays). Freie Plätze werden
+wiederverwendet, Lebensdauer, Bewegung und Ablauf werden für alle Formen gemeinsam berechnet,
+ohne pro Frame neue Objekte anzulegen.
+"""
+
+# Bibliotheken importieren
+import numpy as np
+
+# Formtypen als kleine Ganzzahlen
+SHAPE_TYPES = ("circle", "rect", "triangle")
+CIRCLE, RECT, TRIANGLE = range(len(SHAPE_TYPES))
+
+class ShapePool:
+    """
+    Formen in parallelen Arrays. Jede Form belegt einen Platz (slot), freie Plätze liegen in
+    einer Freiliste. ids zählt die Formen in der Reihenfolge ihres Erscheinens
+    """
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.count = 0
+        self.next_id = 0
+        self.free = []
+        self.alive = np.zeros(0, dtype=bool)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.kinds = np.zeros(0, dtype=np.int8)
+        self.xs = np.zeros(0, dtype=np.float64)
+        self.ys = np.zeros(0, dtype=np.float64)
+        self.vxs = np.zeros(0, dtype=np.float64)      # Pixel pro Sekunde
+        self.vys = np.zeros(0, dtype=np.float64)
+        self.sizes = np.zeros(0, dtype=np.int32)
+        self.colors = np.zeros((0, 3), dtype=np.uint8)
+        self.lifespans = np.zeros(0, dtype=np.float64)  # Verbleibende Sekunden
+        self.flashes = np.zeros(0, dtype=np.float64)    # Verbleibende Sekunden Aufblitzen
+        self.spawn_times = np.zeros(0, dtype=np.int64)  # ms
+        self.shown_ns = np.zeros(0, dtype=np.int64)     # Erste Darstellung (perf_counter_ns, 0 = noch nicht)
+        self.shown_errors_ns = np.zeros(0, dtype=np.int64)
+        self.cells = np.zeros((0, 4), dtype=np.int32)   # Zellbereich im Raster
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity):
+        """Vergrössert alle Arrays auf capacity Plätze"""
+        old = self.capacity
+        for name in ("alive", "ids", "kinds", "xs", "ys", "vxs", "vys", "sizes", "colors",
+                     "lifespans", "flashes", "spawn_times", "shown_ns", "shown_errors_ns", "cells"):
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        # Freie Plätze so ablegen, dass die niedrigsten zuerst vergeben werden
+        self.free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def add(self, kind, x, y, size, color, lifespan, spawn_time, vx=0, vy=0):
+        """Legt eine Form an und gibt ihren Platz zurück"""
+        if not self.free:
+            self._grow(self.capacity * 2)
+        slot = self.free.pop()
+        self.alive[slot] = True
+        self.ids[slot] = self.next_id
+        self.next_id += 1
+        self.kinds[slot] = kind
+        self.xs[slot] = x
+        self.ys[slot] = y
+        self.vxs[slot] = vx
+        self.vys[slot] = vy
+        self.sizes[slot] = size
+        self.colors[slot] = color
+        self.lifespans[slot] = lifespan
+        self.flashes[slot] = 0
+        self.spawn_times[slot] = spawn_time
+        self.shown_ns[slot] = 0
+        self.shown_errors_ns[slot] = 0
+        self.count += 1
+        return slot
+
+    def remove(self, slot):
+        """Gibt den Platz einer Form frei"""
+        self.alive[slot] = False
+        self.free.append(slot)
+        self.count -= 1
+
+    def active(self):
+        """Plätze aller Formen in der Reihenfolge ihres Erscheinens"""
+        slots = np.flatnonzero(self.alive)
+        return slots[np.argsort(self.ids[slots], kind="stable")]
+
+    def age(self, dt):
+        """Verringert Lebensdauer und Aufblitzen aller Formen um dt"""
+        self.lifespans[self.alive] -= dt
+        flashing = self.alive & (self.flashes > 0)
+        self.flashes[flashing] -= dt
+
+    def move(self, dt, min_x, max_x, min_y, max_y):
+        """
+        Bewegt alle Formen mit Geschwindigkeit um dt. Formen, die den Bereich verlassen würden,
+        bleiben stehen und kehren ihre Richtung um. Gibt die Plätze der bewegten Formen zurück
+        """
+        moving = self.alive & ((self.vxs != 0) | (self.vys != 0))
+        new_xs = self.xs + self.vxs * dt
+        new_ys = self.ys + self.vys * dt
+        inside = (new_xs >= min_x) & (new_xs <= max_x) & (new_ys >= min_y) & (new_ys <= max_y)
+
+        moved = moving & inside
+        self.xs[moved] = new_xs[moved]
+        self.ys[moved] = new_ys[moved]
+
+        bounced = moving & ~inside
+        self.vxs[bounced] *= -1
+        self.vys[bounced] *= -1
+        return np.flatnonzero(moved)
+
+    def mark_shown(self, slots, presented_ns, error_ns):
+        """Merkt sich für noch nicht dargestellte Formen unter slots den Zeitpunkt der ersten Darstellung"""
+        new = slots[self.shown_ns[slots] == 0]
+        self.shown_ns[new] = presented_ns
+        self.shown_errors_ns[new] = error_ns
+
+    def expired(self):
+        """Plätze aller Formen, deren Lebensdauer abgelaufen ist"""
+        return np.flatnonzero(self.alive & (self.lifespans <= 0))
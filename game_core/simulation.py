@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Simulation
+Kopfloser Durchlauf des ganzen Spiels (MENU → GAME1 … GAME5 → RESULTS → BFI10 → BFI_RESULTS) mit
+Bots statt Spielern. Läuft mit SDL-Dummy-Treiber ohne Bildratenbegrenzung und misst Sitzungen pro
+Sekunde, Frame-Zeiten pro Zustand und den höchsten Speicherverbrauch. Die Spielzeit läuft in festen
+Schritten und alle Zufallsentscheidungen hängen nur vom Seed ab, sodass gleiche Seeds gleiche
+Ergebnisse liefern (Prüfsumme der Scores am Ende).
+
+Aufruf:  python -m game_core.simulation --sessions 5 --seed 1
+"""
+
+# Bibliotheken importieren
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Ohne Anzeige und Ton laufen (muss vor dem Import von pygame gesetzt sein)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from game_core.constants import *
+from game_core.shapes import CIRCLE
+from game_core.log import setup_logging
+
+try:
+    import resource     # Nicht auf Windows verfügbar
+except ImportError:
+    resource = None
+
+# Obergrenze an Frames pro Sitzung, damit ein hängender Bot den Lauf nicht blockiert
+MAX_FRAMES = 100000
+
+def click(pos, button=1):
+    """Ereignisse für einen Mausklick an pos"""
+    return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button)]
+
+def drag(start, end, steps=5):
+    """Ereignisse für Drücken bei start, Ziehen nach end und Loslassen"""
+    events = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=start, button=1)]
+    for i in range(1, steps + 1):
+        pos = (start[0] + (end[0] - start[0]) * i // steps, start[1] + (end[1] - start[1]) * i // steps)
+        events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(1, 0, 0)))
+    events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=end, button=1))
+    return events
+
+def key(code, text=""):
+    return [pygame.event.Event(pygame.KEYDOWN, key=code, unicode=text, mod=0)]
+
+class SessionBot:
+    """
+    Spielt eine Sitzung durch. act() liefert pro Frame die Ereignisse für den aktuellen Zustand,
+    Entscheidungen (Reaktionszeit, Antworten, Zeichnungen) kommen aus einem eigenen Zufallsgenerator
+    """
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.name = f"bot{seed}"
+        self.reaction_ms = self.random.randint(250, 700)
+        self.strokes_left = None
+
+    def act(self, game):
+        state = game.states[game.current_state]
+        return getattr(self, "act_" + game.current_state.lower())(game, state)
+
+    def act_menu(self, game, state):
+        if game.user_name != self.name:
+            return [event for char in self.name for event in key(ord(char), char)]
+        return key(pygame.K_RETURN, "\r")
+
+    def act_game1(self, game, state):
+        if state.state == "intro":
+            return key(pygame.K_SPACE, " ")
+        if state.state == "result":
+            return click(state.continue_button_rect.center) if hasattr(state, "continue_button_rect") else []
+
+        # Nach der Reaktionszeit auf die älteste Form klicken, meist auf einen Kreis
+        shapes = state.shapes
+        now = game.game_clock.now_ms()
+        for slot in shapes.active().tolist():
+            if now - shapes.spawn_times[slot] < self.reaction_ms:
+                continue
+            if shapes.kinds[slot] == CIRCLE or self.random.random() < 0.1:
+                self.reaction_ms = self.random.randint(250, 700)
+                return click((int(shapes.xs[slot]), int(shapes.ys[slot])))
+        return []
+
+    def act_game2(self, game, state):
+        if state.state == "intro":
+            return key(pygame.K_SPACE, " ")
+        if state.state == "question" and hasattr(state, "continue_button_rect"):
+            return self.slide(state.slider, state.slider["position"]) + click(state.continue_button_rect.center)
+        if state.state == "result":
+            return click(state.continue_button_rect.center)
+        return []
+
+    def act_game3(self, game, state):
+        if state.state == "intro":
+            return click(state.start_button_rect.center) if hasattr(state, "start_button_rect") else []
+        if state.state == "result":
+            return click(state.continue_button_rect.center) if hasattr(state, "continue_button_rect") else []
+        if not hasattr(state, "submit_button_rect"):
+            return []
+
+        if self.strokes_left is None:
+            self.strokes_left = self.random.randint(3, 8)
+        if self.strokes_left == 0:
+            self.strokes_left = None
+            return click(state.submit_button_rect.center)
+        self.strokes_left -= 1
+
+        # Gelegentlich die Farbe wechseln, dann einen Strich auf dem Canvas ziehen
+        events = []
+        if self.random.random() < 0.3:
+            events += click(self.random.choice(state.color_rects).center)
+        left = (SCREEN_WIDTH - 600) // 2
+        points = [(self.random.randint(left + 10, left + 590), self.random.randint(160, 440)) for _ in range(2)]
+        return events + drag(points[0], points[1], steps=self.random.randint(5, 30))
+
+    def act_game4(self, game, state):
+        if state.state == "instruction":
+            return click(state.start_button_rect.center) if hasattr(state, "start_button_rect") else []
+        if state.state == "result":
+            return click(state.continue_button_rect.center) if hasattr(state, "continue_button_rect") else []
+
+        # Nächste offene Aufgabe in einen zufälligen Container ziehen
+        for task in state.tasks:
+            if task["container"] is None:
+                start = (task["pos"][0] + task["size"][0] // 2, task["pos"][1] + task["size"][1] // 2)
+                return drag(start, self.random.choice(state.containers)["rect"].center)
+        return []
+
+    def act_game5(self, game, state):
+        if state.state == "instruction":
+            return click(state.start_button_rect.center) if hasattr(state, "start_button_rect") else []
+        if state.state == "play" and hasattr(state, "continue_button_rect"):
+            return self.slide(state.slider, state.slider_position) + click(state.continue_button_rect.center)
+        if state.state == "result":
+            return click(state.continue_button_rect.center)
+        return []
+
+    def act_results(self, game, state):
+        if state.current_page == "page1":
+            return click(state.next_page_button_rect.center)
+        return click(state.validate_button_rect.center)
+
+    def act_bfi10(self, game, state):
+        if not state.likert_buttons or state.next_button_rect is None:
+            return []
+        if state.answers[state.current_question] is None:
+            return click(self.random.choice(state.likert_buttons).center)
+        return click(state.next_button_rect.center)
+
+    def act_bfi_results(self, game, state):
+        return click(state.back_button.center) if state.back_button else []
+
+    def slide(self, slider, position):
+        """Zieht einen Schieberegler vom Knopf an eine zufällige Position"""
+        start_x = slider["x"] - slider["width"] // 2
+        knob = (start_x + slider["width"] * position // 100, slider["y"])
+        target = (start_x + slider["width"] * self.random.randint(0, 100) // 100, slider["y"])
+        return drag(knob, target)
+
+def run_session(seed, step, data_dir, frame_times):
+    """
+    Spielt eine Sitzung mit einem neuen Game-Objekt durch und gibt ihre Scores zurück.
+    Frame-Zeiten (Sekunden) werden pro Zustand in frame_times gesammelt
+    """
+    from game_core.game import Game
+
+    random.seed(seed)
+    game = Game()
+    game.game_clock.fixed_step = step
+    game.data_dir = data_dir
+    bot = SessionBot(seed)
+
+    visited_results = False
+    for _ in range(MAX_FRAMES):
+        state_name = game.current_state
+        for event in bot.act(game):
+            pygame.event.post(event)
+
+        # Ohne Warten abholen und verarbeiten (keine Bildratenbegrenzung)
+        start = time.perf_counter()
+        game.input.sample()
+        game.process_frame(game.input.drain())
+        frame_times.setdefault(state_name, []).append(time.perf_counter() - start)
+
+        visited_results = visited_results or game.current_state == "BFI_RESULTS"
+        if visited_results and game.current_state == "MENU":
+            # Warten, bis die Dateien der Sitzung geschrieben sind
+            game.shadow.close()
+            game.writer.close()
+            return {
+                "seed": seed,
+                "personality_traits": dict(game.personality_traits),
+                "bfi_scores": dict(game.bfi_scores)
+            }
+    game.shadow.close()
+    game.writer.close()
+    raise RuntimeError(f"Sitzung {seed} nach {MAX_FRAMES} Frames nicht beendet (Zustand {game.current_state})")
+
+def peak_memory_mb():
+    """Höchster Speicherverbrauch des Prozesses in MB (None, wenn nicht messbar)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet Kilobyte, macOS Byte
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_benchmark(sessions=3, seed=1, step=1 / FPS, data_dir=None, verbose=False):
+    """Spielt mehrere Sitzungen durch und gibt die Messwerte als Dictionary zurück"""
+    pygame.init()
+    # Protokoll wie im Spiel erzeugen, aber nur mit --verbose anzeigen
+    setup_logging(level="DEBUG" if verbose else LOG_LEVEL, filename=None if verbose else os.devnull)
+    frame_times = {}
+    results = []
+
+    with contextlib.ExitStack() as stack:
+        if data_dir is None:
+            data_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        start = time.perf_counter()
+        for i in range(sessions):
+            results.append(run_session(seed + i, step, data_dir, frame_times))
+        elapsed = time.perf_counter() - start
+
+    states = {}
+    for state_name, times in frame_times.items():
+        ms = np.array(times) * 1000
+        states[state_name] = {
+            "frames": len(ms),
+            "p50_ms": float(np.percentile(ms, 50)),
+            "p95_ms": float(np.percentile(ms, 95)),
+            "p99_ms": float(np.percentile(ms, 99)),
+            "max_ms": float(ms.max())
+        }
+
+    scores = json.dumps(results, sort_keys=True)
+    return {
+        "sessions": sessions,
+        "seconds": elapsed,
+        "sessions_per_second": sessions / elapsed,
+        "peak_memory_mb": peak_memory_mb(),
+        "states": states,
+        "score_digest": hashlib.sha256(scores.encode("utf-8")).hexdigest()[:16],
+        "results": results
+    }
+
+def print_report(report):
+    print(f"{report['sessions']} Sitzungen in {report['seconds']:.1f} s "
+          f"({report['sessions_per_second']:.3f} Sitzungen/s)")
+    if report["peak_memory_mb"] is not None:
+        print(f"Speicher (Höchstwert): {report['peak_memory_mb']:.1f} MB")
+    print(f"{'Zustand':<12} {'Frames':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for state_name, stats in report["states"].items():
+        print(f"{state_name:<12} {stats['frames']:>8} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+              f"{stats['p99_ms']:>8.2f} {stats['max_ms']:>8.2f}")
+    print(f"Prüfsumme der Scores: {report['score_digest']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kopfloser Benchmark des ganzen Spielablaufs mit Bots")
+    parser.add_argument("--sessions", type=int, default=3, help="Anzahl Sitzungen")
+    parser.add_argument("--seed", type=int, default=1, help="Seed der ersten Sitzung")
+    parser.add_argument("--step", type=float, default=1 / FPS, help="Feste Schrittweite der Spielzeit in Sekunden")
+    parser.add_argument("--data-dir", help="Verzeichnis für die gespeicherten Sitzungen (Standard: temporär)")
+    parser.add_argument("--json", help="Messwerte zusätzlich als JSON-Datei speichern")
+    parser.add_argument("--expect", help="Erwartete Prüfsumme, bei Abweichung Exit-Code 1")
+    parser.add_argument("--verbose", action="store_true", help="Protokoll der Zustände (inkl. Debug) anzeigen")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.sessions, args.seed, args.step, args.data_dir, args.verbose)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=4)
+    if args.expect and args.expect != report["score_digest"]:
+        print(f"Prüfsumme weicht ab (erwartet {args.expect})")
+        sys.exit(1)
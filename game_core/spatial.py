@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Spatial
+Gleichmässiges Raster über einer Spielfläche. Objekte werden in alle Zellen eingetragen, die ihr
+umgebendes Quadrat berührt, sodass für einen Klick nur die Objekte einer einzigen Zelle geprüft
+werden müssen.
+"""
+
+# Bibliotheken importieren
+import numpy as np
+
+class SpatialGrid:
+    """
+    Raster mit Zellen der Grösse cell_size über dem Bereich (x, y, width, height).
+    Objekte werden über eine eindeutige Kennung verwaltet und als Kreis/Quadrat
+    um ihren Mittelpunkt mit halber Kantenlänge extent eingetragen
+    """
+    def __init__(self, x, y, width, height, cell_size=80):
+        self.x = x
+        self.y = y
+        self.cell_size = cell_size
+        self.columns = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        self.cells = {}     # (Spalte, Zeile) -> {Kennung: Objekt}
+        self.ranges = {}    # Kennung -> (Spalte min, Zeile min, Spalte max, Zeile max)
+
+    def _cell(self, px, py):
+        """Zelle eines Punkts, Punkte ausserhalb werden auf den Rand geklemmt"""
+        column = min(self.columns - 1, max(0, int((px - self.x) // self.cell_size)))
+        row = min(self.rows - 1, max(0, int((py - self.y) // self.cell_size)))
+        return column, row
+
+    def _range(self, pos, extent):
+        left, top = self._cell(pos[0] - extent, pos[1] - extent)
+        right, bottom = self._cell(pos[0] + extent, pos[1] + extent)
+        return left, top, right, bottom
+
+    def cell_ranges(self, xs, ys, extents):
+        """
+        Zellbereiche für viele Objekte auf einmal (NumPy-Arrays), eine Zeile
+        (Spalte min, Zeile min, Spalte max, Zeile max) pro Objekt
+        """
+        def to_cells(values, origin, count):
+            return np.clip((values - origin) // self.cell_size, 0, count - 1).astype(np.int32)
+
+        return np.stack([to_cells(xs - extents, self.x, self.columns),
+                         to_cells(ys - extents, self.y, self.rows),
+                         to_cells(xs + extents, self.x, self.columns),
+                         to_cells(ys + extents, self.y, self.rows)], axis=1)
+
+    def insert(self, key, item, pos, extent):
+        """Trägt ein Objekt in alle Zellen ein, die sein Quadrat berührt"""
+        cell_range = self._range(pos, extent)
+        self.ranges[key] = cell_range
+        left, top, right, bottom = cell_range
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                self.cells.setdefault((column, row), {})[key] = item
+
+    def remove(self, key):
+        """Entfernt ein Objekt aus allen Zellen"""
+        left, top, right, bottom = self.ranges.pop(key)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                del self.cells[(column, row)][key]
+
+    def move(self, key, item, pos, extent):
+        """Aktualisiert die Zellen eines bewegten Objekts (nur wenn sich die Zellen ändern)"""
+        if self.ranges.get(key) != self._range(pos, extent):
+            self.remove(key)
+            self.insert(key, item, pos, extent)
+
+    def query(self, px, py):
+        """Gibt die Objekte der Zelle zurück, in der der Punkt liegt ({Kennung: Objekt})"""
+        return self.cells.get(self._cell(px, py), {})
+
+    def clear(self):
+        self.cells.clear()
+        self.ranges.clear()
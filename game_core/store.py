@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Store
+Sitzungsspeicher aus Segmenten im JSON-Lines-Format: eine Zeile pro gespeicherter Sitzung. Statt
+einer Datei pro Sitzung wird nur an das aktuelle Segment angehängt, ein Segment gehört zu einem
+Tag und wird bei SESSION_SEGMENT_BYTES gewechselt:
+
+    data/sessions/20250421_000.jsonl, 20250421_001.jsonl, ...
+    data/sessions/index.jsonl   (session_id, user_name, timestamp, segment, offset, length)
+
+Die Sitzungen eines Tages lassen sich so am Stück lesen (sessions()), einzelne Sitzungen über den
+Index finden (find()/load()). Eine Sitzung kann mehrmals gespeichert werden (Ergebnisse, Rückkehr
+ins Menü), gültig ist der letzte Eintrag mit derselben session_id, also der mit dem grössten
+(Segment, Offset). find() und sessions() liefern standardmässig nur diese Einträge (latest=True),
+Leser, die Segmente selbst lesen, prüfen mit latest_locations() und is_latest().
+
+Geschrieben wird nur vom Hintergrund-Thread (game_core/persistence.py), mehrere Sitzungen pro
+Schreibvorgang. Segment und Index werden erst nach fsync ergänzt, eine nach einem Absturz
+abgeschnittene letzte Zeile wird beim nächsten Öffnen entfernt.
+
+Sitzungen eines Tages ausgeben:  python -m game_core.store data/sessions 20250421
+"""
+
+# Bibliotheken importieren
+import json
+import os
+import re
+import sys
+from game_core.constants import SESSION_SEGMENT_BYTES
+from game_core.persistence import write_atomic
+
+# Dateiname eines Segments: Tag und laufende Nummer
+SEGMENT_PATTERN = re.compile(r"^(\d{8})_(\d{3})\.jsonl$")
+INDEX_FILE = "index.jsonl"
+
+def _open_append(path):
+    """Öffnet eine Datei zum Anhängen und entfernt vorher eine unvollständige letzte Zeile"""
+    if os.path.exists(path):
+        with open(path, "r+b") as f:
+            end = pos = f.seek(0, os.SEEK_END)
+            while pos > 0:
+                start = max(0, pos - 65536)
+                f.seek(start)
+                chunk = f.read(pos - start)
+                if pos == end and chunk.endswith(b"\n"):
+                    break
+                newline = chunk.rfind(b"\n")
+                if newline >= 0:
+                    f.truncate(start + newline + 1)
+                    break
+                pos = start
+            else:
+                f.truncate(0)
+    return open(path, "ab")
+
+def _index_entry(record, segment, offset, length):
+    """Index-Eintrag einer Sitzung: Benutzer, Zeitpunkt und Lage im Segment"""
+    return {
+        "session_id": record.get("session_id"),
+        "user_name": record.get("user_name"),
+        "timestamp": record["timestamp"],
+        "segment": segment,
+        "offset": offset,
+        "length": length
+    }
+
+def is_latest(latest, session_id, segment, offset):
+    """
+    Ob der Eintrag an (segment, offset) die letzte Fassung seiner Sitzung ist. latest stammt aus
+    latest_locations(); fehlt die Sitzung dort (Index noch nicht ergänzt), gilt der Eintrag als aktuell
+    """
+    return session_id is None or latest.get(session_id, (segment, offset)) <= (segment, offset)
+
+def _read_lines(path):
+    """Liest eine JSON-Lines-Datei, unvollständige Zeilen werden übersprungen"""
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+class SessionStore:
+    """
+    Segmentierter Sitzungsspeicher in directory. append() hängt mehrere Sitzungen mit einem
+    Schreibvorgang an, die Lesefunktionen können parallel aus einem anderen Prozess laufen
+    """
+    def __init__(self, directory, segment_bytes=SESSION_SEGMENT_BYTES):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment = None         # Aktuelles Segment (Dateiname)
+        self.segment_size = 0
+
+    def segments(self, day=None):
+        """Dateinamen aller Segmente (eines Tages), in Schreibreihenfolge"""
+        if not os.path.isdir(self.directory):
+            return []
+        names = [name for name in os.listdir(self.directory) if SEGMENT_PATTERN.match(name)]
+        if day is not None:
+            names = [name for name in names if name.startswith(f"{day}_")]
+        return sorted(names)
+
+    def _segment_for(self, day, size):
+        """Segment, an das size Bytes vom Tag day angehängt werden"""
+        if self.segment is None or not self.segment.startswith(f"{day}_"):
+            existing = self.segments(day)
+            self.segment = existing[-1] if existing else f"{day}_000.jsonl"
+            path = os.path.join(self.directory, self.segment)
+            self.segment_size = os.path.getsize(path) if os.path.exists(path) else 0
+        if self.segment_size and self.segment_size + size > self.segment_bytes:
+            number = int(SEGMENT_PATTERN.match(self.segment).group(2)) + 1
+            self.segment = f"{day}_{number:03d}.jsonl"
+            self.segment_size = 0
+        return self.segment
+
+    def append(self, records):
+        """
+        Hängt Sitzungen (Dictionaries mit session_id, user_name und timestamp im Format
+        JJJJMMTT_HHMMSS) an und gibt ihre Index-Einträge zurück
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        lines = [(json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8") for record in records]
+
+        # Nach Segment gruppieren, damit jedes Segment nur einmal geöffnet wird
+        batches = {}
+        for record, line in zip(records, lines):
+            segment = self._segment_for(record["timestamp"][:8], len(line))
+            self.segment_size += len(line)
+            batches.setdefault(segment, []).append((record, line))
+
+        entries = []
+        for segment, batch in batches.items():
+            with _open_append(os.path.join(self.directory, segment)) as f:
+                offset = f.tell()
+                for record, line in batch:
+                    entries.append(_index_entry(record, segment, offset, len(line)))
+                    offset += len(line)
+                f.write(b"".join(line for _, line in batch))
+                f.flush()
+                os.fsync(f.fileno())
+            self.segment_size = offset
+
+        # Index erst ergänzen, wenn die Sitzungen sicher geschrieben sind
+        with _open_append(os.path.join(self.directory, INDEX_FILE)) as f:
+            f.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        return entries
+
+    def index_entries(self):
+        """Alle Index-Einträge in Schreibreihenfolge, sequentiell gelesen"""
+        path = os.path.join(self.directory, INDEX_FILE)
+        return _read_lines(path) if os.path.exists(path) else []
+
+    def latest_locations(self):
+        """Lage des letzten Eintrags jeder Sitzung laut Index: {session_id: (Segment, Offset)}"""
+        return self.index_summary()[0]
+
+    def index_summary(self):
+        """
+        Lage des letzten Eintrags jeder Sitzung (siehe latest_locations()) und pro Segment das Ende
+        des letzten indexierten Eintrags: Leser, die nur bis dorthin lesen, kennen für jede gelesene
+        Sitzung ihre letzte Fassung
+        """
+        latest = {}
+        ends = {}
+        for entry in self.index_entries():
+            location = (entry["segment"], entry["offset"])
+            if latest.get(entry["session_id"], location) <= location:
+                latest[entry["session_id"]] = location
+            ends[entry["segment"]] = max(ends.get(entry["segment"], 0), entry["offset"] + entry["length"])
+        return latest, ends
+
+    def find(self, user_name=None, start=None, end=None, latest=True):
+        """
+        Index-Einträge eines Benutzers und/oder Zeitraums (start <= timestamp < end). Mit latest
+        nur der letzte Eintrag jeder Sitzung (eine ersetzte Fassung zählt auch im Zeitraum nicht)
+        """
+        entries = list(self.index_entries())
+        if latest:
+            locations = self.latest_locations()
+            entries = [entry for entry in entries
+                       if is_latest(locations, entry["session_id"], entry["segment"], entry["offset"])]
+        return [entry for entry in entries
+                if (user_name is None or entry["user_name"] == user_name)
+                and (start is None or entry["timestamp"] >= start)
+                and (end is None or entry["timestamp"] < end)]
+
+    def load(self, entry):
+        """Liest die Sitzung eines Index-Eintrags"""
+        with open(os.path.join(self.directory, entry["segment"]), "rb") as f:
+            f.seek(entry["offset"])
+            return json.loads(f.read(entry["length"]))
+
+    def records(self, segment, latest=None):
+        """
+        Alle Sitzungen eines Segments in Schreibreihenfolge. Mit latest (aus latest_locations())
+        nur die letzte Fassung jeder Sitzung
+        """
+        with open(os.path.join(self.directory, segment), "rb") as f:
+            offset = 0
+            for line in f:
+                position, offset = offset, offset + len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if latest is None or is_latest(latest, record.get("session_id"), segment, position):
+                    yield record
+
+    def sessions(self, day, latest=True):
+        """
+        Alle Sitzungen eines Tages (JJJJMMTT) in Schreibreihenfolge, sequentiell gelesen. Mit latest
+        nur die letzte Fassung jeder Sitzung; sie zählt zum Tag, an dem sie gespeichert wurde
+        """
+        locations = self.latest_locations() if latest else None
+        for segment in self.segments(day):
+            yield from self.records(segment, locations)
+
+    def rebuild_index(self):
+        """Baut den Index aus den Segmenten neu auf (z.B. nach Verlust der Index-Datei)"""
+        entries = []
+        for segment in self.segments():
+            with open(os.path.join(self.directory, segment), "rb") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    entries.append(_index_entry(record, segment, offset, len(line)))
+                    offset += len(line)
+        write_atomic(os.path.join(self.directory, INDEX_FILE),
+                     lambda f: f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+        return len(entries)
+
+if __name__ == "__main__":
+    # Sitzungen eines Tages ausgeben: python -m game_core.store <verzeichnis> <JJJJMMTT>
+    store = SessionStore(sys.argv[1])
+    for session in store.sessions(sys.argv[2]):
+        print(f"{session['timestamp']} {session['user_name']}: {session['personality_traits']}")
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Strokes
+Aufzeichnung und Wiedergabe der Zeichnungen aus Spiel 3. Jede Zeichnung wird als kompaktes
+Strich-Protokoll (Zeitpunkte, Punkte, Farbe, Strichbreite) in Arrays gehalten und als Binärformat
+mit der Sitzung gespeichert. Daraus lässt sich das Canvas ohne GUI wieder aufbauen und die
+Bewertung offline neu berechnen.
+
+Metriken gespeicherter Sitzungen ausgeben:  python -m game_core.strokes data/sessions/<segment>.jsonl
+"""
+
+# Bibliotheken importieren
+import base64
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+import numpy as np
+import pygame
+from game_core.store import SessionStore
+
+# Kopf eines Strich-Protokolls: Kennung, Version, Canvas-Breite, Canvas-Höhe, Anzahl Punkte, Anzahl Striche
+LOG_MAGIC = b"PCS1"
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct("<4sBHHII")
+
+class StrokeCoverage:
+    """
+    Abdeckungskarte der bemalten Pixel. Wird pro Liniensegment aktualisiert, sodass die
+    Flächennutzung jederzeit ohne Scan über das Canvas bekannt ist
+    """
+    def __init__(self, width, height):
+        self.map = np.zeros((width, height), dtype=bool)   # Bemalte Pixel
+        self.cells = np.zeros((3, 3), dtype=bool)          # 3x3-Raster für die räumliche Verteilung
+        self.covered_pixels = 0
+        self.used_colors = set()
+
+    @property
+    def coverage(self):
+        """Anteil der bemalten Pixel am Canvas (0-1)"""
+        return self.covered_pixels / self.map.size
+
+    @property
+    def spread(self):
+        """Anteil der Rasterfelder, in denen gezeichnet wurde (0-1)"""
+        return int(np.count_nonzero(self.cells)) / 9
+
+    def mark_segment(self, start, end, color, stroke_width):
+        """
+        Trägt ein gezeichnetes Liniensegment ein.
+        Wie bei pygame.draw.line wird pro Schritt entlang der Hauptachse ein Querstreifen in
+        Strichbreite markiert, der Aufwand hängt also nur von der Segmentlänge ab und nicht
+        von der Canvas-Grösse
+        """
+        width, height = self.map.shape
+        low = stroke_width // 2
+        high = stroke_width - low
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        steps = max(abs(dx), abs(dy), 1)
+        horizontal = abs(dx) >= abs(dy)
+
+        for i in range(steps + 1):
+            x = start[0] + round(dx * i / steps)
+            y = start[1] + round(dy * i / steps)
+            if not (0 <= x < width and 0 <= y < height):
+                continue
+
+            # Flache Linien werden vertikal verbreitert, steile horizontal
+            if horizontal:
+                brush = self.map[x, max(0, y - low):y + high]
+            else:
+                brush = self.map[max(0, x - low):x + high, y]
+            self.covered_pixels += brush.size - int(np.count_nonzero(brush))
+            brush[...] = True
+            self.cells[x * 3 // width, y * 3 // height] = True
+
+        self.used_colors.add(tuple(color))
+
+class StrokeLog:
+    """
+    Strich-Protokoll einer Zeichnung. Punkte liegen spaltenweise in Arrays,
+    jeder Strich verweist auf den Index seines ersten Punkts
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        # Punkte
+        self.times = array("I")     # Millisekunden seit Beginn der Aufgabe
+        self.xs = array("h")
+        self.ys = array("h")
+        # Striche
+        self.starts = array("I")    # Index des ersten Punkts
+        self.colors = array("I")    # Farbe als 0xRRGGBB
+        self.widths = array("B")
+
+    def __len__(self):
+        return len(self.starts)
+
+    def begin_stroke(self, pos, color, stroke_width, time_ms):
+        """Beginnt einen neuen Strich an pos"""
+        self.starts.append(len(self.times))
+        self.colors.append((color[0] << 16) | (color[1] << 8) | color[2])
+        self.widths.append(stroke_width)
+        self.add_point(pos, time_ms)
+
+    def add_point(self, pos, time_ms):
+        """Hängt einen Punkt an den aktuellen Strich an"""
+        self.times.append(max(0, int(time_ms)))
+        self.xs.append(pos[0])
+        self.ys.append(pos[1])
+
+    def strokes(self):
+        """Liefert pro Strich (Farbe, Breite, [(x, y, t), ...])"""
+        ends = list(self.starts[1:]) + [len(self.times)]
+        for start, end, color, stroke_width in zip(self.starts, ends, self.colors, self.widths):
+            rgb = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+            points = list(zip(self.xs[start:end], self.ys[start:end], self.times[start:end]))
+            yield rgb, stroke_width, points
+
+    def to_bytes(self):
+        """Serialisiert das Protokoll (Little Endian, zlib-komprimiert)"""
+        header = LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, self.width, self.height, len(self.times), len(self.starts))
+        columns = [self.times, self.xs, self.ys, self.starts, self.colors, self.widths]
+        if sys.byteorder == "big":
+            columns = [array(column.typecode, column) for column in columns]
+            for column in columns:
+                column.byteswap()
+        return header + zlib.compress(b"".join(column.tobytes() for column in columns))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Liest ein mit to_bytes erzeugtes Protokoll wieder ein"""
+        magic, version, width, height, point_count, stroke_count = LOG_HEADER.unpack_from(data)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError("Unbekanntes Format für Strich-Protokoll")
+
+        log = cls(width, height)
+        payload = memoryview(zlib.decompress(data[LOG_HEADER.size:]))
+        offset = 0
+        for column, count in ((log.times, point_count), (log.xs, point_count), (log.ys, point_count),
+                              (log.starts, stroke_count), (log.colors, stroke_count), (log.widths, stroke_count)):
+            size = count * column.itemsize
+            column.frombytes(payload[offset:offset + size])
+            if sys.byteorder == "big":
+                column.byteswap()
+            offset += size
+        return log
+
+    def to_text(self):
+        """Serialisiert das Protokoll als Base64-Text (für JSON)"""
+        return base64.b64encode(self.to_bytes()).decode("ascii")
+
+    @classmethod
+    def from_text(cls, text):
+        return cls.from_bytes(base64.b64decode(text))
+
+def replay(log, canvas=None):
+    """
+    Spielt ein Strich-Protokoll ab und zeichnet es auf canvas (ohne Anzeige möglich).
+    Gibt das Canvas und die dabei aufgebaute Abdeckungskarte zurück
+    """
+    if canvas is None:
+        canvas = pygame.Surface((log.width, log.height))
+        canvas.fill((255, 255, 255))
+    coverage = StrokeCoverage(log.width, log.height)
+
+    for color, stroke_width, points in log.strokes():
+        for (x0, y0, _), (x1, y1, _) in zip(points, points[1:]):
+            pygame.draw.line(canvas, color, (x0, y0), (x1, y1), stroke_width)
+            coverage.mark_segment((x0, y0), (x1, y1), color, stroke_width)
+    return canvas, coverage
+
+def drawing_metrics(log):
+    """Berechnet die Kennzahlen einer Zeichnung aus ihrem Strich-Protokoll"""
+    _, coverage = replay(log)
+    duration = max(log.times) if log.times else 0
+    return {
+        "strokes": len(log),
+        "points": len(log.times),
+        "coverage": coverage.coverage,
+        "colors_used": len(coverage.used_colors),
+        "spread": coverage.spread,
+        "duration_ms": duration
+    }
+
+if __name__ == "__main__":
+    # Metriken aller Zeichnungen der angegebenen Segmente (oder älteren Sitzungsdateien) ausgeben,
+    # aus Segmenten nur die letzte Fassung jeder Sitzung
+    for path in sys.argv[1:]:
+        if path.endswith(".jsonl"):
+            store = SessionStore(os.path.dirname(path) or ".")
+            sessions = store.records(os.path.basename(path), store.latest_locations())
+        else:
+            with open(path, encoding="utf-8") as f:
+                sessions = [json.load(f)]
+        for session in sessions:
+            for drawing in session.get("game3_drawings", []):
+                metrics = drawing_metrics(StrokeLog.from_text(drawing["strokes"]))
+                print(f"{session.get('user_name')} {session.get('timestamp')} Aufgabe {drawing['task']} ({drawing['stimulus']}): {metrics}")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Text
+Zwischenspeicher für gerenderte Texte. Gleichbleibende Texte (Titel, Anweisungen, Button-Beschriftungen)
+werden nur einmal gerastert und danach aus dem Cache geblittet. Mehrzeilige Texte werden einmal
+umgebrochen und als fertige Zeilen-Surfaces zwischengespeichert.
+"""
+
+# Bibliotheken importieren
+from collections import OrderedDict
+
+def wrap_words(text, font, max_width):
+    """Bricht Text wortweise um, sodass jede Zeile höchstens max_width Pixel breit ist"""
+    lines = []
+    current_line = ""
+    for word in text.split():
+        test_line = f"{current_line} {word}" if current_line else word
+        if font.size(test_line)[0] <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+    return lines
+
+def wrap_balanced(text, font, max_width, min_words=3):
+    """
+    Bricht Text um und stellt sicher, dass jede Zeile mind. min_words Wörter hat
+    (kurze Texte werden immer auf 2 Zeilen verteilt)
+    """
+    words = text.split()
+    if not words:
+        return [""]
+
+    # Kurze Texte: erste Zeile mit min_words Wörtern, Rest in die zweite Zeile
+    if len(words) <= 2 * min_words:
+        mid = min_words if len(words) >= min_words else len(words) // 2
+        return [" ".join(words[:mid]), " ".join(words[mid:])]
+
+    lines = []
+    current_line = []
+    for word in words:
+        test_text = " ".join(current_line + [word])
+        # Neue Zeile erst beginnen, wenn die aktuelle schon genug Wörter hat
+        if font.size(test_text)[0] > max_width and len(current_line) >= min_words:
+            lines.append(" ".join(current_line))
+            current_line = [word]
+        else:
+            current_line.append(word)
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    # Nur eine Zeile: aufteilen, damit mindestens 2 Zeilen entstehen
+    if len(lines) == 1:
+        mid = max(len(words) // 2, min_words)
+        lines = [" ".join(words[:mid]), " ".join(words[mid:])]
+    return lines
+
+class TextLayout:
+    """Umgebrochener Textblock aus fertig gerenderten Zeilen"""
+    def __init__(self, lines, surfaces, line_height):
+        self.lines = lines
+        self.surfaces = surfaces
+        self.line_height = line_height
+        self.height = len(surfaces) * line_height
+        self.width = max((surface.get_width() for surface in surfaces), default=0)
+
+    def draw(self, screen, x, y, center_x=None):
+        """Zeichnet alle Zeilen ab (x, y) bzw. horizontal zentriert um center_x und gibt die Y-Position unter dem Block zurück"""
+        for i, surface in enumerate(self.surfaces):
+            line_x = x if center_x is None else center_x - surface.get_width() // 2
+            screen.blit(surface, (line_x, y + i * self.line_height))
+        return y + self.height
+
+class TextCache:
+    """
+    LRU-Cache für Text-Surfaces mit dem Schlüssel (Schriftart, Text, Antialiasing, Farbe)
+    """
+    def __init__(self, max_entries=512, max_layouts=128):
+        self.max_entries = max_entries
+        self.max_layouts = max_layouts
+        self.entries = OrderedDict()
+        self.layouts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Gibt die Surface für den Text zurück und rendert ihn nur, wenn er noch nicht im Cache ist"""
+        key = (font, text, antialias, tuple(color))
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+
+        # Am längsten nicht verwendeten Eintrag entfernen
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def layout(self, font, text, color, max_width, line_height=None, wrap=wrap_words):
+        """Gibt den umgebrochenen Textblock zurück und bricht den Text nur beim ersten Aufruf um"""
+        if line_height is None:
+            line_height = font.get_linesize()
+        key = (font, text, tuple(color), max_width, line_height, wrap)
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.layouts.move_to_end(key)
+            return layout
+
+        lines = wrap(text, font, max_width)
+        surfaces = [self.render(font, line, True, color) for line in lines]
+        layout = TextLayout(lines, surfaces, line_height)
+        self.layouts[key] = layout
+
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return layout
+
+    def clear(self):
+        """Leert den Cache (z.B. nach dem Neuladen der Schriftarten)"""
+        self.entries.clear()
+        self.layouts.clear()
@@ -9,11 +9,14 @@ Sammlung von Hilfsfunktionen zur Auswertung und Visualisierung des Persona Compa
 import pygame
 import random
 import math
-import json
 import csv
-import os
 import datetime
+import numpy as np
 from game_core.constants import *
+from game_core import scoring
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 # =============================================================================
 # Persönlichkeitsbeschreibung auf Basis eines Traits und Scores
@@ -172,136 +175,191 @@ def get_personality_description(trait, score):
 # Bestimmung des Persona-Typs und Begleiters
 # =============================================================================
 
-def determine_persona_type(personality_traits):
-    """
-    Bestimmt den Persona-Typ basierend auf den Persönlichkeitsmerkmalen
-    
-    Args:
-        personality_traits (dict): Die Persönlichkeitsmerkmale mit Scores
-        
-    Returns:
-        tuple: (persona_name, persona_desc, persona_profile, persona_needs, persona_challenges,
-                companion_type, companion_desc, companion_color)
-    """
-    #  Klassifizierung der Score-Werte in Kategorien
-    trait_categories = {}
-    for trait, score in personality_traits.items():
-        if score > 75:
-            trait_categories[trait] = "high"
-        elif score > 50:
-            trait_categories[trait] = "medium_high"
-        elif score > 25:
-            trait_categories[trait] = "medium_low"
-        else:
-            trait_categories[trait] = "low"
-    
-    # Definition der fünf Personas mit den zugehörigen Persönlichkeitsprofilen und erweiterten Informationen
-    personas = {
-        "Strukturorientierter Planer": {
-            "profile": {
-                "conscientiousness": ["high", "medium_high"],
-                "agreeableness": ["medium_high", "medium_low"],
-                "extraversion": ["medium_low", "low"],
-                "openness": ["medium_high", "medium_low"],
-                "neuroticism": ["medium_low", "low"]
-            },
-            "description": "Du bist strukturiert, planst sorgfältig und bevorzugst klare Strukturen.",
-            "persona_profile": "Hohe Gewissenhaftigkeit, moderate Verträglichkeit, niedrige Extraversion, moderate Offenheit und geringe Neurotizismus. Du planst sorgfältig, bist bestimmt in deinen Bedürfnissen und bevorzugst bedeutungsvolle Interaktionen.",
-            "persona_needs": "Du benötigst Struktur, Transparenz und regelmässiges Feedback zu deinen Fortschritten.",
-            "persona_challenges": "Bei Unterbrechung deiner Routinen oder fehlender Struktur kann dein Perfektionismus zu Frustration führen.",
-            "companion": {
-                "type": "Der Architektonische Turm",
-                "description": "Ein modularer, aufsteigender Turm mit präzise angeordneten geometrischen Elementen, der mit jedem Therapieerfolg neue Stockwerke und Strukturen entwickelt.",
-                "color": DARK_BLUE
-            }
+# Definition der fünf Personas mit den zugehörigen Persönlichkeitsprofilen und erweiterten Informationen
+PERSONAS = {
+    "Strukturorientierter Planer": {
+        "profile": {
+            "conscientiousness": ["high", "medium_high"],
+            "agreeableness": ["medium_high", "medium_low"],
+            "extraversion": ["medium_low", "low"],
+            "openness": ["medium_high", "medium_low"],
+            "neuroticism": ["medium_low", "low"]
+        },
+        "description": "Du bist strukturiert, planst sorgfältig und bevorzugst klare Strukturen.",
+        "persona_profile": "Hohe Gewissenhaftigkeit, moderate Verträglichkeit, niedrige Extraversion, moderate Offenheit und geringe Neurotizismus. Du planst sorgfältig, bist bestimmt in deinen Bedürfnissen und bevorzugst bedeutungsvolle Interaktionen.",
+        "persona_needs": "Du benötigst Struktur, Transparenz und regelmässiges Feedback zu deinen Fortschritten.",
+        "persona_challenges": "Bei Unterbrechung deiner Routinen oder fehlender Struktur kann dein Perfektionismus zu Frustration führen.",
+        "companion": {
+            "type": "Der Architektonische Turm",
+            "description": "Ein modularer, aufsteigender Turm mit präzise angeordneten geometrischen Elementen, der mit jedem Therapieerfolg neue Stockwerke und Strukturen entwickelt.",
+            "color": DARK_BLUE
+        }
+    },
+    "Sozialer Enthusiast": {
+        "profile": {
+            "extraversion": ["high", "medium_high"],
+            "agreeableness": ["high", "medium_high"],
+            "openness": ["medium_high", "medium_low"],
+            "conscientiousness": ["medium_high", "medium_low"],
+            "neuroticism": ["medium_low", "low"]
         },
-        "Sozialer Enthusiast": {
-            "profile": {
-                "extraversion": ["high", "medium_high"],
-                "agreeableness": ["high", "medium_high"],
-                "openness": ["medium_high", "medium_low"],
-                "conscientiousness": ["medium_high", "medium_low"],
-                "neuroticism": ["medium_low", "low"]
-            },
-            "description": "Du geniesst soziale Interaktionen und teilst gerne Erfahrungen.",
-            "persona_profile": "Hohe Extraversion und Verträglichkeit, moderate Offenheit und Gewissenhaftigkeit. Du bist positiv gestimmt, harmonieorientiert und kannst dich in sozialen Kontexten gut anpassen.",
-            "persona_needs": "Du suchst soziale Verbindung, möchtest Erfahrungen teilen und schätzt Anerkennung.",
-            "persona_challenges": "Du kannst Therapieelemente vernachlässigen, die nicht sozial integrierbar sind, und bei fehlender sozialer Unterstützung die Motivation verlieren.",
-            "companion": {
-                "type": "Der Evolutionäre Begleiter Evo",
-                "description": "Ein freundliches, interaktives Wesen, das durch Therapieadhärenz mehrere klar definierte Evolutions-stufen durchläuft und dabei visuell wächst, neue Fähigkeiten entwickelt und soziale Verbindungen aufbaut.",
-                "color": DARK_YELLOW
-            }
+        "description": "Du geniesst soziale Interaktionen und teilst gerne Erfahrungen.",
+        "persona_profile": "Hohe Extraversion und Verträglichkeit, moderate Offenheit und Gewissenhaftigkeit. Du bist positiv gestimmt, harmonieorientiert und kannst dich in sozialen Kontexten gut anpassen.",
+        "persona_needs": "Du suchst soziale Verbindung, möchtest Erfahrungen teilen und schätzt Anerkennung.",
+        "persona_challenges": "Du kannst Therapieelemente vernachlässigen, die nicht sozial integrierbar sind, und bei fehlender sozialer Unterstützung die Motivation verlieren.",
+        "companion": {
+            "type": "Der Evolutionäre Begleiter Evo",
+            "description": "Ein freundliches, interaktives Wesen, das durch Therapieadhärenz mehrere klar definierte Evolutions-stufen durchläuft und dabei visuell wächst, neue Fähigkeiten entwickelt und soziale Verbindungen aufbaut.",
+            "color": DARK_YELLOW
+        }
+    },
+    "Vorsichtiger Beobachter": {
+        "profile": {
+            "neuroticism": ["high", "medium_high"],
+            "extraversion": ["low", "medium_low"],
+            "conscientiousness": ["medium_high", "medium_low"],
+            "agreeableness": ["medium_high", "medium_low"],
+            "openness": ["low", "medium_low"]
         },
-        "Vorsichtiger Beobachter": {
-            "profile": {
-                "neuroticism": ["high", "medium_high"],
-                "extraversion": ["low", "medium_low"],
-                "conscientiousness": ["medium_high", "medium_low"],
-                "agreeableness": ["medium_high", "medium_low"],
-                "openness": ["low", "medium_low"]
-            },
-            "description": "Du neigst zu emotionalen Reaktionen und bevorzugst ruhige, kontrollierte Umgebungen.",
-            "persona_profile": "Hoher Neurotizismus, niedrige Extraversion, moderate Gewissenhaftigkeit und Verträglichkeit. Du bist sorgfältig aber manchmal zurückhaltend und bevorzugst das Bekannte.",
-            "persona_needs": "Du benötigst Sicherheit, klare Anweisungen und behutsames Feedback.",
-            "persona_challenges": "Ängste können dich blockieren, und bei Unsicherheit unterbrichst du eher die Therapie statt nachzufragen.",
-            "companion": {
-                "type": "Der Schützende Kristallbaum",
-                "description": "Ein langsam wachsender, leuchtender Kristallbaum, der in einem geschützten Raum behutsam Zwei-ge, Kristallblüten und schützende Elemente entwickelt und dabei Sicherheit und Stabilität vermittelt.",
-                "color": DARK_GREEN
-            }
+        "description": "Du neigst zu emotionalen Reaktionen und bevorzugst ruhige, kontrollierte Umgebungen.",
+        "persona_profile": "Hoher Neurotizismus, niedrige Extraversion, moderate Gewissenhaftigkeit und Verträglichkeit. Du bist sorgfältig aber manchmal zurückhaltend und bevorzugst das Bekannte.",
+        "persona_needs": "Du benötigst Sicherheit, klare Anweisungen und behutsames Feedback.",
+        "persona_challenges": "Ängste können dich blockieren, und bei Unsicherheit unterbrichst du eher die Therapie statt nachzufragen.",
+        "companion": {
+            "type": "Der Schützende Kristallbaum",
+            "description": "Ein langsam wachsender, leuchtender Kristallbaum, der in einem geschützten Raum behutsam Zwei-ge, Kristallblüten und schützende Elemente entwickelt und dabei Sicherheit und Stabilität vermittelt.",
+            "color": DARK_GREEN
+        }
+    },
+    "Kreativer Entdecker": {
+        "profile": {
+            "openness": ["high", "medium_high"],
+            "extraversion": ["medium_high", "medium_low"],
+            "neuroticism": ["medium_high", "medium_low"],
+            "conscientiousness": ["low", "medium_low"],
+            "agreeableness": ["medium_high", "medium_low"]
         },
-        "Kreativer Entdecker": {
-            "profile": {
-                "openness": ["high", "medium_high"],
-                "extraversion": ["medium_high", "medium_low"],
-                "neuroticism": ["medium_high", "medium_low"],
-                "conscientiousness": ["low", "medium_low"],
-                "agreeableness": ["medium_high", "medium_low"]
-            },
-            "description": "Du suchst neue Erfahrungen und kreative Ansätze zu Problemen.",
-            "persona_profile": "Hohe Offenheit, moderate Extraversion und Neurotizismus, niedrige Gewissenhaftigkeit. Du bist emotional responsiv, flexibel und schätzt kreative Freiheit.",
-            "persona_needs": "Du suchst Stimulation, Freiheit für eigene Gestaltung und kreative Herausforderungen.",
-            "persona_challenges": "Bei monotonen Therapieelementen verlierst du schnell das Interesse und experimentierst lieber als strikt zu folgen.",
-            "companion": {
-                "type": "Der Wandelnde Traumkristall",
-                "description": "Ein sich ständig verändernder, facettenreicher Kristall, der unerwartete Transformationen durchläuft und neue Welten und Dimensionen erschliesst.",
-                "color": DARK_PINK
-            }
+        "description": "Du suchst neue Erfahrungen und kreative Ansätze zu Problemen.",
+        "persona_profile": "Hohe Offenheit, moderate Extraversion und Neurotizismus, niedrige Gewissenhaftigkeit. Du bist emotional responsiv, flexibel und schätzt kreative Freiheit.",
+        "persona_needs": "Du suchst Stimulation, Freiheit für eigene Gestaltung und kreative Herausforderungen.",
+        "persona_challenges": "Bei monotonen Therapieelementen verlierst du schnell das Interesse und experimentierst lieber als strikt zu folgen.",
+        "companion": {
+            "type": "Der Wandelnde Traumkristall",
+            "description": "Ein sich ständig verändernder, facettenreicher Kristall, der unerwartete Transformationen durchläuft und neue Welten und Dimensionen erschliesst.",
+            "color": DARK_PINK
+        }
+    },
+    "Leistungsorientierter Optimierer": {
+        "profile": {
+            "conscientiousness": ["high", "medium_high"],
+            "extraversion": ["medium_high", "medium_low"],
+            "neuroticism": ["low", "medium_low"],
+            "openness": ["medium_high", "medium_low"],
+            "agreeableness": ["low", "medium_low"]
         },
-        "Leistungsorientierter Optimierer": {
-            "profile": {
-                "conscientiousness": ["high", "medium_high"],
-                "extraversion": ["medium_high", "medium_low"],
-                "neuroticism": ["low", "medium_low"],
-                "openness": ["medium_high", "medium_low"],
-                "agreeableness": ["low", "medium_low"]
-            },
-            "description": "Du bist zielorientiert und energiegeladen, dabei emotional stabil und belastbar.",
-            "persona_profile": "Hohe Gewissenhaftigkeit, moderate Extraversion, niedrige Neurotizismus und Verträglichkeit. Du bist diszipliniert, durchsetzungsfähig und eher wettbewerbsorientiert.",
-            "persona_needs": "Du suchst Herausforderungen, messbare Erfolge und kontinuierliche Optimierung.",
-            "persona_challenges": "Du kannst ungeduldig werden, wenn Ergebnisse nicht schnell sichtbar sind, und ruhigere Therapieaspekte vernachlässigen.",
-            "companion": {
-                "type": "Der Dynamische Leistungsroboter",
-                "description": "Ein hocheffizient konstruierter, anpassbarer Roboter, der sich durch Leistung und Therapietreue kon-tinuierlich verbessert und optimiert.",
-                "color": DARK_VIOLET
-            }
+        "description": "Du bist zielorientiert und energiegeladen, dabei emotional stabil und belastbar.",
+        "persona_profile": "Hohe Gewissenhaftigkeit, moderate Extraversion, niedrige Neurotizismus und Verträglichkeit. Du bist diszipliniert, durchsetzungsfähig und eher wettbewerbsorientiert.",
+        "persona_needs": "Du suchst Herausforderungen, messbare Erfolge und kontinuierliche Optimierung.",
+        "persona_challenges": "Du kannst ungeduldig werden, wenn Ergebnisse nicht schnell sichtbar sind, und ruhigere Therapieaspekte vernachlässigen.",
+        "companion": {
+            "type": "Der Dynamische Leistungsroboter",
+            "description": "Ein hocheffizient konstruierter, anpassbarer Roboter, der sich durch Leistung und Therapietreue kon-tinuierlich verbessert und optimiert.",
+            "color": DARK_VIOLET
         }
     }
+}
+
+# Reihenfolge der Traits und Kategorien in der Persona-Tabelle
+TRAIT_ORDER = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+CATEGORIES = ("low", "medium_low", "medium_high", "high")
+PERSONA_NAMES = tuple(PERSONAS)
+
+def categorize_score(score):
+    """Kategorie eines Scores (0-100): low, medium_low, medium_high oder high"""
+    if score > 75:
+        return "high"
+    elif score > 50:
+        return "medium_high"
+    elif score > 25:
+        return "medium_low"
+    return "low"
+
+def match_persona(trait_categories):
+    """
+    Persona mit den meisten übereinstimmenden Trait-Kategorien (bei Gleichstand die erste in PERSONAS)
+    
+    Args:
+        trait_categories (dict): Kategorie pro Trait, fehlende Traits zählen nicht
     
-    # Berechnung der Übereinstimmung mit jeder Persona
+    Returns:
+        str: Name der Persona
+    """
     persona_scores = {}
-    for name, persona in personas.items():
+    for name, persona in PERSONAS.items():
         score = 0
         for trait, categories in persona["profile"].items():
             if trait in trait_categories and trait_categories[trait] in categories:
                 score += 1
         persona_scores[name] = score
+    return max(persona_scores.items(), key=lambda x: x[1])[0]
+
+def _compile_persona_table():
+    """
+    Persona-Index für alle 4^5 Kombinationen von Trait-Kategorien. Der Tabellenindex ist
+    sum(Kategorie des i-ten Traits * 4^i) mit den Traits in TRAIT_ORDER
+    """
+    table = np.empty(len(CATEGORIES) ** len(TRAIT_ORDER), dtype=np.int8)
+    for index in range(len(table)):
+        categories = {trait: CATEGORIES[index // len(CATEGORIES) ** i % len(CATEGORIES)]
+                      for i, trait in enumerate(TRAIT_ORDER)}
+        table[index] = PERSONA_NAMES.index(match_persona(categories))
+    table.setflags(write=False)
+    return table
+
+PERSONA_TABLE = _compile_persona_table()
+_CATEGORY_WEIGHTS = len(CATEGORIES) ** np.arange(len(TRAIT_ORDER))
+
+# Dieselbe Tabelle als Tupel mit Namen für einzelne Abfragen ohne NumPy-Overhead
+_PERSONA_LOOKUP = tuple(PERSONA_NAMES[index] for index in PERSONA_TABLE)
+_TRAIT_WEIGHTS = tuple((trait, len(CATEGORIES) ** i) for i, trait in enumerate(TRAIT_ORDER))
+
+def classify_personas(traits):
+    """
+    Bestimmt die Personas vieler Trait-Vektoren auf einmal
+    
+    Args:
+        traits: Array (n, 5) mit Scores 0-100 in der Reihenfolge TRAIT_ORDER
+    
+    Returns:
+        np.ndarray: Persona-Index pro Zeile (Name über PERSONA_NAMES)
+    """
+    traits = np.asarray(traits)
+    # Kategorie wie categorize_score: Anzahl überschrittener Schwellen
+    categories = (traits > 25).astype(np.int64) + (traits > 50) + (traits > 75)
+    return PERSONA_TABLE[categories @ _CATEGORY_WEIGHTS]
+
+def determine_persona_type(personality_traits):
+    """
+    Bestimmt den Persona-Typ basierend auf den Persönlichkeitsmerkmalen
     
-    # Persona mit der höchsten Übereinstimmung auswählen
-    best_match = max(persona_scores.items(), key=lambda x: x[1])
-    best_persona_name = best_match[0]
-    best_persona = personas[best_persona_name]
+    Args:
+        personality_traits (dict): Die Persönlichkeitsmerkmale mit Scores
+        
+    Returns:
+        tuple: (persona_name, persona_desc, persona_profile, persona_needs, persona_challenges,
+                companion_type, companion_desc, companion_color)
+    """
+    if all(trait in personality_traits for trait in TRAIT_ORDER):
+        # Nachschlagen in der vorberechneten Tabelle
+        index = 0
+        for trait, weight in _TRAIT_WEIGHTS:
+            score = personality_traits[trait]
+            index += ((score > 25) + (score > 50) + (score > 75)) * weight
+        best_persona_name = _PERSONA_LOOKUP[index]
+    else:
+        # Unvollständige Traits: nur die vorhandenen vergleichen
+        best_persona_name = match_persona({trait: categorize_score(score) for trait, score in personality_traits.items()})
+    best_persona = PERSONAS[best_persona_name]
     
     return (
         best_persona_name,
@@ -313,39 +371,96 @@ def determine_persona_type(personality_traits):
         best_persona["companion"]["description"],
         best_persona["companion"]["color"]
     )
+
+# =============================================================================
+# Rohdaten der Spiele für die Auswertung
+# =============================================================================
+
+def collect_game_data(game):
+    """
+    Kopiert die Rohdaten der Spiele 1-5, die mit der Sitzung gespeichert werden
+    
+    Args:
+        game: Das Spielobjekt mit den Spielzuständen
+    
+    Returns:
+        dict: Rohdaten mit Schlüsseln game1_phase_data, game1_neuroticism_components,
+              game2_answers, game3_task_results, game4_categorizations, game5_choices
+              und measurements (Eingaben für game_core/scoring.py)
+    """
+    states = game.states
+    return {
+        "game1_phase_data": {
+            phase: dict(values, reaction_times=list(values["reaction_times"]))
+            for phase, values in states["GAME1"].phase_data.items()
+        },
+        "game1_neuroticism_components": dict(states["GAME1"].neuroticism_components),
+        "game2_answers": [dict(answer) for answer in states["GAME2"].answers],
+        "game3_task_results": [dict(result) for result in states["GAME3"].task_results],
+        # Nur die inhaltlichen Felder der Aufgaben (ohne Position und Farbe)
+        "game4_categorizations": [
+            {key: task[key] for key in ("id", "name", "importance", "urgency", "ideal_category", "container")}
+            for task in states["GAME4"].tasks
+        ],
+        "game5_choices": [dict(choice) for choice in states["GAME5"].choices],
+        # Eingaben der Scoring-Kernel, damit ältere Sitzungen neu bewertet werden können
+        "measurements": {
+            "game1": states["GAME1"].measurements(),
+            "game2": states["GAME2"].measurements(),
+            "game4": states["GAME4"].measurements(),
+            "game5": states["GAME5"].measurements(),
+            "bfi": states["BFI10"].measurements()
+        }
+    }
+
 # =============================================================================
 # Automatisches Speichern der Spielergebnisse
 # =============================================================================
 
 def auto_save_data(game):
     """
-    Speichert automatisch die Spielerdaten und Persönlichkeitsmerkmale in eine JSON-Datei
+    Speichert automatisch die Spielerdaten und Persönlichkeitsmerkmale im Sitzungsspeicher
+    (data/sessions, siehe game_core/store.py). Die Daten werden hier kopiert, geschrieben wird
+    im Hintergrund (game.writer)
     
     Args:
         game: Das Spielobjekt mit allen relevanten Daten
+    
+    Returns:
+        str: Kennung der gespeicherten Sitzung (None bei einem Fehler)
     """
     try:
-        # Sicherstellen, dass das Verzeichnis existiert
-        os.makedirs("data", exist_ok=True)
+        # Aktuelles Datum und Uhrzeit, danach werden die Sitzungen nach Tagen abgelegt
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Aktuelles Datum und Uhrzeit für den Dateinamen
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Vorbereiten der zu speichernden Daten
+        # Vorbereiten der zu speichernden Daten (Kopien, da das Spiel weiterläuft)
         data = {
+            "session_id": game.session_id,
+            "scoring_version": scoring.SCORING_VERSION,
             "user_name": game.user_name,
-            "personality_traits": game.personality_traits,
-            "timestamp": timestamp
+            "personality_traits": dict(game.personality_traits),
+            "timestamp": timestamp,
+            "bfi_scores": dict(game.bfi_scores),
+            # Reaktionszeiten aus Spiel 1 mit Messfehler
+            "game1_timing": dict(getattr(game, "game1_timing", {})),
+            # Zeichnungen aus Spiel 3 als Strich-Protokoll (Base64, siehe game_core/strokes.py)
+            "game3_drawings": [
+                {"task": drawing["task"], "stimulus": drawing["stimulus"], "strokes": drawing["strokes"].to_text()}
+                for drawing in getattr(game, "game3_drawings", [])
+            ]
         }
+        # Rohdaten der einzelnen Spiele für die Auswertung (siehe game_core/export.py)
+        data.update(collect_game_data(game))
         
-        # In eine JSON-Datei speichern
-        filename = f"data/{game.user_name}_{timestamp}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        
-        print(f"Daten erfolgreich in {filename} gespeichert")
-        return True
+        # Im Hintergrund an den Sitzungsspeicher anhängen, mit den Ergebnissen der Schatten-Bewertung
+        # (game_core/shadow.py), sobald sie vorliegen
+        store = game.session_store()
+        return game.shadow.save(data, lambda record: game.writer.append(
+            store, record,
+            message="Daten erfolgreich in %s gespeichert",
+            data={"event": "session_saved", "session_id": record["session_id"],
+                  "personality_traits": record["personality_traits"]}))
         
-    except Exception as e:
-        print(f"Fehler beim Speichern der Daten: {e}")
-        return False
\ No newline at end of file
+    except Exception:
+        logger.exception("Fehler beim Speichern der Daten")
+        return None
@@ -9,6 +9,10 @@ Vergleicht die Spielergebnisse mit den BFI-10 Ergebnissen
 # Bibliotheken importieren
 import pygame
 from game_core.constants import *
+from game_core import assets
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 class BFIResultsState:
     def __init__(self, game):
@@ -20,42 +24,48 @@ class BFIResultsState:
         
     def initialize(self):
         """Wird aufgerufen, wenn dieser State aktiviert wird"""
-        print("\n=== INITIALISIERUNG VON BFIResultsState ===")
         self.compare_results()
         self.initialized = True
-        print(f"Initialisierung abgeschlossen, Daten vorhanden: {bool(self.comparison_results)}")
-        print("=== ENDE DER INITIALISIERUNG ===\n")
+        logger.debug("Initialisierung abgeschlossen, Daten vorhanden: %s", bool(self.comparison_results))
         
     def handle_event(self, event):
         """Verarbeitet Benutzereingaben"""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.back_button and self.back_button.collidepoint(pygame.mouse.get_pos()):
+            if self.back_button and self.back_button.collidepoint(event.pos):
                 self.game.transition_to("MENU")  # Zurück zum Hauptmenü
     
     def update(self):
         """Aktualisiert den Zustand - Nachinitialisierung falls notwendig"""
         if not self.initialized or not self.comparison_results:
-            print("Nachininitialisierung im update()...")
+            logger.debug("Nachinitialisierung im update()")
             self.compare_results()
             self.initialized = True
     
+    def frame_rate(self):
+        """Der Vergleich wird nur bei Eingaben neu gezeichnet"""
+        return None
+
+    def dirty_rects(self):
+        """Der Vergleich ändert sich nur durch Eingaben"""
+        return self.game.static_dirty_rects()
+
     def render(self):
         """Zeichnet die Benutzeroberfläche"""
         self.game.screen.fill(BACKGROUND)
         
         # Titel
         title_text = "Vergleich: Spielergebnis vs. BFI-10"
-        title_surf = self.game.title_font_bold.render(title_text, True, TEXT_COLOR)
+        title_surf = self.game.render_text(self.game.title_font_bold, title_text, True, TEXT_COLOR)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 40))  # Nach oben verschoben
         self.game.screen.blit(title_surf, title_rect)
         
         # Wenn keine Daten vorhanden sind, Fehler anzeigen
         if not self.comparison_results:
-            print("Keine Vergleichsdaten beim Rendern - versuche erneut zu initialisieren")
+            logger.warning("Keine Vergleichsdaten beim Rendern - versuche erneut zu initialisieren")
             self.compare_results()
             
         if not self.comparison_results:
-            error_text = self.game.medium_font.render("Keine Vergleichsdaten vorhanden!", True, POMEGRANATE)
+            error_text = self.game.render_text(self.game.medium_font, "Keine Vergleichsdaten vorhanden!", True, POMEGRANATE)
             self.game.screen.blit(error_text, (SCREEN_WIDTH // 2 - error_text.get_width() // 2, 200))
             
             # Zurück-Button
@@ -83,21 +93,21 @@ class BFIResultsState:
             pygame.draw.rect(self.game.screen, WHITE, card_rect, border_radius=8)
             
             # Merkmalname
-            trait_text = self.game.body_font.render(f"{trait}:", True, TEXT_DARK)
+            trait_text = self.game.render_text(self.game.body_font, f"{trait}:", True, TEXT_DARK)
             self.game.screen.blit(trait_text, (70, y_pos + 10))
             
             # Spielergebnis
-            game_score_text = self.game.body_font.render(f"Spiel: {values['game']:.1f}", True, TEXT_DARK)
+            game_score_text = self.game.render_text(self.game.body_font, f"Spiel: {values['game']:.1f}", True, TEXT_DARK)
             self.game.screen.blit(game_score_text, (250, y_pos + 10))
             
             # BFI-10 Ergebnis
-            bfi_score_text = self.game.body_font.render(f"BFI-10: {values['bfi']:.1f}", True, TEXT_DARK)
+            bfi_score_text = self.game.render_text(self.game.body_font, f"BFI-10: {values['bfi']:.1f}", True, TEXT_DARK)
             self.game.screen.blit(bfi_score_text, (400, y_pos + 10))
             
             # Übereinstimmung
             match_score = 100 - min(100, abs(values['game'] - values['bfi']) * 20)  # Prozentuale Übereinstimmung
             match_color = self.get_match_color(match_score)
-            match_text = self.game.body_font.render(f"Übereinstimmung: {match_score:.0f}%", True, match_color)
+            match_text = self.game.render_text(self.game.body_font, f"Übereinstimmung: {match_score:.0f}%", True, match_color)
             self.game.screen.blit(match_text, (600, y_pos + 10))
             
             # Zeichne Übereinstimmungsbalken
@@ -124,7 +134,7 @@ class BFIResultsState:
         card_rect = pygame.Rect(50, y_pos, SCREEN_WIDTH - 100, 60)
         pygame.draw.rect(self.game.screen, BACKGROUND, card_rect, border_radius=8)
         
-        total_text = self.game.font_bold.render(f"Gesamtübereinstimmung: {total_match:.0f}%", True, TEXT_DARK)
+        total_text = self.game.render_text(self.game.font_bold, f"Gesamtübereinstimmung: {total_match:.0f}%", True, TEXT_DARK)
         total_rect = total_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 30))
         self.game.screen.blit(total_text, total_rect)
         
@@ -142,35 +152,33 @@ class BFIResultsState:
         )
 
         # Sitzend Tiktik in der unteren rechten Ecke platzieren
-        tiktik_x = SCREEN_WIDTH - END_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
-        tiktik_y = SCREEN_HEIGHT - END_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
-        self.game.screen.blit(END_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        tiktik_x = SCREEN_WIDTH - assets.END_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
+        tiktik_y = SCREEN_HEIGHT - assets.END_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
+        self.game.screen.blit(assets.END_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
     
     def compare_results(self):
         """Vergleicht die Spielergebnisse mit den BFI-10 Ergebnissen"""
-        print("\n----- VERGLEICH DER ERGEBNISSE -----")
-        
         try:
             # Zeige aktuelle Werte an (Debug)
-            print("Spiel-Werte:", self.game.personality_traits)
-            print("BFI-Werte:", self.game.bfi_scores)
+            logger.debug("Spiel-Werte: %s", self.game.personality_traits)
+            logger.debug("BFI-Werte: %s", self.game.bfi_scores)
             
             # Direkte Überprüfung, ob Daten existieren
             if not hasattr(self.game, 'personality_traits') or not self.game.personality_traits:
-                print("FEHLER: Keine personality_traits gefunden!")
+                logger.error("Keine personality_traits gefunden")
                 return
                 
             if not hasattr(self.game, 'bfi_scores') or not self.game.bfi_scores:
-                print("FEHLER: Keine bfi_scores gefunden!")
+                logger.error("Keine bfi_scores gefunden")
                 return
                 
             # Sicherstellen, dass alle Traits vorhanden sind
             expected_traits = ['openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism']
             for trait in expected_traits:
                 if trait not in self.game.personality_traits:
-                    print(f"WARNUNG: {trait} fehlt in personality_traits!")
+                    logger.warning("%s fehlt in personality_traits", trait)
                 if trait not in self.game.bfi_scores:
-                    print(f"WARNUNG: {trait} fehlt in bfi_scores!")
+                    logger.warning("%s fehlt in bfi_scores", trait)
             
             # Konvertiere die Spielwerte von 0-100 Skala auf 1-5 Skala
             game_scores = {}
@@ -184,7 +192,7 @@ class BFIResultsState:
                 try:
                     bfi_values[trait] = float(value)
                 except (ValueError, TypeError):
-                    print(f"FEHLER beim Konvertieren von BFI-Wert für {trait}: {value}")
+                    logger.error("Fehler beim Konvertieren von BFI-Wert für %s: %s", trait, value)
                     bfi_values[trait] = 3.0  # Standardwert bei Fehler
                     
             # Erstelle die Vergleichsdaten
@@ -196,20 +204,14 @@ class BFIResultsState:
                 "Neurotizismus": {"game": game_scores.get("neuroticism", 3.0), "bfi": bfi_values.get("neuroticism", 3.0)}
             }
             
-            # Debug-Ausgabe der Vergleichsdaten
-            print("Vergleichsdaten:", self.comparison_results)
-            
-            # Debug-Ausgabe der einzelnen Übereinstimmungen
-            for trait, values in self.comparison_results.items():
-                match_score = 100 - min(100, abs(values['game'] - values['bfi']) * 20)
-                print(f"{trait}: Spiel={values['game']:.1f}, BFI={values['bfi']:.1f}, Übereinstimmung={match_score:.0f}%")
-            
-        except Exception as e:
-            print(f"FEHLER beim Vergleich der Ergebnisse: {e}")
-            import traceback
-            traceback.print_exc()
+            # Vergleichsdaten mit den einzelnen Übereinstimmungen protokollieren
+            matches = {trait: 100 - min(100, abs(values['game'] - values['bfi']) * 20)
+                       for trait, values in self.comparison_results.items()}
+            logger.info("Vergleichsdaten berechnet", extra={"data": {
+                "event": "comparison", "results": self.comparison_results, "matches": matches}})
             
-        print("----------------------------------\n")
+        except Exception:
+            logger.exception("Fehler beim Vergleich der Ergebnisse")
     
     def get_match_color(self, match_score):
         """Gibt eine Farbe basierend auf dem Übereinstimmungswert zurück"""
@@ -10,6 +10,11 @@ Nutzer beantworten 10 Aussagen, jeweils auf einer 5-Punkte-Likert-Skala.
 # Bibliotheken importieren
 import pygame
 from game_core.constants import *  # Importiere die Konstanten
+from game_core import assets
+from game_core import scoring
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 class BFI10State:
     def __init__(self, game):
@@ -50,7 +55,7 @@ class BFI10State:
     def handle_event(self, event):
         """Verarbeitet Benutzereingaben"""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             
             # Likert-Skala Buttons
             for i, button in enumerate(self.likert_buttons):
@@ -77,6 +82,14 @@ class BFI10State:
         """BFI benötigt keine laufende Aktualisierung"""
         pass
     
+    def frame_rate(self):
+        """Der Fragebogen wird nur bei Eingaben neu gezeichnet"""
+        return None
+
+    def dirty_rects(self):
+        """Der Fragebogen ändert sich nur durch Eingaben"""
+        return self.game.static_dirty_rects(self.current_question)
+
     def render(self):
         """Zeichnet die aktuelle Frage und die Buttons"""
         # Hintergrund
@@ -92,13 +105,13 @@ class BFI10State:
         
         # Titel im Header
         title_text = "Big Five Inventory (BFI-10) Fragebogen"
-        title_surf = self.game.title_font_bold.render(title_text, True, TEXT_COLOR)
+        title_surf = self.game.render_text(self.game.title_font_bold, title_text, True, TEXT_COLOR)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, header_rect.y + header_rect.height // 2))
         self.game.screen.blit(title_surf, title_rect)
         
         # Anleitung
         instruction = "Bitte gib an, wie sehr du den folgenden Aussagen zustimmst:"
-        instruction_surf = self.game.body_font.render(instruction, True, TEXT_DARK)
+        instruction_surf = self.game.render_text(self.game.body_font, instruction, True, TEXT_DARK)
         instruction_rect = instruction_surf.get_rect(center=(SCREEN_WIDTH // 2, main_card_rect.y + 100))
         self.game.screen.blit(instruction_surf, instruction_rect)
         
@@ -108,11 +121,11 @@ class BFI10State:
         
         # Aktuelle Frage
         question_text = self.questions[self.current_question]
-        question_lines = self.wrap_text(question_text, self.game.body_font, question_card_rect.width - 60)
+        question_lines = self.game.layout_text(question_text, self.game.body_font, TEXT_DARK, question_card_rect.width - 60).lines
         
         y_pos = question_card_rect.y + 30
         for line in question_lines:
-            question_surf = self.game.body_font.render(f"{self.current_question + 1}. {line}" if line == question_lines[0] else line, True, TEXT_DARK)
+            question_surf = self.game.render_text(self.game.body_font, f"{self.current_question + 1}. {line}" if line == question_lines[0] else line, True, TEXT_DARK)
             question_rect = question_surf.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
             self.game.screen.blit(question_surf, question_rect)
             y_pos += 40
@@ -139,12 +152,12 @@ class BFI10State:
         
         # Fortschrittstext
         progress_text = f"Frage {self.current_question + 1} von 10"
-        progress_surf = self.game.small_font.render(progress_text, True, TEXT_DARK)
+        progress_surf = self.game.render_text(self.game.small_font, progress_text, True, TEXT_DARK)
         progress_rect = progress_surf.get_rect(center=(SCREEN_WIDTH // 2, progress_y + 40))
         self.game.screen.blit(progress_surf, progress_rect)
         
         # Mini Blob anzeigen
-        tiktik_mini = pygame.transform.scale(STANDARD_TIKTIK_IMAGE, (80, 80))
+        tiktik_mini = pygame.transform.scale(assets.STANDARD_TIKTIK_IMAGE, (80, 80))
         tiktik_x = SCREEN_WIDTH - tiktik_mini.get_width() - 30
         tiktik_y = SCREEN_HEIGHT - tiktik_mini.get_height() - 30
         self.game.screen.blit(tiktik_mini, (tiktik_x, tiktik_y))
@@ -192,7 +205,7 @@ class BFI10State:
             # Label für jeden Button - alle Labels anzeigen
             label_text = labels[i]
             
-            label_surf = self.game.small_font.render(label_text, True, TEXT_DARK)
+            label_surf = self.game.render_text(self.game.small_font, label_text, True, TEXT_DARK)
             # Labels höher positionieren (-40 statt -15)
             label_rect = label_surf.get_rect(center=(button_x, y_position - 40))
             self.game.screen.blit(label_surf, label_rect)
@@ -260,59 +273,23 @@ class BFI10State:
         else:
             self.prev_button_rect = None
     
-    def wrap_text(self, text, font, max_width):
-        """Zeilenumbruch für zu lange Texte"""
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if font.size(test_line)[0] <= max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
-        
+    def measurements(self):
+        """Rohdaten für die Bewertung: Antworten 1-5 (None = nicht beantwortet)"""
+        return {"answers": list(self.answers)}
+
     def calculate_bfi_scores(self):
         """
         Berechnet die BFI-10 Scores basierend auf den Antworten
         und speichert sie im Game-Objekt
         """
         # Debug: Ausgabe der Antworten vor der Berechnung
-        print("BFI Antworten vor Umkehrung:", self.answers)
-        
-        # Erstelle eine Kopie der Antworten, um die Originale nicht zu verändern
-        answers_copy = self.answers.copy()
-        
-        # Reverse-coding für Items 1, 3, 4, 5, 7, 9 (Indizes 0, 2, 3, 4, 6, 8)
-        reverse_items = [0, 2, 3, 4, 6, 8]
-        for i in reverse_items:
-            answers_copy[i] = 6 - answers_copy[i]  # 5-Punkt-Skala wird umgekehrt
+        logger.debug("BFI Antworten vor Umkehrung: %s", self.answers)
         
-        # Debug: Ausgabe der Antworten nach der Umkehrung
-        print("BFI Antworten nach Umkehrung:", answers_copy)
-        
-        # Berechne Dimension Scores
-        extraversion = (answers_copy[0] + answers_copy[5]) / 2
-        agreeableness = (answers_copy[1] + answers_copy[6]) / 2
-        conscientiousness = (answers_copy[2] + answers_copy[7]) / 2
-        neuroticism = (answers_copy[3] + answers_copy[8]) / 2
-        openness = (answers_copy[4] + answers_copy[9]) / 2
+        # Umkehrung der Items 1, 3, 4, 5, 7, 9 und Mittelwert pro Dimension (game_core/scoring.py)
+        scores = scoring.bfi_scores([self.answers])
         
         # Speichere im Spielobjekt
-        self.game.bfi_scores = {
-            "openness": openness,
-            "conscientiousness": conscientiousness,
-            "extraversion": extraversion,
-            "agreeableness": agreeableness,
-            "neuroticism": neuroticism
-        }
+        self.game.bfi_scores = {trait: float(values[0]) for trait, values in scores.items()}
         
         # Debug: Ausgabe der berechneten Scores
-        print("Berechnete BFI Scores:", self.game.bfi_scores)
\ No newline at end of file
+        logger.info("Berechnete BFI Scores", extra={"data": {"event": "bfi_scores", "scores": self.game.bfi_scores}})
\ No newline at end of file
@@ -10,8 +10,14 @@ Misst emotionale Stabilität, Stressresistenz und Erholungsfähigkeit für den N
 import pygame
 import random
 import math
-import time
 from game_core.constants import *
+from game_core import assets
+from game_core.spatial import SpatialGrid
+from game_core.shapes import ShapePool, SHAPE_TYPES, CIRCLE, RECT, TRIANGLE
+from game_core import scoring
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 class Game1State:
     def __init__(self, game):
@@ -20,15 +26,20 @@ class Game1State:
     
     def initialize(self):
         # Setzt alle Spielvariablen und Vorbereitungen für den Start
-        self.shapes = []
+        self.shapes = ShapePool()  # Alle Formen als parallele Arrays
+        self.drawn_slots = self.shapes.active()  # Im letzten Frame gezeichnete Formen
         self.score = 0
-        self.time = 90 * 60  # 60 Sekunden bei 90 FPS
+        self.duration = 60  # Spieldauer in Sekunden
+        self.time = self.duration  # Verbleibende Zeit in Sekunden
         self.last_spawn = 0
         self.spawn_rate = 1200  # ms
         self.correct_clicks = 0
         self.incorrect_clicks = 0
         self.missed_targets = 0
         self.reaction_times = []
+        self.reaction_errors = []  # Messfehler der Reaktionszeiten (ms)
+        self.reaction_sources = []  # Quelle pro Reaktionszeit: "display" (Zeitstempel) oder "game_clock"
+        self.rejected_reactions = 0  # Klicks mit Zeitstempel vor der ersten Darstellung der Form
         self.running = False
         self.state = "intro"  # Zustände: intro, running, frustration, calming, result
         
@@ -50,6 +61,12 @@ class Game1State:
             'height': SCREEN_HEIGHT - 220
         }
         
+        # Raster über dem Spielbereich für schnelle Treffertests
+        self.shape_grid = SpatialGrid(
+            self.game_area['x'], self.game_area['y'],
+            self.game_area['width'], self.game_area['height']
+        )
+        
         # Messmechanismen für Neurotizismus-Komponenten
         self.current_phase = "normal"
         self.phase_timer = 0
@@ -65,41 +82,41 @@ class Game1State:
             "normal": {
                 "spawn_rate": 1200,
                 "shape_types": ['circle', 'rect', 'triangle'],
-                "shape_lifespan": (60, 180),  # 1-3 Sekunden
+                "shape_lifespan": (1.0, 3.0), # 1-3 Sekunden
                 "clickable_accuracy": 1.0,    # 100% der Klicks werden registriert
-                "duration": 60 * 10,          # 10 Sekunden
+                "duration": 10,               # 10 Sekunden
                 "color": LIGHT_BLUE
             },
             "stress": {
                 "spawn_rate": 400,
                 "shape_types": ['circle', 'rect', 'triangle', 'rect', 'triangle'],
-                "shape_lifespan": (30, 90),  # 0.75-2 Sekunden
+                "shape_lifespan": (0.5, 1.5), # 0.5-1.5 Sekunden
                 "clickable_accuracy": 1.0,
-                "duration": 60 * 8,           # 8 Sekunden
+                "duration": 8,                # 8 Sekunden
                 "color": LIGHT_RED
             },
             "recovery": {
                 "spawn_rate": 1500,
                 "shape_types": ['circle', 'circle', 'rect', 'triangle'],
-                "shape_lifespan": (90, 240),  # 1.5-4 Sekunden
+                "shape_lifespan": (1.5, 4.0), # 1.5-4 Sekunden
                 "clickable_accuracy": 1.0,
-                "duration": 60 * 6,           # 6 Sekunden
+                "duration": 6,                # 6 Sekunden
                 "color": LIGHT_GREEN
             },
             "frustration": {
                 "spawn_rate": 900,
                 "shape_types": ['circle', 'rect', 'triangle'],
-                "shape_lifespan": (30, 90),   # 0.5-1.5 Sekunden
+                "shape_lifespan": (0.5, 1.5), # 0.5-1.5 Sekunden
                 "clickable_accuracy": 0.3,    # Nur 30% der Klicks werden registriert
-                "duration": 60 * 7,           # 7 Sekunden
+                "duration": 7,                # 7 Sekunden
                 "color": LIGHT_PINK
             },
             "surprise": {
                 "spawn_rate": 300,
                 "shape_types": ['circle', 'rect', 'triangle', 'rect', 'rect', 'triangle'],
-                "shape_lifespan": (20, 60),
+                "shape_lifespan": (0.33, 1.0),
                 "clickable_accuracy": 0.8,
-                "duration": 60 * 4,
+                "duration": 4,
                 "color": LIGHT_YELLOW
             }
         }
@@ -122,7 +139,7 @@ class Game1State:
         self.missed_easy_targets = 0  # Offensichtlich verpasste Kreise
     
     def handle_event(self, event):
-        current_time = pygame.time.get_ticks()
+        current_time = self.game.event_time_ms(event)
         
         if self.state == "intro":
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -161,28 +178,8 @@ class Game1State:
                 self.rapid_clicks += 1
             self.last_click_time = current_time
             
-            # Prüfe, ob der Klick auf eine Form trifft
-            clicked_shape = None
-            for i, shape in enumerate(self.shapes):
-                # Distanzberechnung je nach Formtyp
-                if shape['type'] == 'circle':
-                    distance = math.sqrt((mouse_x - shape['pos'][0])**2 + (mouse_y - shape['pos'][1])**2)
-                    if distance <= shape['size']:
-                        clicked_shape = i
-                        break
-                elif shape['type'] == 'rect':
-                    if (abs(mouse_x - shape['pos'][0]) <= shape['size'] and 
-                        abs(mouse_y - shape['pos'][1]) <= shape['size']):
-                        clicked_shape = i
-                        break
-                elif shape['type'] == 'triangle':
-                    # Vereinfachte Dreieck-Erkennung
-                    center_x, center_y = shape['pos']
-                    size = shape['size']
-                    if (mouse_x >= center_x - size and mouse_x <= center_x + size and
-                        mouse_y >= center_y - size and mouse_y <= center_y + size):
-                        clicked_shape = i
-                        break
+            # Prüfe, ob der Klick auf eine Form trifft (nur Formen in der Rasterzelle des Klicks)
+            clicked_shape = self.find_shape_at(mouse_x, mouse_y)
             
             # Spielbereich-Grenzen für Klick-Erfassung
             game_area_rect = pygame.Rect(
@@ -198,26 +195,31 @@ class Game1State:
                 return
                 
             if clicked_shape is not None:
-                shape = self.shapes[clicked_shape]
+                shapes = self.shapes
                 
                 # In der Frustrationsphase werden manche Klicks ignoriert
                 if self.current_phase == "frustration":
                     if random.random() > self.phase_config["frustration"]["clickable_accuracy"]:
                         # Klick wird ignoriert - misst Frustration bei nicht registrierten Klicks
                         # Visuelles Feedback (Kurzes Aufblitzen des Objekts)
-                        shape['flash'] = 10  # 10 Frames aufblitzen
+                        shapes.flashes[clicked_shape] = 0.15  # 0.15 Sekunden aufblitzen
                         return
                 
-                # Reaktionszeit aufzeichnen
-                reaction_time = current_time - shape['spawn_time']
-                self.reaction_times.append(reaction_time)
-                
-                # Speichere Reaktionszeit für aktuelle Phase
-                self.phase_data[self.current_phase]["reaction_times"].append(reaction_time)
+                # Reaktionszeit aufzeichnen (negative Zeiten sind keine gültige Messung)
+                reaction_time, error, source = self.measure_reaction(event, clicked_shape, current_time)
+                if reaction_time < 0:
+                    self.rejected_reactions += 1
+                else:
+                    self.reaction_times.append(reaction_time)
+                    self.reaction_errors.append(error)
+                    self.reaction_sources.append(source)
+                    
+                    # Speichere Reaktionszeit für aktuelle Phase
+                    self.phase_data[self.current_phase]["reaction_times"].append(reaction_time)
                 
                 # Überprüfen, ob die richtige Form (Kreis) angeklickt wurde
-                if shape['type'] == 'circle':
-                    self.score += max(10, 30 - reaction_time // 100)  # Schnellere Reaktionen = mehr Punkte
+                if shapes.kinds[clicked_shape] == CIRCLE:
+                    self.score += max(10, 30 - int(max(0, reaction_time)) // 100)  # Schnellere Reaktionen = mehr Punkte
                     self.correct_clicks += 1
                     self.phase_data[self.current_phase]["correct"] += 1
                     
@@ -234,7 +236,7 @@ class Game1State:
                     self.last_error_time = current_time
                 
                 # Angeklickte Form entfernen
-                self.shapes.pop(clicked_shape)
+                self.remove_shape(clicked_shape)
         
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -246,7 +248,8 @@ class Game1State:
         if self.state != "running":
             return
             
-        current_time = pygame.time.get_ticks()
+        current_time = self.game.game_clock.now_ms()
+        dt = self.game.game_clock.dt
         
         # Inaktivität prüfen (Zögern/Grübeln)
         if current_time - self.last_action_time > 2500:  # 2,5s Inaktivität als Zögern werten
@@ -255,10 +258,10 @@ class Game1State:
         
         # Timer aktualisieren
         if self.time > 0:
-            self.time -= 1
+            self.time -= dt
             
             # Phasen verwalten
-            self.phase_timer -= 1
+            self.phase_timer -= dt
             if self.phase_timer <= 0:
                 self.advance_to_next_phase()
                 
@@ -295,61 +298,98 @@ class Game1State:
             
             # Zufällige Lebensdauer basierend auf der Phase
             lifespan_min, lifespan_max = self.phase_config[self.current_phase]["shape_lifespan"]
-            lifespan = random.randint(lifespan_min, lifespan_max)
+            lifespan = random.uniform(lifespan_min, lifespan_max)
             
             # Form erstellen
-            self.shapes.append({
-                'type': shape_type,
-                'pos': (x, y),
-                'size': size,
-                'color': color,
-                'lifespan': lifespan,
-                'spawn_time': current_time,
-                'flash': 0,  # Für Feedback bei ignorierten Klicks
-                'velocity': (random.randint(-1, 1), random.randint(-1, 1))  # Leichte Bewegung einiger Formen
-            })
-        
-        # Bestehende Formen aktualisieren
-        for i in range(len(self.shapes) - 1, -1, -1):
-            shape = self.shapes[i]
-            shape['lifespan'] -= 1
+            self.add_shape(
+                SHAPE_TYPES.index(shape_type), x, y, size, color, lifespan, current_time,
+                random.randint(-1, 1) * 60, random.randint(-1, 1) * 60  # Leichte Bewegung einiger Formen (Pixel pro Sekunde)
+            )
+        
+        # Bestehende Formen aktualisieren (Lebensdauer und Aufblitzen für alle auf einmal)
+        shapes = self.shapes
+        shapes.age(dt)
+        
+        # Leichte Bewegung bei einigen Formen (nur in Stress- und Frustrationsphase)
+        if self.current_phase in ["stress", "frustration"]:
+            # Spielbereich-Grenzen einhalten, bei Kollision mit Rand umkehren
+            moved = shapes.move(
+                dt,
+                self.game_area['x'] + 10,
+                self.game_area['x'] + self.game_area['width'] - 10,
+                self.game_area['y'] + 10,
+                self.game_area['y'] + self.game_area['height'] - 10
+            )
             
-            # Aufblitzen lassen (für ignorierte Klicks)
-            if shape['flash'] > 0:
-                shape['flash'] -= 1
+            # Nur Formen, die in andere Rasterzellen gewandert sind, neu eintragen
+            if len(moved):
+                cells = self.shape_grid.cell_ranges(shapes.xs[moved], shapes.ys[moved], shapes.sizes[moved])
+                changed = (cells != shapes.cells[moved]).any(axis=1)
+                for slot in moved[changed].tolist():
+                    self.shape_grid.remove(slot)
+                    self.shape_grid.insert(slot, slot, (shapes.xs[slot], shapes.ys[slot]), shapes.sizes[slot])
+                shapes.cells[moved] = cells
+        
+        # Formen entfernen, die ihre Lebensdauer überschritten haben
+        expired = shapes.expired()
+        if len(expired):
+            # Wenn es ein Kreis (Ziel) war, zähle es als verpasst
+            circles = expired[shapes.kinds[expired] == CIRCLE]
+            self.missed_targets += len(circles)
             
-            # Leichte Bewegung bei einigen Formen (nur in Stress- und Frustrationsphase)
-            if (self.current_phase in ["stress", "frustration"] and 
-                (shape['velocity'][0] != 0 or shape['velocity'][1] != 0)):
-                
-                # Position aktualisieren
-                new_x = shape['pos'][0] + shape['velocity'][0]
-                new_y = shape['pos'][1] + shape['velocity'][1]
-                
-                # Spielbereich-Grenzen einhalten
-                min_x = self.game_area['x'] + 10
-                max_x = self.game_area['x'] + self.game_area['width'] - 10
-                min_y = self.game_area['y'] + 10
-                max_y = self.game_area['y'] + self.game_area['height'] - 10
-
-                if min_x <= new_x <= max_x and min_y <= new_y <= max_y:
-                    shape['pos'] = (new_x, new_y)
-                else:
-                    # Bei Kollision mit Rand umkehren
-                    shape['velocity'] = (-shape['velocity'][0], -shape['velocity'][1])
-                            
-            # Formen entfernen, die ihre Lebensdauer überschritten haben
-            if shape['lifespan'] <= 0:
-                # Wenn es ein Kreis (Ziel) war, zähle es als verpasst
-                if shape['type'] == 'circle':
-                    self.missed_targets += 1
-                    
-                    # Messen, ob ein "einfacher" Kreis verpasst wurde 
-                    # (gross und länger sichtbar - deutet auf Unaufmerksamkeit hin)
-                    if shape['size'] > 30 and shape['spawn_time'] < current_time - 1500:
-                        self.missed_easy_targets += 1
-                self.shapes.pop(i)
+            # Messen, ob ein "einfacher" Kreis verpasst wurde 
+            # (gross und länger sichtbar - deutet auf Unaufmerksamkeit hin)
+            easy = (shapes.sizes[circles] > 30) & (shapes.spawn_times[circles] < current_time - 1500)
+            self.missed_easy_targets += int(easy.sum())
+            
+            for slot in expired.tolist():
+                self.remove_shape(slot)
     
+    def measure_reaction(self, event, slot, current_time):
+        """
+        Reaktionszeit auf eine Form in ms, ihr Messfehler in ms und die Quelle der Messung.
+        Gemessen wird vom ersten dargestellten Frame der Form bis zum Zeitstempel des Klicks
+        ("display"), der Fehler setzt sich aus der Unsicherheit beider Zeitpunkte zusammen. Ohne
+        diese Zeitstempel (oder mit fester Schrittweite) zählt die Spielzeit, mit einem Frame als
+        Fehler ("game_clock"). Ein Klick, der während des Zeichnens vor der ersten Darstellung
+        abgeholt wurde, ergibt eine negative Zeit
+        """
+        shapes = self.shapes
+        shown_ns = int(shapes.shown_ns[slot])
+        if shown_ns and hasattr(event, "timestamp_ns") and self.game.game_clock.fixed_step is None:
+            reaction_time = (event.timestamp_ns - shown_ns) / 1e6
+            error = (event.timing_error_ns + int(shapes.shown_errors_ns[slot])) / 1e6
+            return round(reaction_time, 3), round(error, 3), "display"
+        return current_time - int(shapes.spawn_times[slot]), round(self.game.game_clock.dt * 1000, 3), "game_clock"
+
+    def timing_report(self):
+        """Reaktionszeiten mit Messfehler für die Auswertung"""
+        samples = len(self.reaction_times)
+        return {
+            "reaction_times_ms": self.reaction_times,
+            "measurement_errors_ms": self.reaction_errors,
+            "sources": self.reaction_sources,
+            "rejected_samples": self.rejected_reactions,
+            "mean_reaction_ms": round(sum(self.reaction_times) / samples, 3) if samples else None,
+            "mean_error_ms": round(sum(self.reaction_errors) / samples, 3) if samples else None,
+            "max_error_ms": max(self.reaction_errors) if samples else None
+        }
+
+    def presented(self, presented_ns, error_ns):
+        """Merkt sich für neu sichtbare Formen den Zeitpunkt ihres ersten dargestellten Frames"""
+        if self.state == "running":
+            self.shapes.mark_shown(self.drawn_slots, presented_ns, error_ns)
+
+    def frame_rate(self):
+        """Volle Bildrate nur während des Spiels"""
+        return FPS if self.state == "running" else None
+
+    def dirty_rects(self):
+        """Einleitung und Ergebnis sind statisch, das laufende Spiel wird jedes Frame neu gezeichnet"""
+        if self.state == "running":
+            return None
+        return self.game.static_dirty_rects(self.state)
+
     def render(self):
         """Zeichnet den Spielzustand"""
         # Hintergrund basierend auf der aktuellen Phase
@@ -359,7 +399,7 @@ class Game1State:
             self.game.screen.fill(BACKGROUND)
         
         # Header
-        title = self.game.heading_font_bold.render("CLICK & REACT", True, TEXT_COLOR)
+        title = self.game.render_text(self.game.heading_font_bold, "CLICK & REACT", True, TEXT_COLOR)
         self.game.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, TITLE_Y_POSITION))
         
         if self.state == "intro":
@@ -372,7 +412,7 @@ class Game1State:
     def _render_instructions(self):
         """Zeigt die Spielanweisungen vor dem Start an"""      
         # Titel
-        intro_title = self.game.subtitle_font.render("Bereit für das erste Spiel?", True, TEXT_COLOR)
+        intro_title = self.game.render_text(self.game.subtitle_font, "Bereit für das erste Spiel?", True, TEXT_COLOR)
         self.game.screen.blit(intro_title, (SCREEN_WIDTH // 2 - intro_title.get_width() // 2, 100))
         
         # Einleitungstext
@@ -395,7 +435,7 @@ class Game1State:
         # Zeichne Einleitungstext
         y_pos = 150
         for line in intro_text:
-            line_text = self.game.body_font.render(line, True, TEXT_DARK)
+            line_text = self.game.render_text(self.game.body_font, line, True, TEXT_DARK)
             self.game.screen.blit(line_text, (SCREEN_WIDTH // 2 - line_text.get_width() // 2, y_pos))
             y_pos += 30
         
@@ -407,7 +447,7 @@ class Game1State:
         
         # Zeichne Aufzählungspunkte
         for phase in phase_descriptions:
-            line_text = self.game.body_font.render(phase, True, TEXT_DARK)
+            line_text = self.game.render_text(self.game.body_font, phase, True, TEXT_DARK)
             self.game.screen.blit(line_text, (indent_x, y_pos))
             y_pos += 30
     
@@ -415,13 +455,13 @@ class Game1State:
         y_pos += 10
         
         # Zeichne Abschlusstext
-        conclusion_rendered = self.game.body_font.render(conclusion_text, True, TEXT_DARK)
+        conclusion_rendered = self.game.render_text(self.game.body_font, conclusion_text, True, TEXT_DARK)
         self.game.screen.blit(conclusion_rendered, (SCREEN_WIDTH // 2 - conclusion_rendered.get_width() // 2, y_pos))
 
         # Tiktik rendern und unten platzieren
-        tiktik_x = SCREEN_WIDTH // 2 - FLIEGEND_TIKTIK_IMAGE.get_width() // 2
+        tiktik_x = SCREEN_WIDTH // 2 - assets.FLIEGEND_TIKTIK_IMAGE.get_width() // 2
         tiktik_y = SCREEN_HEIGHT - 230
-        self.game.screen.blit(FLIEGEND_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        self.game.screen.blit(assets.FLIEGEND_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
         
         # Button Hover-Effekt prüfen
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -465,27 +505,27 @@ class Game1State:
         }
         
         # Phasen-Anzeige
-        phase_text = self.game.subtitle_font.render(
+        phase_text = self.game.render_text(self.game.subtitle_font, 
             phase_names[self.current_phase], True, TEXT_DARK
         )
         self.game.screen.blit(phase_text, (SCREEN_WIDTH // 2 - phase_text.get_width() // 2, 90))
         
         # Phasen-spezifische Anweisung
         instruction, color = phase_instructions[self.current_phase]
-        instruction_text = self.game.small_font.render(instruction, True, color)
+        instruction_text = self.game.render_text(self.game.small_font, instruction, True, color)
         self.game.screen.blit(instruction_text, 
                         (SCREEN_WIDTH // 2 - instruction_text.get_width() // 2, 120))
         
         # Punktekarte links
         self.game.draw_card(20, 20, 140, 60, color=WHITE, border_radius=0)
-        score_label = self.game.small_font.render("Punkte", True, TEXT_COLOR)
-        score_value = self.game.medium_font.render(f"{self.score}", True, TEXT_DARK)
+        score_label = self.game.render_text(self.game.small_font, "Punkte", True, TEXT_COLOR)
+        score_value = self.game.render_text(self.game.medium_font, f"{self.score}", True, TEXT_DARK)
         self.game.screen.blit(score_label, (30, 25))
         self.game.screen.blit(score_value, (30, 50))
         
         # Zeitkarte rechts
         self.game.draw_card(SCREEN_WIDTH - 160, 20, 140, 60, color=WHITE, border_radius=0)
-        time_label = self.game.small_font.render("Zeit", True, TEXT_COLOR)
+        time_label = self.game.render_text(self.game.small_font, "Zeit", True, TEXT_COLOR)
         
         # Zeit-Farbänderung je nach Phase
         time_colors = {
@@ -496,7 +536,7 @@ class Game1State:
             "surprise": DARK_YELLOW
         }
         
-        time_value = self.game.medium_font.render(f"{self.time // 60}", True, time_colors[self.current_phase])
+        time_value = self.game.render_text(self.game.medium_font, f"{math.ceil(self.time)}", True, time_colors[self.current_phase])
         self.game.screen.blit(time_label, (SCREEN_WIDTH - 150, 25))
         self.game.screen.blit(time_value, (SCREEN_WIDTH - 150, 50))
         
@@ -524,31 +564,30 @@ class Game1State:
                 surface.fill((200, 50, 50, 50))  # Rötlich mit 20% Deckkraft
                 self.game.screen.blit(surface, (x, y))
 
-        # Alle Formen zeichnen
-        for shape in self.shapes:
-            # Während Stressphasen leicht pulsierende Formen
-            size_modifier = 0
-            if self.current_phase == "stress":
-                size_modifier = int(math.sin(pygame.time.get_ticks() * 0.01) * 3)  # -3 bis +3 Pixel
-            
+        # Alle Formen zeichnen (in der Reihenfolge ihres Erscheinens)
+        # Während Stressphasen leicht pulsierende Formen
+        size_modifier = 0
+        if self.current_phase == "stress":
+            size_modifier = int(math.sin(self.game.game_clock.now_ms() * 0.01) * 3)  # -3 bis +3 Pixel
+        
+        shapes = self.shapes
+        slots = shapes.active()
+        self.drawn_slots = slots
+        for kind, x, y, size, flash, color in zip(
+                shapes.kinds[slots].tolist(), shapes.xs[slots].tolist(), shapes.ys[slots].tolist(),
+                shapes.sizes[slots].tolist(), shapes.flashes[slots].tolist(), shapes.colors[slots].tolist()):
             # Farbe je nachdem, ob die Form gerade aufblitzt
-            color = shape['color']
-            if shape['flash'] > 0:
+            if flash > 0:
                 # Kurzes Aufblitzen bei ignorierten Klicks
                 color = DARK_VIOLET
+            size += size_modifier
                 
-            if shape['type'] == 'circle':
-                pygame.draw.circle(self.game.screen, color, shape['pos'], 
-                                shape['size'] + size_modifier)
-            elif shape['type'] == 'rect':
-                rect = pygame.Rect(shape['pos'][0] - shape['size'] - size_modifier, 
-                                shape['pos'][1] - shape['size'] - size_modifier,
-                                (shape['size'] + size_modifier) * 2, 
-                                (shape['size'] + size_modifier) * 2)
+            if kind == CIRCLE:
+                pygame.draw.circle(self.game.screen, color, (x, y), size)
+            elif kind == RECT:
+                rect = pygame.Rect(x - size, y - size, size * 2, size * 2)
                 pygame.draw.rect(self.game.screen, color, rect)
-            elif shape['type'] == 'triangle':
-                x, y = shape['pos']
-                size = shape['size'] + size_modifier
+            elif kind == TRIANGLE:
                 points = [
                     (x, y - size),
                     (x - size, y + size),
@@ -560,12 +599,12 @@ class Game1State:
         
         # Statistiken (Punkte, Klicks)
         bottom_margin = 60  # Abstand vom unteren Bildschirmrand
-        stats_text = self.game.small_font.render(
+        stats_text = self.game.render_text(self.game.small_font, 
             f"Korrekt: {self.correct_clicks}   |   Falsch: {self.incorrect_clicks}", True, TEXT_COLOR)
         self.game.screen.blit(stats_text, (self.game_area['x'] + 10, SCREEN_HEIGHT - bottom_margin))
         
         # Timer-Balken
-        progress = self.time / (90 * 60)  # Prozent der Zeit übrig
+        progress = max(0, self.time) / self.duration  # Prozent der Zeit übrig
         margin = 70  # Abstand vom Rand (links und rechts)
         bar_width = SCREEN_WIDTH - (margin * 2)
         bar_y = SCREEN_HEIGHT - (bottom_margin - 30)
@@ -587,6 +626,33 @@ class Game1State:
                 border_radius=5
             )
                 
+    def add_shape(self, kind, x, y, size, color, lifespan, spawn_time, vx, vy):
+        """Legt eine Form im Speicher an und trägt sie ins Raster ein"""
+        slot = self.shapes.add(kind, x, y, size, color, lifespan, spawn_time, vx, vy)
+        self.shape_grid.insert(slot, slot, (x, y), size)
+        self.shapes.cells[slot] = self.shape_grid.ranges[slot]
+        return slot
+
+    def remove_shape(self, slot):
+        """Entfernt eine Form aus dem Speicher und dem Raster"""
+        self.shapes.remove(slot)
+        self.shape_grid.remove(slot)
+
+    def find_shape_at(self, mouse_x, mouse_y):
+        """Gibt den Platz der ältesten Form unter dem Mauszeiger zurück (oder None)"""
+        shapes = self.shapes
+        for slot in sorted(self.shape_grid.query(mouse_x, mouse_y), key=lambda slot: shapes.ids[slot]):
+            dx = mouse_x - shapes.xs[slot]
+            dy = mouse_y - shapes.ys[slot]
+            size = shapes.sizes[slot]
+            if shapes.kinds[slot] == CIRCLE:
+                if dx * dx + dy * dy <= size * size:
+                    return slot
+            # Rechtecke und (vereinfacht) Dreiecke über ihr umgebendes Quadrat
+            elif abs(dx) <= size and abs(dy) <= size:
+                return slot
+        return None
+
     def advance_to_next_phase(self):
         """Wechselt zur nächsten Spielphase"""
         # Zum nächsten Index in der Phasensequenz wechseln
@@ -614,130 +680,63 @@ class Game1State:
             detail = "Auch in stressigen Situationen bleibst du gelassen und findest schnell zu deinem Gleichgewicht zurück."
         
         # Text rendern
-        self.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
-        self.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
     
+    def measurements(self):
+        """Rohdaten für die Bewertung (Felder siehe scoring.GAME1_FIELDS)"""
+        return {
+            "correct_clicks": self.correct_clicks,
+            "incorrect_clicks": self.incorrect_clicks,
+            "panic_clicks": self.panic_clicks,
+            "rapid_clicks": self.rapid_clicks,
+            "missed_targets": self.missed_targets,
+            "missed_easy_targets": self.missed_easy_targets,
+            "hesitations": self.hesitations,
+            "time_remaining": self.time,
+            "normal_correct": self.phase_data["normal"]["correct"],
+            "normal_incorrect": self.phase_data["normal"]["incorrect"],
+            "stress_correct": self.phase_data["stress"]["correct"],
+            "stress_incorrect": self.phase_data["stress"]["incorrect"],
+            "error_reaction_sum": sum(self.error_reactions),
+            "error_reaction_count": len(self.error_reactions)
+        }
+
     def calculate_neuroticism(self):
         """Berechnet den Neurotizismus-Score basierend auf verschiedenen Metriken"""
-        # 1. Basismetriken berechnen
-        
-        # Reaktionszeiten und Genauigkeit
-        avg_reaction_time = sum(self.reaction_times) / max(1, len(self.reaction_times))
-        accuracy = self.correct_clicks / max(1, self.correct_clicks + self.incorrect_clicks)
-        
-        # Indikatoren für emotionale Stabilität
-        # (a) Phasen-basierte Leistung - Wie stark variiert die Leistung zwischen Phasen?
-        phase_performances = {}
-        for phase, data in self.phase_data.items():
-            if data["correct"] + data["incorrect"] > 0:  # Vermeidet Division durch Null
-                phase_performances[phase] = {
-                    "accuracy": data["correct"] / (data["correct"] + data["incorrect"]),
-                    "avg_reaction": sum(data["reaction_times"]) / max(1, len(data["reaction_times"]))
-                }
-        
-        # Performance-Unterschiede berechnen
-        performance_stability = 0.5  # Standardwert
-        if "normal" in phase_performances and "stress" in phase_performances:
-            # Vergleich normal vs. stress Phasen
-            normal_acc = phase_performances["normal"]["accuracy"]
-            stress_acc = phase_performances["stress"]["accuracy"]
-            
-            # Je grösser der Unterschied, desto niedriger die Stabilität
-            performance_stability = 1.0 - min(1.0, abs(normal_acc - stress_acc) * 2)
-        
-        # (b) Frustrations-Indikatoren
-        # - Viele Panik-Klicks
-        # - Schnelle Klicks hintereinander (Ungeduld)
-        # - Verpasste leichte Ziele (Aufmerksamkeitsverlust)
-        panic_rate = min(1.0, self.panic_clicks / max(10, self.correct_clicks + self.incorrect_clicks)) 
-        rapid_click_rate = min(1.0, self.rapid_clicks / max(10, self.correct_clicks + self.incorrect_clicks))
-        missed_easy_rate = min(1.0, self.missed_easy_targets / max(5, self.missed_targets))
-        
-        frustration_indicator = (panic_rate * 0.4 + rapid_click_rate * 0.3 + missed_easy_rate * 0.3)
-        
-        # (c) Erholung nach Fehlern
-        recovery_factor = 0.5  # Standardwert
-        if self.error_reactions:
-            avg_recovery_time = sum(self.error_reactions) / len(self.error_reactions)
-            # Längere Erholungszeit = niedrigerer Faktor
-            recovery_factor = max(0.0, min(1.0, 1.0 - (avg_recovery_time - 500) / 1500))
-        
-        # (d) Zögern und Grübeln
-        hesitation_factor = min(1.0, self.hesitations / max(5, self.time // (60 * 5)))
-        
-        # 2. Neurotizismus-Komponenten berechnen
-        
-        # Vulnerability (Anfälligkeit für Stress) - wie stark ist die Leistungsminderung unter Stress
-        vulnerability_score = 100 - int(performance_stability * 100)
-        
-        # Depression (neg. Emotionen) - Erholung nach Fehlern und Frustrationstoleranz
-        depression_score = int((1.0 - recovery_factor) * 60 + frustration_indicator * 40)
-        
-        # Impulsiveness - schnelle, unüberlegte Reaktionen
-        impulsiveness_score = int(rapid_click_rate * 60 + panic_rate * 40)
-        
-        # Anxiety (Ängstlichkeit) - wie vorsichtig/zögerlich?
-        anxiety_score = int(hesitation_factor * 70 + (1.0 - accuracy) * 30)
-        
-        # Self-consciousness (Selbstzweifel) - wie stark wird die Leistung bei Fehlern beeinträchtigt
-        self_consciousness_score = int((1.0 - recovery_factor) * 100)
-        
-        # Komponenten speichern
-        self.neuroticism_components = {
-            "vulnerability": vulnerability_score,
-            "depression": depression_score,
-            "impulsiveness": impulsiveness_score,
-            "anxiety": anxiety_score,
-            "self_consciousness": self_consciousness_score
-        }
-        
-        # Gewichteter Gesamt-Neurotizismus-Score
-        weights = {
-            "vulnerability": 0.25,
-            "depression": 0.2,
-            "impulsiveness": 0.15,
-            "anxiety": 0.25,
-            "self_consciousness": 0.15
-        }
-        
-        total_score = sum(score * weights[comp] for comp, score in self.neuroticism_components.items())
-        self.neuroticism_score = int(total_score)
+        # Berechnung über den gemeinsamen Kernel (game_core/scoring.py), hier für eine Sitzung
+        scores, components = scoring.neuroticism_scores({field: [value] for field, value in self.measurements().items()})
+        self.neuroticism_components = {component: int(values[0]) for component, values in components.items()}
+        self.neuroticism_score = int(scores[0])
         
         # Persönlichkeitsmerkmal aktualisieren (umgekehrte Skala - höherer Wert = mehr Neurotizismus)
         self.game.personality_traits["neuroticism"] = self.neuroticism_score
+        
+        # Reaktionszeiten mit Messfehler für die Auswertung bereitstellen
+        self.game.game1_timing = self.timing_report()
+        if self.reaction_times:
+            report = self.game.game1_timing
+            logger.info("Game1 - Reaktionszeit: %.1f ms (Messfehler: Mittel %.2f ms, max. %.2f ms)",
+                        report["mean_reaction_ms"], report["mean_error_ms"], report["max_error_ms"],
+                        extra={"data": {"event": "reaction_times", "mean_reaction_ms": report["mean_reaction_ms"],
+                                        "mean_error_ms": report["mean_error_ms"], "max_error_ms": report["max_error_ms"]}})
 
     def end_game(self):
         """Beendet das Spiel und berechnet den Neurotizismus-Score"""
         self.calculate_neuroticism()
         
-        # Debug-Ausgabe
-        print(f"Game1 - Neurotizismus-Score berechnet: {self.neuroticism_score}")
+        # Score protokollieren
+        logger.info("Game1 - Neurotizismus-Score berechnet: %s", self.neuroticism_score, extra={"data": {
+            "event": "score", "trait": "neuroticism", "score": self.neuroticism_score}})
         
         # Persönlichkeitsmerkmal aktualisieren - als Prozentwert (0-100)
         self.game.personality_traits["neuroticism"] = self.neuroticism_score
-        print(f"Game1 - personality_traits['neuroticism'] gesetzt auf: {self.game.personality_traits['neuroticism']}")
+        logger.debug("Game1 - personality_traits['neuroticism'] gesetzt auf: %s", self.game.personality_traits["neuroticism"])
             
         # Zum nächsten Spiel
         self.game.transition_to("GAME2")
         self.game.states["GAME2"].initialize()
     
-    def render_multiline_text(self, text, font, color, x, y, max_width, line_height):
-        """Zeichnet mehrzeiligen Text automatisch umgebrochen"""
-        words = text.split()
-        line = ""
-        for word in words:
-            test_line = f"{line} {word}".strip()
-            if font.size(test_line)[0] <= max_width:
-                line = test_line
-            else:
-                rendered = font.render(line, True, color)
-                self.game.screen.blit(rendered, (x, y))
-                y += line_height
-                line = word
-        if line:
-            rendered = font.render(line, True, color)
-            self.game.screen.blit(rendered, (x, y))
-    
     def _render_result(self):
         """Zeigt die Ergebnisseite mit dem Neurotizismus-Balken an"""
         description_x = 150
@@ -757,17 +756,17 @@ class Game1State:
                     (scale_x, scale_y, fill_width, scale_height), border_radius=15)
         
         # Labels
-        low_text = self.game.small_font.render("Niedrig", True, TEXT_DARK)
-        high_text = self.game.small_font.render("Hoch", True, TEXT_DARK)
+        low_text = self.game.render_text(self.game.small_font, "Niedrig", True, TEXT_DARK)
+        high_text = self.game.render_text(self.game.small_font, "Hoch", True, TEXT_DARK)
         self.game.screen.blit(low_text, (scale_x, scale_y + scale_height + 10))
         self.game.screen.blit(high_text, (scale_x + scale_width - high_text.get_width(), scale_y + scale_height + 10))
         
         # Neurotizismus Beschriftung mittig über dem Balken
-        neuro_text = self.game.font_bold.render("Neurotizismus", True, TEXT_COLOR)
+        neuro_text = self.game.render_text(self.game.font_bold, "Neurotizismus", True, TEXT_COLOR)
         self.game.screen.blit(neuro_text, (SCREEN_WIDTH // 2 - neuro_text.get_width() // 2, scale_y - 70))
         
         # Prozentsatz über dem Balken
-        percent_text = self.game.medium_font.render(f"{self.neuroticism_score}%", True, TEXT_DARK)
+        percent_text = self.game.render_text(self.game.medium_font, f"{self.neuroticism_score}%", True, TEXT_DARK)
         self.game.screen.blit(percent_text,
                             (scale_x + fill_width - percent_text.get_width() // 2, scale_y - 40))
 
@@ -798,6 +797,6 @@ class Game1State:
         )
 
         # Sitzend Tiktik in der unteren rechten Ecke platzieren
-        tiktik_x = SCREEN_WIDTH - SITZEND_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
-        tiktik_y = SCREEN_HEIGHT - SITZEND_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
-        self.game.screen.blit(SITZEND_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
\ No newline at end of file
+        tiktik_x = SCREEN_WIDTH - assets.SITZEND_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
+        tiktik_y = SCREEN_HEIGHT - assets.SITZEND_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
+        self.game.screen.blit(assets.SITZEND_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
\ No newline at end of file
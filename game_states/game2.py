@@ -9,6 +9,12 @@ Misst Extraversion durch nuancierte Positionierung auf einem Spektrum
 # Bibliotheken importieren
 import pygame
 from game_core.constants import *
+from game_core import assets
+from game_core.text import wrap_balanced
+from game_core import scoring
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 class Game2State:
     def __init__(self, game):
@@ -47,17 +53,8 @@ class Game2State:
         self.option_b_rect = pygame.Rect(x_position, 340, box_width, 80)
 
     def classify_position(self, value):
-        """Gibt eine Klassifikation basierend auf der Schieberegler-Position zurück"""
-        if value < 25:
-            return "introvert_strong"
-        elif value < 45:
-            return "introvert_leaning"
-        elif value <= 55:
-            return "balanced"
-        elif value <= 75:
-            return "extravert_leaning"
-        else:
-            return "extravert_strong"
+        """Gibt eine Klassifikation basierend auf der Schieberegler-Position zurück (siehe scoring.POSITION_CLASSES)"""
+        return scoring.POSITION_CLASSES[scoring.classify_positions(value)]
 
     def handle_event(self, event):
         """Verarbeitet Benutzereingaben"""
@@ -93,7 +90,7 @@ class Game2State:
                     # Antwort aufzeichnen basierend auf Schieberegler-Position
                     self.record_answer()
                     self.state = "transition"
-                    self.transition_timer = 30  # Eine halbe Sekunde bei 60 FPS
+                    self.transition_timer = 0.5  # Eine halbe Sekunde
             
             elif event.type == pygame.MOUSEBUTTONUP:
                 # Schieberegler loslassen
@@ -118,17 +115,28 @@ class Game2State:
             # Weiter-Button
             if hasattr(self, 'continue_button_rect') and self.continue_button_rect.collidepoint(mouse_x, mouse_y):
                 # Berechnen und speichern des endgültigen Extraversions-Scores als Prozentsatz
-                sum_weighted_scores = sum([a["value"] * a.get("weight", 1.0) for a in self.answers])
-                sum_weights = sum([a.get("weight", 1.0) for a in self.answers])
-                extraversion_percentage = int((sum_weighted_scores / sum_weights) * 100)
+                extraversion_percentage = self.extraversion_percentage()
                 self.game.personality_traits["extraversion"] = extraversion_percentage
-                print(f"Neuer personality_traits Wert für extraversion: {extraversion_percentage}")
+                logger.info("Neuer personality_traits Wert für extraversion: %s", extraversion_percentage, extra={"data": {
+                    "event": "score", "trait": "extraversion", "score": extraversion_percentage}})
 
                 
                 # Zum nächsten Spiel
                 self.game.transition_to("GAME3")
                 self.game.states["GAME3"].initialize()
     
+    def measurements(self):
+        """Rohdaten für die Bewertung: Antwortwerte (0-1) und Gewichte"""
+        return {
+            "values": [answer["value"] for answer in self.answers],
+            "weights": [answer.get("weight", 1.0) for answer in self.answers]
+        }
+
+    def extraversion_percentage(self):
+        """Gewichteter Mittelwert der Antworten in Prozent (Kernel aus game_core/scoring.py)"""
+        m = self.measurements()
+        return int(scoring.extraversion_scores([m["values"]], [m["weights"]])[0])
+
     def record_answer(self):
         """Zeichnet die Antwort basierend auf der Schieberegler-Position auf und berechnet Zwischenstand"""
         value = self.slider["position"] / 100.0
@@ -151,7 +159,7 @@ class Game2State:
     def update(self):
         """Aktualisiert den Spielzustand"""
         if self.state == "transition":
-            self.transition_timer -= 1
+            self.transition_timer -= self.game.game_clock.dt
             
             if self.transition_timer <= 0:
                 self.current_scenario += 1
@@ -163,13 +171,21 @@ class Game2State:
                     self.state = "question"
                     self.selection = None
     
+    def frame_rate(self):
+        """Volle Bildrate nur für den Übergang zwischen Szenarien (Timer zählt Sekunden Spielzeit)"""
+        return FPS if self.state == "transition" else None
+
+    def dirty_rects(self):
+        """Alle Ansichten dieses Spiels ändern sich nur durch Eingaben"""
+        return self.game.static_dirty_rects(self.state)
+
     def render(self):
         """Zeichnet den Spielbildschirm"""
         # Hintergrund zeichnen
         self.game.screen.fill(BACKGROUND)
         
         # Header
-        title = self.game.heading_font_bold.render("BALANCE BAR", True, TEXT_COLOR)
+        title = self.game.render_text(self.game.heading_font_bold, "BALANCE BAR", True, TEXT_COLOR)
         self.game.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, TITLE_Y_POSITION))
         
         # Je nach Spielstatus
@@ -179,7 +195,7 @@ class Game2State:
             # Fortschritt anzeigen
             question_count = len(self.scenarios)
             current = self.current_scenario + 1
-            progress_text = self.game.small_font.render(f"Frage {current} von {question_count}", True, TEXT_DARK)
+            progress_text = self.game.render_text(self.game.small_font, f"Frage {current} von {question_count}", True, TEXT_DARK)
             progress_text_y = TITLE_Y_POSITION + 40
             self.game.screen.blit(progress_text, (SCREEN_WIDTH // 2 - progress_text.get_width() // 2, progress_text_y))
             
@@ -193,7 +209,7 @@ class Game2State:
     def _render_intro(self):
         """Zeigt den Intro-Bildschirm mit Spielerklärung"""
         # Titel
-        intro_title = self.game.subtitle_font.render("Wo siehst du dich?", True, TEXT_COLOR)
+        intro_title = self.game.render_text(self.game.subtitle_font, "Wo siehst du dich?", True, TEXT_COLOR)
         self.game.screen.blit(intro_title, (SCREEN_WIDTH // 2 - intro_title.get_width() // 2, 100))
         
         # Erklärungstext
@@ -206,14 +222,14 @@ class Game2State:
         # Zeichne Erklärungstext
         y_pos = 150
         for line in explanation_text:
-            line_text = self.game.body_font.render(line, True, TEXT_DARK)
+            line_text = self.game.render_text(self.game.body_font, line, True, TEXT_DARK)
             self.game.screen.blit(line_text, (SCREEN_WIDTH // 2 - line_text.get_width() // 2, y_pos))
             y_pos += 30
 
         # Tiktik rendern und unten platzieren
-        tiktik_x = SCREEN_WIDTH // 2 - BALANCE_TIKTIK_IMAGE.get_width() // 2
+        tiktik_x = SCREEN_WIDTH // 2 - assets.BALANCE_TIKTIK_IMAGE.get_width() // 2
         tiktik_y = SCREEN_HEIGHT - 230
-        self.game.screen.blit(BALANCE_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        self.game.screen.blit(assets.BALANCE_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
         
         # Hover-Effekt prüfen
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -248,7 +264,7 @@ class Game2State:
 
         card_x = SCREEN_WIDTH // 2 - card_width // 2
         self.game.draw_card(card_x, question_card_y, card_width, card_height, color=BACKGROUND, shadow=False)
-        question_text = self.game.medium_font.render(current["question"], True, TEXT_COLOR)
+        question_text = self.game.render_text(self.game.medium_font, current["question"], True, TEXT_COLOR)
         self.game.screen.blit(
             question_text, 
             (SCREEN_WIDTH // 2 - question_text.get_width() // 2, question_text_y)
@@ -280,18 +296,18 @@ class Game2State:
         self.game.draw_card(option_a_x, option_a_y, box_width, box_height, color=BACKGROUND, shadow=False)
         
         # Introvert-Bild (Option A)
-        if self.current_scenario in GAME2_OPTION_IMAGES and "introvert" in GAME2_OPTION_IMAGES[self.current_scenario]:
-            introvert_image = GAME2_OPTION_IMAGES[self.current_scenario]["introvert"]
+        if self.current_scenario in assets.GAME2_OPTION_IMAGES and "introvert" in assets.GAME2_OPTION_IMAGES[self.current_scenario]:
+            introvert_image = assets.GAME2_OPTION_IMAGES[self.current_scenario]["introvert"]
         else:
             # Fallback auf BLOB
-            introvert_image = BLOB_IMAGE
+            introvert_image = assets.BLOB_IMAGE
         
         # Extravert-Bild (Option B)
-        if self.current_scenario in GAME2_OPTION_IMAGES and "extravert" in GAME2_OPTION_IMAGES[self.current_scenario]:
-            extravert_image = GAME2_OPTION_IMAGES[self.current_scenario]["extravert"]
+        if self.current_scenario in assets.GAME2_OPTION_IMAGES and "extravert" in assets.GAME2_OPTION_IMAGES[self.current_scenario]:
+            extravert_image = assets.GAME2_OPTION_IMAGES[self.current_scenario]["extravert"]
         else:
             # Fallback auf BLOB
-            extravert_image = BLOB_IMAGE
+            extravert_image = assets.BLOB_IMAGE
         
         # Bildgrösse und Positionen definieren
         image_width = 220  # Bildbreite
@@ -310,37 +326,20 @@ class Game2State:
         text_width = box_width - image_width - 100  # Textbreite (Box - Bild - Abstände)
         
         # Option A Text (introvertiert)
-        option_b_lines = self._wrap_text(current["option_b"], text_width)
-        line_height = option_b_lines[0].get_height()
-        
-        # Gesamthöhe des Textes berechnen
-        total_text_height_b = line_height * len(option_b_lines)
+        option_b_layout = self.game.layout_text(current["option_b"], self.game.small_font, TEXT_DARK, text_width, self.game.small_font.get_height(), wrap_balanced)
         
         # Text vertikal zentriert neben dem Bild platzieren
-        text_start_y_b = image_y_b + (image_height - total_text_height_b) // 2
+        text_start_y_b = image_y_b + (image_height - option_b_layout.height) // 2
         text_start_x_b = image_x_b + image_width + 20  # Abstand zwischen Bild und Text
-        
-        for i, line in enumerate(option_b_lines):
-            self.game.screen.blit(
-                line, 
-                (text_start_x_b, text_start_y_b + i * line_height)
-            )
+        option_b_layout.draw(self.game.screen, text_start_x_b, text_start_y_b)
         
         # Option B Text (extravertiert)
-        option_a_lines = self._wrap_text(current["option_a"], text_width)
-        
-        # Gesamthöhe des Textes berechnen
-        total_text_height_a = line_height * len(option_a_lines)
+        option_a_layout = self.game.layout_text(current["option_a"], self.game.small_font, TEXT_DARK, text_width, self.game.small_font.get_height(), wrap_balanced)
         
         # Text vertikal zentriert neben dem Bild platzieren
-        text_start_y_a = image_y_a + (image_height - total_text_height_a) // 2
+        text_start_y_a = image_y_a + (image_height - option_a_layout.height) // 2
         text_start_x_a = image_x_a + image_width + 20  # Abstand zwischen Bild und Text
-        
-        for i, line in enumerate(option_a_lines):
-            self.game.screen.blit(
-                line, 
-                (text_start_x_a, text_start_y_a + i * line_height)
-            )
+        option_a_layout.draw(self.game.screen, text_start_x_a, text_start_y_a)
         
         # Schieberegler zeichnen
         pygame.draw.rect(self.game.screen, DARK_BLUE, (slider_start_x, slider["y"], slider["width"], slider["height"]), border_radius=slider["height"] // 2)
@@ -368,16 +367,16 @@ class Game2State:
         else:
             tendency_text = "Starke Tendenz zu Option B"
 
-        option_b_label = self.game.small_font.render("Option A", True, TEXT_DARK)
-        option_a_label = self.game.small_font.render("Option B", True, TEXT_DARK)
+        option_b_label = self.game.render_text(self.game.small_font, "Option A", True, TEXT_DARK)
+        option_a_label = self.game.render_text(self.game.small_font, "Option B", True, TEXT_DARK)
         
         self.game.screen.blit(option_b_label, (slider_start_x - option_b_label.get_width() // 2, slider["y"] + 25))
         self.game.screen.blit(option_a_label, (slider_end_x - option_a_label.get_width() // 2, slider["y"] + 25))
         
         # Aktuelle Position visualisieren
         # Aktuelle Position und Tendenz nebeneinander darstellen
-        position_text = self.game.small_font.render(f"Deine Position: {slider['position']}% - ", True, TEXT_COLOR)
-        tendency_label = self.game.small_font.render(tendency_text, True, TEXT_COLOR)
+        position_text = self.game.render_text(self.game.small_font, f"Deine Position: {slider['position']}% - ", True, TEXT_COLOR)
+        tendency_label = self.game.render_text(self.game.small_font, tendency_text, True, TEXT_COLOR)
 
         # Gesamtbreite beider Texte berechnen
         total_width = position_text.get_width() + tendency_label.get_width()
@@ -414,7 +413,7 @@ class Game2State:
         )
         
         # Hinweistext
-        hint_text = self.game.small_font.render("Ziehe den Schieberegler zwischen den beiden Optionen", True, TEXT_DARK)
+        hint_text = self.game.render_text(self.game.small_font, "Ziehe den Schieberegler zwischen den beiden Optionen", True, TEXT_DARK)
         self.game.screen.blit(hint_text, (SCREEN_WIDTH // 2 - hint_text.get_width() // 2, SCREEN_HEIGHT - 110))
 
     def _render_transition(self):
@@ -424,9 +423,7 @@ class Game2State:
     def draw_extraversion_description(self, y_pos):
         """Zeichnet eine beschreibende Erklärung des Extraversionsbestimmung"""
         # Berechne den Extraversions-Prozentsatz
-        sum_weighted_scores = sum([a["value"] * a.get("weight", 1.0) for a in self.answers])
-        sum_weights = sum([a.get("weight", 1.0) for a in self.answers])
-        extraversion_percentage = int((sum_weighted_scores / sum_weights) * 100)
+        extraversion_percentage = self.extraversion_percentage()
         
         # Ergebnisse beschreiben
         if extraversion_percentage > 75:
@@ -443,16 +440,14 @@ class Game2State:
             detail = "Ruhige Umgebungen geben dir Energie."
     
         # Text rendern
-        self.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
-        self.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
     
     def _render_result(self):
         """Zeigt das Ergebnis der Extraversionsbestimmung"""
         self.draw_extraversion_description(170)
 
-        sum_weighted_scores = sum([a["value"] * a.get("weight", 1.0) for a in self.answers])
-        sum_weights = sum([a.get("weight", 1.0) for a in self.answers])
-        extraversion_percentage = int((sum_weighted_scores / sum_weights) * 100)
+        extraversion_percentage = self.extraversion_percentage()
 
         # Ergebnisbalken
         scale_x = 150
@@ -466,17 +461,17 @@ class Game2State:
                         (scale_x, scale_y, fill_width, scale_height), border_radius=15)
 
         # Labels
-        intro_text = self.game.small_font.render("Introvertiert", True, TEXT_DARK)
-        extro_text = self.game.small_font.render("Extravertiert", True, TEXT_DARK)
+        intro_text = self.game.render_text(self.game.small_font, "Introvertiert", True, TEXT_DARK)
+        extro_text = self.game.render_text(self.game.small_font, "Extravertiert", True, TEXT_DARK)
         self.game.screen.blit(intro_text, (scale_x, scale_y + scale_height + 10))
         self.game.screen.blit(extro_text, (scale_x + scale_width - extro_text.get_width(), scale_y + scale_height + 10))
 
         # Extraversion Beschriftung mittig über dem Balken
-        neuro_text = self.game.font_bold.render("Extraversion", True, TEXT_COLOR)
+        neuro_text = self.game.render_text(self.game.font_bold, "Extraversion", True, TEXT_COLOR)
         self.game.screen.blit(neuro_text, (SCREEN_WIDTH // 2 - neuro_text.get_width() // 2, scale_y - 70))
 
         # Prozentsatz über dem Balken
-        percent_text = self.game.medium_font.render(f"{extraversion_percentage}%", True, TEXT_DARK)
+        percent_text = self.game.render_text(self.game.medium_font, f"{extraversion_percentage}%", True, TEXT_DARK)
         self.game.screen.blit(percent_text,
                             (scale_x + fill_width - percent_text.get_width() // 2, scale_y - 40))
 
@@ -507,108 +502,22 @@ class Game2State:
         )
 
         # Sitzend Tiktik in der unteren rechten Ecke platzieren
-        tiktik_x = SCREEN_WIDTH - DAUMEN_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
-        tiktik_y = SCREEN_HEIGHT - DAUMEN_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
-        self.game.screen.blit(DAUMEN_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
-
-    def _wrap_text(self, text, max_width):
-        """Bricht Text um, wenn er zu lang für eine Zeile ist und stellt sicher, dass jede Zeile mind. 3 Wörter hat"""
-        words = text.split()
-        if not words:
-            return [self.game.small_font.render("", True, TEXT_DARK)]
-        
-        # Anzahl der Wörter zählen
-        total_words = len(words)
-        
-        # Wenn weniger als 6 Wörter, dann auf 2 Zeilen aufteilen (3 Wörter pro Zeile)
-        if total_words <= 6:
-            # Auf 2 Zeilen aufteilen
-            mid = total_words // 2
-            
-            # Sicherstellen, dass die erste Zeile mindestens 3 Wörter hat (wenn verfügbar)
-            if total_words >= 6:  # 3 + 3
-                mid = 3
-            elif total_words >= 5:  # 3 + 2
-                mid = 3
-            elif total_words >= 3:  # min(3) + rest
-                mid = 3
-                
-            line1 = " ".join(words[:mid])
-            line2 = " ".join(words[mid:])
-            
-            return [
-                self.game.small_font.render(line1, True, TEXT_DARK),
-                self.game.small_font.render(line2, True, TEXT_DARK)
-            ]
-        
-        # Bei längeren Texten teilen wir die Wörter intelligenter auf
-        lines = []
-        current_line = []
-        word_count = 0
-        
-        for word in words:
-            # Test, ob das Wort noch in die aktuelle Zeile passt
-            test_line = current_line + [word]
-            test_text = " ".join(test_line)
-            test_surface = self.game.small_font.render(test_text, True, TEXT_DARK)
-            
-            # Wenn die Zeile zu breit wird und wir schon 3 Wörter haben, neue Zeile beginnen
-            if test_surface.get_width() > max_width and word_count >= 3:
-                lines.append(self.game.small_font.render(" ".join(current_line), True, TEXT_DARK))
-                current_line = [word]
-                word_count = 1
-            else:
-                current_line.append(word)
-                word_count += 1
-        
-        # Letzte Zeile hinzufügen, falls vorhanden
-        if current_line:
-            lines.append(self.game.small_font.render(" ".join(current_line), True, TEXT_DARK))
-        
-        # Wenn wir nur eine Zeile haben, teilen wir sie auf, damit mindestens 2 Zeilen entstehen
-        if len(lines) == 1 and len(words) > 3:
-            mid = len(words) // 2
-            if mid < 3:  # Sicherstellen, dass erste Zeile mind. 3 Wörter hat
-                mid = 3
-                
-            line1 = " ".join(words[:mid])
-            line2 = " ".join(words[mid:])
-            
-            lines = [
-                self.game.small_font.render(line1, True, TEXT_DARK),
-                self.game.small_font.render(line2, True, TEXT_DARK)
-            ]
-        
-        return lines
-
-    def render_multiline_text(self, text, font, color, x, y, max_width, line_height):
-        """Zeichnet mehrzeiligen Text automatisch umgebrochen"""
-        words = text.split()
-        line = ""
-        for word in words:
-            test_line = f"{line} {word}".strip()
-            if font.size(test_line)[0] <= max_width:
-                line = test_line
-            else:
-                rendered = font.render(line, True, color)
-                self.game.screen.blit(rendered, (x, y))
-                y += line_height
-                line = word
-        if line:
-            rendered = font.render(line, True, color)
-            self.game.screen.blit(rendered, (x, y))
-        
+        tiktik_x = SCREEN_WIDTH - assets.DAUMEN_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
+        tiktik_y = SCREEN_HEIGHT - assets.DAUMEN_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
+        self.game.screen.blit(assets.DAUMEN_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+
     def end_game(self):
         """Beendet das Spiel und geht zum nächsten Spiel"""
         # Berechnen und speichern des endgültigen Extraversions-Scores als Prozentsatz
         extraversion_percentage = int((self.extraversion_score / len(self.scenarios)) * 100)
         
-        # Debug-Ausgabe
-        print(f"Game2 - Extraversion-Score berechnet: {extraversion_percentage}")
+        # Score protokollieren
+        logger.info("Game2 - Extraversion-Score berechnet: %s", extraversion_percentage, extra={"data": {
+            "event": "score", "trait": "extraversion", "score": extraversion_percentage}})
         
         # Persönlichkeitsmerkmal aktualisieren - als Prozentwert (0-100)
         self.game.personality_traits["extraversion"] = extraversion_percentage
-        print(f"Game2 - personality_traits['extraversion'] gesetzt auf: {self.game.personality_traits['extraversion']}")
+        logger.debug("Game2 - personality_traits['extraversion'] gesetzt auf: %s", self.game.personality_traits["extraversion"])
             
         # Zum nächsten Spiel
         self.game.transition_to("GAME3")
@@ -10,6 +10,11 @@ import pygame
 import math
 import random
 from game_core.constants import *
+from game_core import assets
+from game_core.strokes import StrokeCoverage, StrokeLog
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 class Game3State:
     def __init__(self, game):
@@ -19,7 +24,7 @@ class Game3State:
         self.canvas = pygame.Surface((600, 300))
         self.canvas.fill(WHITE)
         # Stimulus-Bilder laden
-        self.stimuli = SCENARIO_IMAGES
+        self.stimuli = assets.SCENARIO_IMAGES
         
         self.initialize()
     
@@ -32,11 +37,15 @@ class Game3State:
         self.last_pos = None
         self.stroke_width = 3
         self.current_color = (0, 0, 0)  # Schwarz als Startfarbe
-        self.drawing_time = 0
+        self.drawing_time = 0  # Sekunden seit Beginn der aktuellen Aufgabe
         self.color_changes = 0
         self.strokes = 0
         self.complexity_score = 0
         self.task_results = []
+        self.changed_rects = []  # Geänderte Bildschirmbereiche seit dem letzten Frame (Zeichenmodus)
+        self.shown_time_left = None
+        self.reset_recording()
+        self.game.game3_drawings = []  # Strich-Protokolle aller Aufgaben (werden mit der Sitzung gespeichert)
         
         # Verfügbare Farben
         self.colors = [
@@ -88,6 +97,7 @@ class Game3State:
                 self.drawing = True
                 self.last_pos = event.pos
                 self.strokes += 1
+                self.stroke_log.begin_stroke(self.to_canvas(event.pos), self.current_color, self.stroke_width, self.task_time_ms(event))
             
             # Maus losgelassen - Zeichnen beenden
             elif event.type == pygame.MOUSEBUTTONUP:
@@ -97,14 +107,15 @@ class Game3State:
             # Maus bewegt - zeichnen, wenn gedrückt
             elif event.type == pygame.MOUSEMOTION and self.drawing:
                 if self.last_pos:
-                    # Auf das Canvas zeichnen
-                    pygame.draw.line(
-                        self.canvas,
-                        self.current_color,
-                        (self.last_pos[0] - (SCREEN_WIDTH - 600) // 2, self.last_pos[1] - 150),
-                        (event.pos[0] - (SCREEN_WIDTH - 600) // 2, event.pos[1] - 150),
-                        self.stroke_width
-                    )
+                    start = self.to_canvas(self.last_pos)
+                    end = self.to_canvas(event.pos)
+
+                    # Auf das Canvas zeichnen, Abdeckung und Protokoll nachführen
+                    segment_rect = pygame.draw.line(self.canvas, self.current_color, start, end, self.stroke_width)
+                    self.changed_rects.append(segment_rect.move((SCREEN_WIDTH - 600) // 2, 150))
+                    self.coverage.mark_segment(start, end, self.current_color, self.stroke_width)
+                    self.current_coverage = self.coverage.coverage
+                    self.stroke_log.add_point(end, self.task_time_ms(event))
                     self.last_pos = event.pos
             
             # Farbauswahl-Klick
@@ -142,9 +153,36 @@ class Game3State:
         
         # Bild an Position (0, 0) zeichnen, um das gesamte Canvas zu füllen
         self.canvas.blit(stimulus_img, (0, 0))
-    
+        self.reset_recording()
+
+    def reset_recording(self):
+        """Setzt Abdeckungskarte und Strich-Protokoll für eine neue Zeichnung zurück"""
+        width, height = self.canvas.get_size()
+        self.coverage = StrokeCoverage(width, height)
+        self.stroke_log = StrokeLog(width, height)
+        self.current_coverage = 0
+        self.task_start_ticks = self.game.game_clock.now_ms()
+
+    def to_canvas(self, pos):
+        """Rechnet Bildschirm- in Canvas-Koordinaten um"""
+        return (pos[0] - (SCREEN_WIDTH - 600) // 2, pos[1] - 150)
+
+    def task_time_ms(self, event):
+        """Millisekunden seit Beginn der aktuellen Aufgabe bis zum Eintreffen des Ereignisses"""
+        return self.game.event_time_ms(event) - self.task_start_ticks
+
+    def save_drawing(self):
+        """Legt das Strich-Protokoll der aktuellen Aufgabe für die Sitzung ab"""
+        self.game.game3_drawings.append({
+            "task": self.current_task,
+            "stimulus": self.tasks[self.current_task]["stimulus"],
+            "strokes": self.stroke_log
+        })
+
     def evaluate_drawing(self):
         """Wertet die Zeichnung aus und berechnet einen Kreativitätsscore"""
+        self.save_drawing()
+
         # Wenn keine Striche gemacht wurden, sofort 0 Punkte zurückgeben
         if self.strokes == 0:
             task_score = 0
@@ -157,7 +195,9 @@ class Game3State:
                 "max_score": max_task_score,
                 "strokes": 0,
                 "colors": 0,
-                "coverage": 0
+                "coverage": 0,
+                "colors_used": 0,
+                "spread": 0
             })
             
             # Zum Gesamtscore hinzufügen (0 Punkte)
@@ -172,14 +212,8 @@ class Game3State:
         # Punkte für Farbwechsel
         color_score = min(5, self.color_changes)  # Max 5 Punkte für Farbwechsel
         
-        # Komplexitätsanalyse - wie viele Pixel wurden genutzt
-        non_white_pixels = 0
-        for x in range(self.canvas.get_width()):
-            for y in range(self.canvas.get_height()):
-                if self.canvas.get_at((x, y)) != (255, 255, 255):  # Nicht-weisse Pixel
-                    non_white_pixels += 1
-        
-        coverage = non_white_pixels / (self.canvas.get_width() * self.canvas.get_height())
+        # Komplexitätsanalyse - wie viele Pixel wurden bemalt (laufend beim Zeichnen erfasst)
+        coverage = self.current_coverage
         coverage_score = min(10, int(coverage * 100))  # Max 10 Punkte für Flächennutzung
         
         # Gesamtscore für diese Zeichnung
@@ -193,7 +227,9 @@ class Game3State:
             "max_score": max_task_score,
             "strokes": self.strokes,
             "colors": self.color_changes,
-            "coverage": coverage
+            "coverage": coverage,
+            "colors_used": len(self.coverage.used_colors),
+            "spread": self.coverage.spread
         })
         
         # Zum Gesamtscore hinzufügen
@@ -204,22 +240,17 @@ class Game3State:
         """Aktualisiert den Spielzustand"""
         if self.state == "draw":
             # Zeit im Zeichenmodus tracken
-            self.drawing_time += 1
-            
-            # Aktualisiere die Bewertung kontinuierlich, während der Benutzer zeichnet
-            # Dies ist eine vereinfachte Version der evaluate_drawing Methode
-            if self.strokes > 0:
-                non_white_pixels = 0
-                for x in range(0, self.canvas.get_width(), 10):  # Nur jedes 10. Pixel prüfen für Performance
-                    for y in range(0, self.canvas.get_height(), 10):
-                        if self.canvas.get_at((x, y)) != (255, 255, 255):
-                            non_white_pixels += 1
-                
-                # Aktuelle Bewertung speichern (für UI-Feedback, falls gewünscht)
-                self.current_coverage = non_white_pixels / ((self.canvas.get_width() // 10) * (self.canvas.get_height() // 10))
+            self.drawing_time += self.game.game_clock.dt
+            # Die Abdeckung (current_coverage) wird beim Zeichnen in mark_segment mitgeführt
+
+            # Zeitanzeige nur neu zeichnen, wenn sich die Sekunde ändert
+            time_left = self.tasks[self.current_task]["time_limit"] - int(self.drawing_time)
+            if time_left != self.shown_time_left:
+                self.shown_time_left = time_left
+                self.changed_rects.append(pygame.Rect(SCREEN_WIDTH // 2, 100, SCREEN_WIDTH // 2, 40))
             
             # Automatisch absenden, wenn Zeitlimit erreicht ist
-            if self.drawing_time >= self.tasks[self.current_task]["time_limit"] * 60:  # 60 FPS
+            if self.drawing_time >= self.tasks[self.current_task]["time_limit"]:
                 self.evaluate_drawing()
                 self.current_task += 1
                 
@@ -231,13 +262,33 @@ class Game3State:
                     self.color_changes = 0
                     self.strokes = 0
     
+    def frame_rate(self):
+        """Volle Bildrate nur beim Zeichnen"""
+        return FPS if self.state == "draw" else None
+
+    def dirty_rects(self):
+        """
+        Einleitung und Ergebnis sind statisch. Beim Zeichnen werden nur die neuen Striche,
+        die Zeitanzeige und (bei Mausbewegung) der Hover-Zustand des Buttons aktualisiert
+        """
+        if self.state != "draw":
+            return self.game.static_dirty_rects(self.state)
+
+        rects = self.game.static_dirty_rects(("draw", self.current_task), ignore=(pygame.MOUSEMOTION,))
+        if rects is not None:
+            rects.extend(self.changed_rects)
+            if pygame.MOUSEMOTION in self.game.input_types:
+                rects.append(self.submit_button_rect.inflate(6, 6))  # inkl. Schatten
+        self.changed_rects = []
+        return rects
+
     def render(self):
         """Zeichnet den Spielbildschirm"""
         # Hintergrund
         self.game.screen.fill(BACKGROUND)
         
         # Header
-        title = self.game.heading_font_bold.render("CREATIVE EXPLORER", True, TEXT_COLOR)
+        title = self.game.render_text(self.game.heading_font_bold, "CREATIVE EXPLORER", True, TEXT_COLOR)
         self.game.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, TITLE_Y_POSITION))
               
         # Verschiedene Bildschirme basierend auf dem Spielzustand
@@ -251,7 +302,7 @@ class Game3State:
     def _render_intro(self):
         """Zeigt den Anweisungsbildschirm für das Kreativitätsspiel"""
         # Titel
-        intro_title = self.game.subtitle_font.render("Entdecke deine kreative Seite", True, TEXT_COLOR)
+        intro_title = self.game.render_text(self.game.subtitle_font, "Entdecke deine kreative Seite", True, TEXT_COLOR)
         self.game.screen.blit(intro_title, (SCREEN_WIDTH // 2 - intro_title.get_width() // 2, 100))
         
         # Erklärungstext
@@ -266,12 +317,12 @@ class Game3State:
         # Zeichne Erklärungstext
         y_pos = 150
         for line in explanation_text:
-            line_text = self.game.body_font.render(line, True, TEXT_DARK)
+            line_text = self.game.render_text(self.game.body_font, line, True, TEXT_DARK)
             self.game.screen.blit(line_text, (SCREEN_WIDTH // 2 - line_text.get_width() // 2, y_pos))
             y_pos += 30
         
         # Beispiele für Werkzeuge
-        tools_title = self.game.body_font.render("Verfügbare Werkzeuge:", True, TEXT_DARK)
+        tools_title = self.game.render_text(self.game.body_font, "Verfügbare Werkzeuge:", True, TEXT_DARK)
         self.game.screen.blit(tools_title, (SCREEN_WIDTH // 2 - tools_title.get_width() // 2, 360))
         
         # Farbpalette-Beispiel
@@ -301,9 +352,9 @@ class Game3State:
         )
     
         # Tiktik rendern und oberhalb des Buttons platzieren
-        tiktik_x = SCREEN_WIDTH // 2 - MALEN_TIKTIK_IMAGE.get_width() // 2 + 400
+        tiktik_x = SCREEN_WIDTH // 2 - assets.MALEN_TIKTIK_IMAGE.get_width() // 2 + 400
         tiktik_y = SCREEN_HEIGHT - 180
-        self.game.screen.blit(MALEN_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        self.game.screen.blit(assets.MALEN_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
         
     def _render_draw(self):
         """Zeigt den Zeichenbildschirm mit Canvas und Werkzeugen"""
@@ -312,12 +363,12 @@ class Game3State:
         # Gemeinsame y-Position für beide Texte
         text_y_position = 110
         # Aufgabe anzeigen - links platziert
-        task_text = self.game.body_font.render(current_task["instruction"], True, TEXT_DARK)
+        task_text = self.game.render_text(self.game.body_font, current_task["instruction"], True, TEXT_DARK)
         self.game.screen.blit(task_text, (20, text_y_position))  # 20 Pixel Abstand vom linken Rand
         # Zeitanzeige - rechts
-        time_left = current_task["time_limit"] - (self.drawing_time // 60)
+        time_left = current_task["time_limit"] - int(self.drawing_time)
         time_color = TEXT_DARK if time_left > 10 else CHERRY_PINK
-        time_text = self.game.small_font.render(f"Verbleibende Zeit: {time_left} Sekunden", True, time_color)
+        time_text = self.game.render_text(self.game.small_font, f"Verbleibende Zeit: {time_left} Sekunden", True, time_color)
         self.game.screen.blit(time_text, (SCREEN_WIDTH - time_text.get_width() - 20, text_y_position))
 
         # Canvas-Hintergrund
@@ -329,7 +380,7 @@ class Game3State:
         self.game.screen.blit(self.canvas, ((SCREEN_WIDTH - 600) // 2, 150))
         
         # Farbpalette anzeigen
-        palette_text = self.game.small_font.render("Farbpalette:", True, TEXT_DARK)
+        palette_text = self.game.render_text(self.game.small_font, "Farbpalette:", True, TEXT_DARK)
         self.game.screen.blit(palette_text, (50, 490))
         
         for i, color in enumerate(self.colors):
@@ -383,17 +434,17 @@ class Game3State:
         pygame.draw.rect(self.game.screen, LIGHT_BLUE, (scale_x, scale_y, fill_width, scale_height), border_radius=15)
         
         # Labels
-        conventional_text = self.game.small_font.render("Konventionell", True, TEXT_DARK)
-        creative_text = self.game.small_font.render("Kreativ", True, TEXT_DARK)
+        conventional_text = self.game.render_text(self.game.small_font, "Konventionell", True, TEXT_DARK)
+        creative_text = self.game.render_text(self.game.small_font, "Kreativ", True, TEXT_DARK)
         self.game.screen.blit(conventional_text, (scale_x, scale_y + scale_height + 10))
         self.game.screen.blit(creative_text, (scale_x + scale_width - creative_text.get_width(), scale_y + scale_height + 10))
         
         # Openness Beschriftung mittig über dem Balken
-        openness_text = self.game.font_bold.render("Offenheit für Erfahrungen", True, TEXT_COLOR)
+        openness_text = self.game.render_text(self.game.font_bold, "Offenheit für Erfahrungen", True, TEXT_COLOR)
         self.game.screen.blit(openness_text, (SCREEN_WIDTH // 2 - openness_text.get_width() // 2, scale_y - 70))
         
         # Prozentsatz über dem Balken
-        percent_text = self.game.medium_font.render(f"{openness_percentage}%", True, TEXT_DARK)
+        percent_text = self.game.render_text(self.game.medium_font, f"{openness_percentage}%", True, TEXT_DARK)
         self.game.screen.blit(percent_text, (scale_x + fill_width - percent_text.get_width() // 2, scale_y - 40))
         
         # Hover-Effekt prüfen
@@ -418,9 +469,9 @@ class Game3State:
         )
         
         #  Tiktik in der unteren rechten Ecke platzieren
-        tiktik_x = SCREEN_WIDTH - DANCE_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
-        tiktik_y = SCREEN_HEIGHT - DANCE_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
-        self.game.screen.blit(DANCE_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        tiktik_x = SCREEN_WIDTH - assets.DANCE_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
+        tiktik_y = SCREEN_HEIGHT - assets.DANCE_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
+        self.game.screen.blit(assets.DANCE_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
     
     def calculate_openness(self):
         """Berechnet den Offenheits-Score basierend auf kreativer Aktivität"""
@@ -434,12 +485,13 @@ class Game3State:
         """Beendet das Spiel und berechnet den Offenheits-Score"""
         openness_score = self.calculate_openness()
         
-        # Debug-Ausgabe
-        print(f"Game3 - Openness-Score berechnet: {openness_score}")
+        # Score protokollieren
+        logger.info("Game3 - Openness-Score berechnet: %s", openness_score, extra={"data": {
+            "event": "score", "trait": "openness", "score": openness_score}})
         
         # Persönlichkeitsmerkmal aktualisieren - als Prozentwert (0-100)
         self.game.personality_traits["openness"] = openness_score
-        print(f"Game3 - personality_traits['openness'] gesetzt auf: {self.game.personality_traits['openness']}")
+        logger.debug("Game3 - personality_traits['openness'] gesetzt auf: %s", self.game.personality_traits["openness"])
         
         # Zum nächsten Spiel
         self.game.transition_to("GAME4")
@@ -464,22 +516,5 @@ class Game3State:
             detail = "Du fühlst dich am wohlsten mit klaren Regeln und Routinen und bevorzugst praktische Lösungen vor experimentellen Ansätzen."
         
         # Text rendern
-        self.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
-        self.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
-
-    def render_multiline_text(self, text, font, color, x, y, max_width, line_height):
-        """Zeichnet mehrzeiligen Text automatisch umgebrochen"""
-        words = text.split()
-        line = ""
-        for word in words:
-            test_line = f"{line} {word}".strip()
-            if font.size(test_line)[0] <= max_width:
-                line = test_line
-            else:
-                rendered = font.render(line, True, color)
-                self.game.screen.blit(rendered, (x, y))
-                y += line_height
-                line = word
-        if line:
-            rendered = font.render(line, True, color)
-            self.game.screen.blit(rendered, (x, y))
\ No newline at end of file
+        self.game.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
@@ -10,6 +10,11 @@ import pygame
 import random
 import math
 from game_core.constants import *
+from game_core import assets
+from game_core import scoring
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 class Game4State:
     """
@@ -24,7 +29,8 @@ class Game4State:
         """Initialisiert oder setzt das Spiel zurück"""
         self.state = "instruction"  # Zustände: instruction, organize, result
         self.conscientiousness_score = 0
-        self.time_remaining = 60 * 60  # 60 Sekunden bei 60 FPS
+        self.time_limit = 60  # Sekunden
+        self.time_remaining = self.time_limit
         self.tasks = []
         self.organized_tasks = []
         self.is_dragging = False
@@ -168,7 +174,7 @@ class Game4State:
         if self.state == "organize" and self.timer_active:
             # Timer aktualisieren
             if self.time_remaining > 0:
-                self.time_remaining -= 1
+                self.time_remaining -= self.game.game_clock.dt
             else:
                 # Zeit ist abgelaufen, zur Ergebnisphase wechseln
                 self.timer_active = False
@@ -180,19 +186,29 @@ class Game4State:
             all_organized = all(task["container"] is not None for task in self.tasks)
             if all_organized:
                 # Automatisch zur Bewertung übergehen, wenn alle Aufgaben organisiert sind
-                remaining_time_bonus = self.time_remaining / (60 * 60) * 10  # Bis zu 10 Punkte Bonus für schnelles Arbeiten
+                remaining_time_bonus = max(0, self.time_remaining) / self.time_limit * 10  # Bis zu 10 Punkte Bonus für schnelles Arbeiten
                 self.conscientiousness_score += remaining_time_bonus
                 self.timer_active = False
                 self.calculate_conscientiousness()
                 self.state = "result"
     
+    def frame_rate(self):
+        """Volle Bildrate nur beim Sortieren (Zeitbalken)"""
+        return FPS if self.state == "organize" else None
+
+    def dirty_rects(self):
+        """Anleitung und Ergebnis sind statisch, beim Sortieren läuft der Zeitbalken"""
+        if self.state == "organize":
+            return None
+        return self.game.static_dirty_rects(self.state)
+
     def render(self):
         """Zeichnet den Spielbildschirm"""
         # Grundhintergrund
         self.game.screen.fill(BACKGROUND)
         
         # Spieltitel
-        title = self.game.heading_font_bold.render("ORGANISATIONS-CHALLENGE", True, TEXT_COLOR)
+        title = self.game.render_text(self.game.heading_font_bold, "ORGANISATIONS-CHALLENGE", True, TEXT_COLOR)
         self.game.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, TITLE_Y_POSITION))
         
         # Verschiedene Bildschirme basierend auf dem Spielzustand
@@ -207,7 +223,7 @@ class Game4State:
         """Zeigt den Anweisungsbildschirm für das Organisationsspiel"""
 
         # Titel
-        intro_title = self.game.subtitle_font.render("Organisiere deinen Tag!", True, TEXT_COLOR)
+        intro_title = self.game.render_text(self.game.subtitle_font, "Organisiere deinen Tag!", True, TEXT_COLOR)
         self.game.screen.blit(intro_title, (SCREEN_WIDTH // 2 - intro_title.get_width() // 2, 100))
 
         # Einleitungstext
@@ -231,7 +247,7 @@ class Game4State:
         # Zeichne Einleitungstext
         y_pos = 150
         for line in intro_text:
-            line_text = self.game.body_font.render(line, True, TEXT_DARK)
+            line_text = self.game.render_text(self.game.body_font, line, True, TEXT_DARK)
             self.game.screen.blit(line_text, (SCREEN_WIDTH // 2 - line_text.get_width() // 2, y_pos))
             y_pos += 30
         
@@ -243,7 +259,7 @@ class Game4State:
         
         # Zeichne Aufzählungspunkte
         for phase in phase_descriptions:
-            line_text = self.game.body_font.render(phase, True, TEXT_DARK)
+            line_text = self.game.render_text(self.game.body_font, phase, True, TEXT_DARK)
             self.game.screen.blit(line_text, (indent_x, y_pos))
             y_pos += 30
         
@@ -251,13 +267,13 @@ class Game4State:
         y_pos += 10
         
         # Zeichne Abschlusstext
-        conclusion_rendered = self.game.body_font.render(conclusion_text, True, TEXT_DARK)
+        conclusion_rendered = self.game.render_text(self.game.body_font, conclusion_text, True, TEXT_DARK)
         self.game.screen.blit(conclusion_rendered, (SCREEN_WIDTH // 2 - conclusion_rendered.get_width() // 2, y_pos))
 
         # Tiktik rendern und unten platzieren
-        tiktik_x = SCREEN_WIDTH // 2 - ORGANISE_TIKTIK_IMAGE.get_width() // 2
+        tiktik_x = SCREEN_WIDTH // 2 - assets.ORGANISE_TIKTIK_IMAGE.get_width() // 2
         tiktik_y = SCREEN_HEIGHT - 230
-        self.game.screen.blit(ORGANISE_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        self.game.screen.blit(assets.ORGANISE_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
         
         # Button Hover-Effekt prüfen
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -283,12 +299,12 @@ class Game4State:
     def _render_organize(self):
         """Zeigt den Organisationsbildschirm mit Aufgaben und Containern"""
         # Timer anzeigen
-        time_text = self.game.small_font.render(f"Zeit: {self.time_remaining // 60} Sekunden", True, TEXT_DARK)
+        time_text = self.game.render_text(self.game.small_font, f"Zeit: {math.ceil(max(0, self.time_remaining))} Sekunden", True, TEXT_DARK)
         self.game.screen.blit(time_text, (20, 80))
         
         # Fortschrittsbalken für die Zeit
         self.game.draw_progress_bar(50, SCREEN_HEIGHT - 30, SCREEN_WIDTH - 100, 10, 
-                                self.time_remaining / (60 * 60), fill_color=LIGHT_PINK)
+                                max(0, self.time_remaining) / self.time_limit, fill_color=LIGHT_PINK)
         
         # Container für Aufgabenkategorien zeichnen
         for container in self.containers:
@@ -297,7 +313,7 @@ class Game4State:
                             color=container["color"], border_radius=0)
             
             # Kategoriename
-            container_text = self.game.body_font.render(container["name"], True, TEXT_DARK)
+            container_text = self.game.render_text(self.game.body_font, container["name"], True, TEXT_DARK)
             self.game.screen.blit(container_text, (container["rect"].x + container["rect"].width // 2 - container_text.get_width() // 2, 
                                                 container["rect"].y + 10))
         
@@ -312,7 +328,7 @@ class Game4State:
             self.render_task_name(task["name"], task["pos"][0], task["pos"][1], task["size"][0], task["size"][1])
         
         # Anweisungstext
-        instruction_text = self.game.body_font.render("Ziehe die Aufgaben in die passenden Kategorien!", True, TEXT_DARK)
+        instruction_text = self.game.render_text(self.game.body_font, "Ziehe die Aufgaben in die passenden Kategorien!", True, TEXT_DARK)
         self.game.screen.blit(instruction_text, (SCREEN_WIDTH // 2 - instruction_text.get_width() // 2, 80))
 
     def render_task_name(self, task_name, x, y, width, height):
@@ -323,7 +339,7 @@ class Game4State:
         # Prüfen, ob der Text in eine Zeile passt
         if task_font.size(task_name)[0] <= width - 20:  # 10px Rand auf jeder Seite
             # Einzeilige Darstellung
-            task_text = task_font.render(task_name, True, TEXT_LIGHT)
+            task_text = self.game.render_text(task_font, task_name, True, TEXT_LIGHT)
             self.game.screen.blit(task_text, 
                             (x + width // 2 - task_text.get_width() // 2, 
                                 y + height // 2 - task_text.get_height() // 2))
@@ -349,7 +365,7 @@ class Game4State:
             start_y = y + (height - total_height) // 2
             
             for i, line in enumerate(lines):
-                line_text = task_font.render(line, True, TEXT_LIGHT)
+                line_text = self.game.render_text(task_font, line, True, TEXT_LIGHT)
                 self.game.screen.blit(line_text, 
                                 (x + width // 2 - line_text.get_width() // 2, 
                                     start_y + i * task_font.get_height()))
@@ -370,7 +386,7 @@ class Game4State:
         scale_height = 30
         
         # Organisations Beschriftung mittig über dem Balken
-        conscientiousness_text = self.game.font_bold.render("Gewissenhaftigkeit", True, TEXT_COLOR)
+        conscientiousness_text = self.game.render_text(self.game.font_bold, "Gewissenhaftigkeit", True, TEXT_COLOR)
         self.game.screen.blit(conscientiousness_text, (SCREEN_WIDTH // 2 - conscientiousness_text.get_width() // 2, scale_y - 70))
         
         # Skala-Hintergrund
@@ -379,13 +395,13 @@ class Game4State:
         pygame.draw.rect(self.game.screen, LIGHT_BLUE, (scale_x, scale_y, fill_width, scale_height), border_radius=15)
         
         # Labels
-        flexible_text = self.game.small_font.render("Flexibel", True, TEXT_DARK)
-        structured_text = self.game.small_font.render("Strukturiert", True, TEXT_DARK)
+        flexible_text = self.game.render_text(self.game.small_font, "Flexibel", True, TEXT_DARK)
+        structured_text = self.game.render_text(self.game.small_font, "Strukturiert", True, TEXT_DARK)
         self.game.screen.blit(flexible_text, (scale_x, scale_y + scale_height + 10))
         self.game.screen.blit(structured_text, (scale_x + scale_width - structured_text.get_width(), scale_y + scale_height + 10))
         
         # Prozentsatz anzeigen
-        percent_text = self.game.medium_font.render(f"{int(self.conscientiousness_score)}%", True, TEXT_DARK)
+        percent_text = self.game.render_text(self.game.medium_font, f"{int(self.conscientiousness_score)}%", True, TEXT_DARK)
         self.game.screen.blit(percent_text, (scale_x + fill_width - percent_text.get_width() // 2, scale_y - 40))
         
         # Button-Position aus constants.py verwenden
@@ -411,9 +427,9 @@ class Game4State:
         )
 
         # Sitzend Tiktik in der unteren rechten Ecke platzieren
-        tiktik_x = SCREEN_WIDTH - LAPTOP_TIKTIK_IMAGE.get_width() - 20
-        tiktik_y = SCREEN_HEIGHT - LAPTOP_TIKTIK_IMAGE.get_height() - 20
-        self.game.screen.blit(LAPTOP_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        tiktik_x = SCREEN_WIDTH - assets.LAPTOP_TIKTIK_IMAGE.get_width() - 20
+        tiktik_y = SCREEN_HEIGHT - assets.LAPTOP_TIKTIK_IMAGE.get_height() - 20
+        self.game.screen.blit(assets.LAPTOP_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
 
     def draw_conscientiousness_description(self, y_pos):
         # Organisationslevel und Beschreibung bestimmen
@@ -434,70 +450,33 @@ class Game4State:
             description = "Du organisierst auf eine freie, unkonventionelle Weise."
             details = "Deine Kategorien zeigen ein kreatives, weniger strukturiertes Denken."
         
-        self.render_multiline_text(organization_level, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
-        self.render_multiline_text(description, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
-        self.render_multiline_text(details, self.game.body_font, TEXT_DARK, 150, y_pos + 60, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(organization_level, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(description, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(details, self.game.body_font, TEXT_DARK, 150, y_pos + 60, SCREEN_WIDTH - 300, 25)
     
+    def measurements(self):
+        """Rohdaten für die Bewertung: ideale und gewählte Kategorie pro Aufgabe (None = nicht sortiert)"""
+        return {
+            "ideal": [scoring.PRIORITY_CATEGORIES.index(task["ideal_category"]) for task in self.tasks],
+            "container": [scoring.PRIORITY_CATEGORIES.index(task["container"]) if task["container"] is not None else -1
+                          for task in self.tasks]
+        }
+
     def calculate_conscientiousness(self):
-        """Berechnet den Gewissenhaftigkeitswert basierend auf der Organisation"""
-        # Anzahl der organisierten Aufgaben zählen
-        organized_tasks = [task for task in self.tasks if task["container"] is not None]
-        organization_rate = len(organized_tasks) / len(self.tasks)
-        
-        # Bewertung der Kategorisierung
-        categorization_score = 0
-        for task in organized_tasks:
-            # Volle Punkte, wenn die Aufgabe in der idealen Kategorie ist
-            if task["container"] == task["ideal_category"]:
-                categorization_score += 1
-            # Teilpunkte für ähnliche Kategorien
-            elif (task["ideal_category"] == "Hohe Priorität" and task["container"] == "Mittlere Priorität") or \
-                 (task["ideal_category"] == "Mittlere Priorität" and task["container"] in ["Hohe Priorität", "Niedrige Priorität"]) or \
-                 (task["ideal_category"] == "Niedrige Priorität" and task["container"] in ["Mittlere Priorität", "Delegieren/Verschieben"]) or \
-                 (task["ideal_category"] == "Delegieren/Verschieben" and task["container"] == "Niedrige Priorität"):
-                categorization_score += 0.5
-        
-        # Normalisieren des Kategorisierungs-Scores
-        if len(organized_tasks) > 0:
-            categorization_quality = categorization_score / len(organized_tasks)
-        else:
-            categorization_quality = 0
-        
-        # Gewichtete Berechnung des Gewissenhaftigkeits-Scores
-        organization_weight = 0.4  # 40% Gewichtung für die Vollständigkeit der Organisation
-        categorization_weight = 0.6  # 60% Gewichtung für die Qualität der Kategorisierung
-        
-        raw_score = (organization_rate * organization_weight + categorization_quality * categorization_weight) * 100
-        
-        # Begrenzung auf 0-100
-        self.conscientiousness_score = max(0, min(100, raw_score))
+        """Berechnet den Gewissenhaftigkeitswert basierend auf der Organisation (Kernel aus game_core/scoring.py)"""
+        m = self.measurements()
+        self.conscientiousness_score = float(scoring.conscientiousness_scores([m["ideal"]], [m["container"]])[0])
     
     def end_game(self):
         """Beendet das Spiel und geht zum nächsten Spiel oder zum Ergebnisbildschirm"""
-        # Debug-Ausgabe
-        print(f"Game4 - Conscientiousness-Score berechnet: {int(self.conscientiousness_score)}")
+        # Score protokollieren
+        logger.info("Game4 - Conscientiousness-Score berechnet: %s", int(self.conscientiousness_score), extra={"data": {
+            "event": "score", "trait": "conscientiousness", "score": int(self.conscientiousness_score)}})
         
         # Persönlichkeitsmerkmal aktualisieren
         self.game.personality_traits["conscientiousness"] = int(self.conscientiousness_score)
-        print(f"Game4 - personality_traits['conscientiousness'] gesetzt auf: {self.game.personality_traits['conscientiousness']}")
+        logger.debug("Game4 - personality_traits['conscientiousness'] gesetzt auf: %s", self.game.personality_traits["conscientiousness"])
         
         # Zum nächsten Spiel
         self.game.transition_to("GAME5")
         self.game.states["GAME5"].initialize()
-    
-    def render_multiline_text(self, text, font, color, x, y, max_width, line_height):
-        """Zeichnet mehrzeiligen Text automatisch umgebrochen"""
-        words = text.split()
-        line = ""
-        for word in words:
-            test_line = f"{line} {word}".strip()
-            if font.size(test_line)[0] <= max_width:
-                line = test_line
-            else:
-                rendered = font.render(line, True, color)
-                self.game.screen.blit(rendered, (x, y))
-                y += line_height
-                line = word
-        if line:
-            rendered = font.render(line, True, color)
-            self.game.screen.blit(rendered, (x, y))
\ No newline at end of file
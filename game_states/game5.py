@@ -9,6 +9,11 @@ Misst Verträglichkeit durch Ressourcenverteilung
 import pygame
 import math
 from game_core.constants import *
+from game_core import assets
+from game_core import scoring
+from game_core.log import get_logger
+
+logger = get_logger(__name__)
 
 class Game5State:
     """
@@ -120,14 +125,22 @@ class Game5State:
         """Aktualisiert den Spielzustand"""
         # Behandeln von Übergängen oder Animationen, falls benötigt
         if self.state == "play" and self.transition_timer > 0:
-            self.transition_timer -= 1
+            self.transition_timer -= self.game.game_clock.dt
     
+    def frame_rate(self):
+        """Volle Bildrate nur, solange ein Übergang läuft"""
+        return FPS if self.transition_timer > 0 else None
+
+    def dirty_rects(self):
+        """Alle Ansichten dieses Spiels ändern sich nur durch Eingaben"""
+        return self.game.static_dirty_rects(self.state)
+
     def render(self):
         """Zeichnet den Spielbildschirm"""
         self.game.screen.fill(BACKGROUND)
 
         # Header
-        title = self.game.heading_font_bold.render("GIVE & GAIN", True, TEXT_COLOR)
+        title = self.game.render_text(self.game.heading_font_bold, "GIVE & GAIN", True, TEXT_COLOR)
         self.game.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, TITLE_Y_POSITION))
         
         # Verschiedene Bildschirme basierend auf dem Spielzustand
@@ -142,7 +155,7 @@ class Game5State:
         """Zeigt den Anweisungsbildschirm für das Kooperationsspiel"""
 
         # Titel
-        intro_title = self.game.medium_font.render("Wie gehst du hier vor?", True, TEXT_COLOR)
+        intro_title = self.game.render_text(self.game.medium_font, "Wie gehst du hier vor?", True, TEXT_COLOR)
         self.game.screen.blit(intro_title, (SCREEN_WIDTH // 2 - intro_title.get_width() // 2, 100))
         
         # Anweisungstext
@@ -155,7 +168,7 @@ class Game5State:
         
         y_pos = 150
         for line in instructions:
-            text = self.game.body_font.render(line, True, TEXT_DARK)
+            text = self.game.render_text(self.game.body_font, line, True, TEXT_DARK)
             self.game.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, y_pos))
             y_pos += 30
         
@@ -181,9 +194,9 @@ class Game5State:
         )
 
         # Tiktik rendern und unten platzieren
-        tiktik_x = SCREEN_WIDTH // 2 - BIRD_TIKTIK_IMAGE.get_width() // 2
+        tiktik_x = SCREEN_WIDTH // 2 - assets.BIRD_TIKTIK_IMAGE.get_width() // 2
         tiktik_y = SCREEN_HEIGHT - 230
-        self.game.screen.blit(BIRD_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        self.game.screen.blit(assets.BIRD_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
     
     def _render_play(self):
         """Zeigt den Spielbildschirm mit aktuellem Szenario und Schieberegler"""
@@ -192,7 +205,7 @@ class Game5State:
 
         # Fortschrittsanzeige
         if self.round < len(self.scenarios):
-            progress_text = self.game.small_font.render(
+            progress_text = self.game.render_text(self.game.small_font, 
                 f"Szenario {self.round + 1} von {len(self.scenarios)}", True, TEXT_DARK)
             self.game.screen.blit(progress_text, (20, 80))
             
@@ -201,29 +214,29 @@ class Game5State:
         self.game.draw_card(scenario_rect.x, scenario_rect.y, scenario_rect.width, scenario_rect.height, color=BACKGROUND)
         
         # Szenariotitel
-        title_text = self.game.body_font.render(current["title"], True, TEXT_COLOR)
+        title_text = self.game.render_text(self.game.body_font, current["title"], True, TEXT_COLOR)
         self.game.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 130))
         
         # Szenariobeschreibung
-        desc_text = self.game.body_font.render(current["description"], True, TEXT_DARK)
+        desc_text = self.game.render_text(self.game.body_font, current["description"], True, TEXT_DARK)
         self.game.screen.blit(desc_text, (SCREEN_WIDTH // 2 - desc_text.get_width() // 2, 170))
 
         # Ressourcen-Label - nur wenn der Schlüssel existiert
         if "resource" in current:
-            resource_text = self.game.small_font.render(f"Verteile: {current['resource']}", True, TEXT_DARK)
+            resource_text = self.game.render_text(self.game.small_font, f"Verteile: {current['resource']}", True, TEXT_DARK)
             self.game.screen.blit(resource_text, (SCREEN_WIDTH // 2 - resource_text.get_width() // 2, 220))
         
         # Charaktere/Bilder zeichnen
         # Linke Seite - Andere
         other_rect = pygame.Rect(150, 300, 150, 80)
         self.game.draw_card(other_rect.x, other_rect.y, other_rect.width, other_rect.height, color=LIGHT_YELLOW, border_radius=0)
-        other_label = self.game.small_font.render("Andere", True, TEXT_COLOR)
+        other_label = self.game.render_text(self.game.small_font, "Andere", True, TEXT_COLOR)
         self.game.screen.blit(other_label, (150 + 75 - other_label.get_width() // 2, 330))
         
         # Rechte Seite - Selbst
         self_rect = pygame.Rect(SCREEN_WIDTH - 150 - 150, 300, 150, 80)
         self.game.draw_card(self_rect.x, self_rect.y, self_rect.width, self_rect.height, color=LIGHT_RED, border_radius=0)
-        self_label = self.game.small_font.render("Du", True, TEXT_COLOR)
+        self_label = self.game.render_text(self.game.small_font, "Du", True, TEXT_COLOR)
         self.game.screen.blit(self_label, (SCREEN_WIDTH - 150 - 75 - self_label.get_width() // 2, 330))
         
         # Slider zeichnen
@@ -253,16 +266,16 @@ class Game5State:
         left_percent = 100 - self.slider_position
         right_percent = self.slider_position
         
-        left_percent_text = self.game.medium_font.render(f"{left_percent}%", True, DARK_YELLOW)
-        right_percent_text = self.game.medium_font.render(f"{right_percent}%", True, DARK_RED)
+        left_percent_text = self.game.render_text(self.game.medium_font, f"{left_percent}%", True, DARK_YELLOW)
+        right_percent_text = self.game.render_text(self.game.medium_font, f"{right_percent}%", True, DARK_RED)
         
         self.game.screen.blit(left_percent_text, (150 + 75 - left_percent_text.get_width() // 2, 350))
         self.game.screen.blit(right_percent_text, (SCREEN_WIDTH - 150 - 75 - right_percent_text.get_width() // 2, 350))
         
         # Slider-Beschriftungen - nur wenn die Schlüssel existieren
         if "left_label" in current and "right_label" in current:
-            left_label = self.game.small_font.render(current["left_label"], True, TEXT_DARK)
-            right_label = self.game.small_font.render(current["right_label"], True, TEXT_DARK)
+            left_label = self.game.render_text(self.game.small_font, current["left_label"], True, TEXT_DARK)
+            right_label = self.game.render_text(self.game.small_font, current["right_label"], True, TEXT_DARK)
             
             self.game.screen.blit(left_label, (slider_start_x - 10 - left_label.get_width(), slider["y"] + 30))
             self.game.screen.blit(right_label, (slider_start_x + slider["width"] + 10, slider["y"] + 30))
@@ -302,7 +315,7 @@ class Game5State:
         )
         
         # Hinweistext
-        hint_text = self.game.small_font.render("Ziehe den Schieberegler zwischen den beiden Optionen", True, TEXT_DARK)
+        hint_text = self.game.render_text(self.game.small_font, "Ziehe den Schieberegler zwischen den beiden Optionen", True, TEXT_DARK)
         self.game.screen.blit(hint_text, (SCREEN_WIDTH // 2 - hint_text.get_width() // 2, SCREEN_HEIGHT - 110))
     
     def _render_result(self):
@@ -310,8 +323,7 @@ class Game5State:
         description_x = 150
 
         # Verträglichkeits-Prozentsatz berechnen
-        max_possible_score = 100 * len(self.scenarios)
-        agreeableness_percentage = int((self.agreeableness_score / max_possible_score) * 100)
+        agreeableness_percentage = self.agreeableness_percentage()
 
         # Gewissenhaftigkeit Beschreibung
         self.draw_agreeableness_description(170, agreeableness_percentage)
@@ -328,13 +340,13 @@ class Game5State:
         pygame.draw.rect(self.game.screen, LIGHT_BLUE, (scale_x, scale_y, fill_width, scale_height), border_radius=15)
         
         # Labels
-        competitive_text = self.game.small_font.render("Wettbewerbsorientiert", True, TEXT_DARK)
-        cooperative_text = self.game.small_font.render("Kooperativ", True, TEXT_DARK)
+        competitive_text = self.game.render_text(self.game.small_font, "Wettbewerbsorientiert", True, TEXT_DARK)
+        cooperative_text = self.game.render_text(self.game.small_font, "Kooperativ", True, TEXT_DARK)
         self.game.screen.blit(competitive_text, (scale_x, scale_y + scale_height + 10))
         self.game.screen.blit(cooperative_text, (scale_x + scale_width - cooperative_text.get_width(), scale_y + scale_height + 10))
         
         # Prozentsatz anzeigen
-        percent_text = self.game.medium_font.render(f"{agreeableness_percentage}%", True, TEXT_DARK)
+        percent_text = self.game.render_text(self.game.medium_font, f"{agreeableness_percentage}%", True, TEXT_DARK)
         self.game.screen.blit(percent_text, (scale_x + fill_width - percent_text.get_width() // 2, scale_y - 40))
         
         # Rechteck für Klickprüfung erstellen
@@ -359,9 +371,9 @@ class Game5State:
         self.continue_button_rect = button_rect
 
         # Sitzend Tiktik in der unteren rechten Ecke platzieren
-        tiktik_x = SCREEN_WIDTH - FLOWER_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
-        tiktik_y = SCREEN_HEIGHT - FLOWER_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
-        self.game.screen.blit(FLOWER_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        tiktik_x = SCREEN_WIDTH - assets.FLOWER_TIKTIK_IMAGE.get_width() - 20  # 20px Abstand vom rechten Rand
+        tiktik_y = SCREEN_HEIGHT - assets.FLOWER_TIKTIK_IMAGE.get_height() - 20  # 20px Abstand vom unteren Rand
+        self.game.screen.blit(assets.FLOWER_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
 
     def draw_agreeableness_description(self, y_pos, agreeableness_percentage):
         """Zeichnet eine beschreibende Erklärung des Verträglichkeits-Ergebnisses"""
@@ -380,38 +392,34 @@ class Game5State:
             detail = "Diese Selbstständigkeit kann in wettbewerbsorientierten Umgebungen von Vorteil sein und hilft dir, klare Prioritäten zu setzen."
                 
         # Text rendern
-        self.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
-        self.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(main_text, self.game.body_font, TEXT_DARK, 150, y_pos, SCREEN_WIDTH - 300, 25)
+        self.game.render_multiline_text(detail, self.game.body_font, TEXT_DARK, 150, y_pos + 30, SCREEN_WIDTH - 300, 25)
+
+    def measurements(self):
+        """Rohdaten für die Bewertung: Schieberegler-Wert pro Runde und Anzahl Runden"""
+        return {
+            "values": [choice["value"] for choice in self.choices],
+            "rounds": len(self.scenarios)
+        }
+
+    def agreeableness_percentage(self):
+        """Verträglichkeit in Prozent (Kernel aus game_core/scoring.py)"""
+        m = self.measurements()
+        return int(scoring.agreeableness_scores([m["values"]], [m["rounds"]])[0])
+
     def end_game(self):
         """Beendet das Spiel und geht zum Ergebnisbildschirm"""
         # Berechnen und speichern des endgültigen Verträglichkeits-Scores als Prozentsatz
-        max_possible_score = 100 * len(self.scenarios)
-        agreeableness_percentage = int((self.agreeableness_score / max_possible_score) * 100)
+        agreeableness_percentage = self.agreeableness_percentage()
         
-        # Debug-Ausgabe
-        print(f"Game5 - Agreeableness-Score berechnet: {agreeableness_percentage}")
+        # Score protokollieren
+        logger.info("Game5 - Agreeableness-Score berechnet: %s", agreeableness_percentage, extra={"data": {
+            "event": "score", "trait": "agreeableness", "score": agreeableness_percentage}})
         
         # Persönlichkeitsmerkmal aktualisieren - als Prozentwert (0-100)
         self.game.personality_traits["agreeableness"] = agreeableness_percentage
-        print(f"Game5 - personality_traits['agreeableness'] gesetzt auf: {self.game.personality_traits['agreeableness']}")
+        logger.debug("Game5 - personality_traits['agreeableness'] gesetzt auf: %s", self.game.personality_traits["agreeableness"])
         
-        # Zum Ergebnisbildschirm
+        # Zum Ergebnisbildschirm (Persona aus den neuen Werten bestimmen)
         self.game.transition_to("RESULTS")
-
-    def render_multiline_text(self, text, font, color, x, y, max_width, line_height):
-        """Zeichnet mehrzeiligen Text automatisch umgebrochen"""
-        words = text.split()
-        line = ""
-        for word in words:
-            test_line = f"{line} {word}".strip()
-            if font.size(test_line)[0] <= max_width:
-                line = test_line
-            else:
-                rendered = font.render(line, True, color)
-                self.game.screen.blit(rendered, (x, y))
-                y += line_height
-                line = word
-        if line:
-            rendered = font.render(line, True, color)
-            self.game.screen.blit(rendered, (x, y))
-
+        self.game.states["RESULTS"].initialize()
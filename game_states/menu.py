@@ -9,6 +9,10 @@ import pygame
 import math
 import random
 from game_core.constants import *
+from game_core import assets
+
+# Startwert für die Lage der Farbakzente im Hintergrund
+ACCENT_SEED = 7
 
 class MenuState:
     """
@@ -48,6 +52,11 @@ class MenuState:
         
         # Eingabefelder-Rechteck initialisieren
         self.name_input_rect = None
+
+        # Vorgerenderter Hintergrund (render_custom_background), beim ersten Zeichnen erstellt
+        self.background_layer = None
+        self.accent_sprites = {}    # Pool der Akzent-Sprites: {(Grösse, Farbe): Surface}
+        self.accents = []           # (x, y, Sprite) pro Akzent
         
     def handle_event(self, event):
         """Verarbeitet Benutzereingaben im Menü"""
@@ -125,29 +134,33 @@ class MenuState:
         """Aktualisiert den Zustand des Menüs (Animation, etc.)"""
         pass
     
+    def frame_rate(self):
+        """Niedrige Bildrate reicht für den blinkenden Cursor und die Hintergrundakzente"""
+        return 4
+
     def render(self):
         """Zeichnet das Hauptmenü"""
         # Hintergrundfarbe setzen
         self.game.screen.fill(BACKGROUND)
 
         # Titel auf dem Hintergrund rendern
-        title = self.game.title_font_bold.render("PERSONA COMPANION", True, TEXT_COLOR)
+        title = self.game.render_text(self.game.title_font_bold, "PERSONA COMPANION", True, TEXT_COLOR)
         self.game.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, TITLE_Y_POSITION))
 
         # Tiktik Bild rendern
-        tiktik_x = SCREEN_WIDTH // 2 - WINKEND_TIKTIK_IMAGE.get_width() // 2
+        tiktik_x = SCREEN_WIDTH // 2 - assets.WINKEND_TIKTIK_IMAGE.get_width() // 2
         tiktik_y = SCREEN_HEIGHT // 6
-        self.game.screen.blit(WINKEND_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        self.game.screen.blit(assets.WINKEND_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
               
         # Begrüssungstext rendern
-        y_offset = tiktik_y + WINKEND_TIKTIK_IMAGE.get_height() + 20 # Position unter dem Bild
-        description1 = self.game.body_font.render("Hi, mein Name ist Tiktik und ich begleite dich durchs ganze Spiel.", True, TEXT_DARK)
-        description2 = self.game.body_font.render("Erkunde deine Persönlichkeit durch spannende Mini-Spiele und finde heraus, welcher Begleiter am besten zu dir passt.", True, TEXT_DARK)
+        y_offset = tiktik_y + assets.WINKEND_TIKTIK_IMAGE.get_height() + 20 # Position unter dem Bild
+        description1 = self.game.render_text(self.game.body_font, "Hi, mein Name ist Tiktik und ich begleite dich durchs ganze Spiel.", True, TEXT_DARK)
+        description2 = self.game.render_text(self.game.body_font, "Erkunde deine Persönlichkeit durch spannende Mini-Spiele und finde heraus, welcher Begleiter am besten zu dir passt.", True, TEXT_DARK)
         self.game.screen.blit(description1, (SCREEN_WIDTH // 2 - description1.get_width() // 2, y_offset))
         self.game.screen.blit(description2, (SCREEN_WIDTH // 2 - description2.get_width() // 2, y_offset + 30))
         
         # Namen Eingabe - linke Seite
-        name_label = self.game.small_font.render("Name:", True, TEXT_COLOR)
+        name_label = self.game.render_text(self.game.small_font, "Name:", True, TEXT_COLOR)
         self.game.screen.blit(name_label, (SCREEN_WIDTH // 4 - 100, y_offset + 75))
 
         name_input_rect = self.render_input_field(
@@ -159,7 +172,7 @@ class MenuState:
         self.name_input_rect = name_input_rect
         
         # Geschlechtsauswahl mit Dropdown - mittlere Seite
-        gender_label = self.game.small_font.render("Geschlecht:", True, TEXT_COLOR)
+        gender_label = self.game.render_text(self.game.small_font, "Geschlecht:", True, TEXT_COLOR)
         self.game.screen.blit(gender_label, (SCREEN_WIDTH // 2 - 90, y_offset + 75))
 
         gender_dropdown_rect, gender_options_rect = self.game.draw_dropdown(
@@ -174,7 +187,7 @@ class MenuState:
         self.gender_options_rect = gender_options_rect
         
         # Altersauswahl mit Dropdown - rechte Seite
-        age_label = self.game.small_font.render("Alter:", True, TEXT_COLOR)
+        age_label = self.game.render_text(self.game.small_font, "Alter:", True, TEXT_COLOR)
         self.game.screen.blit(age_label, (SCREEN_WIDTH * 3 // 4 - 90, y_offset + 75))
         
         # Dropdown für Alter
@@ -212,47 +225,49 @@ class MenuState:
 
 
     def render_custom_background(self):
-        """löschen"""
-        self.game.screen.fill(BACKGROUND)
+        """
+        Zeichnet den Hintergrund mit Punkteraster und Farbakzenten (wird von render() derzeit
+        nicht verwendet). Raster und Akzente werden nur einmal gerastert, pro Frame bleiben elf Blits
+        """
+        if self.background_layer is None:
+            self.build_background()
+        self.game.screen.blit(self.background_layer, (0, 0))
+
+        # Subtile Farbakzente: feste Positionen, langsame Bewegung abhängig von der Spielzeit
+        animation_speed_factor = 0.002  # Reduziert die Geschwindigkeit (höher = langsamer)
+        time_factor = self.game.game_clock.now_ms() * animation_speed_factor / 1000
+        for x, y, sprite in self.accents:
+            size = sprite.get_width() // 2
+            x_offset = int(math.sin(time_factor + x / 100) * 2)  # Kleine Bewegung
+            y_offset = int(math.cos(time_factor + y / 100) * 2)
+            self.game.screen.blit(sprite, (x - size + x_offset, y - size + y_offset))
+
+    def build_background(self):
+        """Rastert das Punkteraster in eine Ebene und die Farbakzente in einen Sprite-Pool"""
+        self.background_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background_layer.fill(BACKGROUND)
         grid_spacing = 30
-        
         for x in range(0, SCREEN_WIDTH, grid_spacing):
             for y in range(0, SCREEN_HEIGHT, grid_spacing):
                 # Kleine Punkte Hintergrund
-                pygame.draw.circle(self.game.screen, WHITE, (x, y), 1)
-        
-        # Subtile Farbakzente mit langsamerer Animation
-        animation_speed_factor = 0.002  # Reduziert die Geschwindigkeit (höher = langsamer)
-        
-        for _ in range(10):  # Weniger Kreise für ruhigere Animation
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(30, 100)
-            alpha = random.randint(5, 15)
-
-            # Erstelle eine transparente Oberfläche
-            accent_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-
-            # Zufällige Farbe aus dem Farbschema
-            colors = [PRIMARY, SECONDARY, RICH_BURGUNDY]
-            color = list(random.choice(colors)) + [alpha]
-
-            # Animation verlangsamen
-            time_factor = pygame.time.get_ticks() * animation_speed_factor / 1000
+                pygame.draw.circle(self.background_layer, WHITE, (x, y), 1)
 
-            # **Standardwerte für x_offset und y_offset setzen**
-            x_offset = 0  
-            y_offset = 0  
-
-            if pygame.time.get_ticks() % 500 > 450:  # Bewege nur alle 500ms
-                x_offset = int(math.sin(time_factor + x / 100) * 2)  # Kleinere Bewegung
-                y_offset = int(math.cos(time_factor + y / 100) * 2)
-
-            # Zeichne einen sanften Kreis (Gradient-ähnlich)
-            pygame.draw.circle(accent_surface, color, (size, size), size)
-
-            # Auf den Hauptbildschirm übertragen
-            self.game.screen.blit(accent_surface, (x - size + x_offset, y - size + y_offset))
+        # Akzente mit festem Startwert, damit der Hintergrund bei jedem Start gleich aussieht.
+        # Gleiche Kreise (Grösse, Farbe, Transparenz) teilen sich ein Sprite
+        rng = random.Random(ACCENT_SEED)
+        colors = [PRIMARY, SECONDARY, RICH_BURGUNDY]
+        self.accents = []
+        for _ in range(10):  # Weniger Kreise für ruhigere Animation
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT)
+            size = rng.randint(30, 100)
+            color = tuple(rng.choice(colors)) + (rng.randint(5, 15),)
+            key = (size, color)
+            if key not in self.accent_sprites:
+                sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, color, (size, size), size)
+                self.accent_sprites[key] = sprite.convert_alpha()
+            self.accents.append((x, y, self.accent_sprites[key]))
 
     def render_input_field(self, x, y, width, height, active):
         """Zeichnet das Eingabefeld für den Namen"""
@@ -267,11 +282,11 @@ class MenuState:
         pygame.draw.rect(self.game.screen, border_color, input_rect, 2)
 
         # Text anzeigen
-        name_text = self.game.caption_font.render(self.game.user_name, True, TEXT_DARK)
+        name_text = self.game.render_text(self.game.caption_font, self.game.user_name, True, TEXT_DARK)
         self.game.screen.blit(name_text, (x + 15, y + height // 3))
 
         # Blinking Cursor für Eingabe
-        if active and int(pygame.time.get_ticks() / 500) % 2 == 0:
+        if active and int(self.game.game_clock.now_ms() / 500) % 2 == 0:
             cursor_x = x + 15 + name_text.get_width()
             pygame.draw.line(self.game.screen, TEXT_DARK, (cursor_x, y + 12), (cursor_x, y + height - 12), 2)
             
@@ -9,7 +9,8 @@ import pygame
 import random
 import math
 from game_core.constants import *
-from game_core.utilities import determine_persona_type, auto_save_data
+from game_core import assets
+from game_core.utilities import determine_persona_type
 
 class ResultsState:
     """
@@ -41,11 +42,11 @@ class ResultsState:
         self.companion_desc = companion_desc
         self.companion_color = companion_color
         
-        # Begleiter-Bild laden basierend auf dem Companion-Typ
-        self.companion_image = self._get_companion_image(companion_type)
+        # Begleiter-Bild wird erst beim ersten Anzeigen von Seite 2 geladen
+        self.companion_image = None
         
-        # Versuch, die Daten automatisch zu speichern
-        auto_save_data(self.game)
+        # Versuch, die Daten automatisch zu speichern (nur mit Benutzername und Ergebnissen)
+        self.game.save_data_automatically()
     
     def handle_event(self, event):
         """Verarbeitet Benutzereingaben"""
@@ -69,6 +70,14 @@ class ResultsState:
         """Aktualisiert den Zustand (für Animationen etc.)"""
         pass
     
+    def frame_rate(self):
+        """Die Ergebnisseiten werden nur bei Eingaben neu gezeichnet"""
+        return None
+
+    def dirty_rects(self):
+        """Die Ergebnisseiten ändern sich nur durch Eingaben"""
+        return self.game.static_dirty_rects(self.current_page)
+
     def render(self):
         """Zeichnet den Ergebnisbildschirm basierend auf der aktuellen Seite"""
         # Grundlegende Hintergrundelemente für beide Seiten
@@ -90,7 +99,7 @@ class ResultsState:
         self.game.draw_card(header_rect.x, header_rect.y, header_rect.width, header_rect.height, color=BACKGROUND)
         
         # Titel
-        title = self.game.heading_font_bold.render("Persönlichkeitsprofil", True, TEXT_COLOR)
+        title = self.game.render_text(self.game.heading_font_bold, "Persönlichkeitsprofil", True, TEXT_COLOR)
         self.game.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
     
     def _render_page1(self):
@@ -100,10 +109,10 @@ class ResultsState:
         self.game.draw_card(result_box.x, result_box.y, result_box.width, result_box.height, color=BACKGROUND)
         
         # Einen informativeren und gratulierenden Text hinzufügen:
-        congratulation_text = self.game.body_font.render(f"Gratulation, {self.game.user_name}!", True, TEXT_DARK)
+        congratulation_text = self.game.render_text(self.game.body_font, f"Gratulation, {self.game.user_name}!", True, TEXT_DARK)
         self.game.screen.blit(congratulation_text, (SCREEN_WIDTH // 2 - congratulation_text.get_width() // 2, 100))
 
-        result_intro_text = self.game.body_font.render("Du hast alle Aufgaben erfolgreich abgeschlossen. Hier ist dein persönliches Ergebnis:", True, TEXT_DARK)
+        result_intro_text = self.game.render_text(self.game.body_font, "Du hast alle Aufgaben erfolgreich abgeschlossen. Hier ist dein persönliches Ergebnis:", True, TEXT_DARK)
         self.game.screen.blit(result_intro_text, (SCREEN_WIDTH // 2 - result_intro_text.get_width() // 2, 130))
         
         # Persönlichkeits-Scores erhalten
@@ -119,7 +128,7 @@ class ResultsState:
         
         # Helper function to draw a trait bar
         def draw_trait_bar(name, score, y_pos, color, left_label, right_label):
-            trait_name = self.game.medium_font.render(name, True, TEXT_DARK)
+            trait_name = self.game.render_text(self.game.medium_font, name, True, TEXT_DARK)
             self.game.screen.blit(trait_name, (80, y_pos))
             
             # Bar background
@@ -133,12 +142,12 @@ class ResultsState:
             pygame.draw.rect(self.game.screen, color, (bar_x, y_pos + 25, fill_width, bar_height), border_radius=12)
             
             # Score percentage
-            score_text = self.game.small_font.render(f"{score}%", True, TEXT_DARK)
+            score_text = self.game.render_text(self.game.small_font, f"{score}%", True, TEXT_DARK)
             self.game.screen.blit(score_text, (bar_x + fill_width - score_text.get_width() // 2, y_pos + 25 - 18))
             
             # Labels
-            left_text = self.game.small_font.render(left_label, True, TEXT_DARK)
-            right_text = self.game.small_font.render(right_label, True, TEXT_DARK)
+            left_text = self.game.render_text(self.game.small_font, left_label, True, TEXT_DARK)
+            right_text = self.game.render_text(self.game.small_font, right_label, True, TEXT_DARK)
             self.game.screen.blit(left_text, (bar_x - 10 - left_text.get_width(), y_pos + 25 + 5))
             self.game.screen.blit(right_text, (bar_x + bar_width + 10, y_pos + 25 + 3))
         
@@ -159,7 +168,7 @@ class ResultsState:
         
         # Kurzübersicht zum Persönlichkeitstyp
         y_section = y_offset + bar_spacing * 5 + 20
-        summary_text = self.game.medium_font.render(
+        summary_text = self.game.render_text(self.game.medium_font, 
             f"Dein dominanter Persönlichkeitstyp: {self.persona_name}", True, self.companion_color)
         self.game.screen.blit(summary_text, (SCREEN_WIDTH // 2 - summary_text.get_width() // 2, y_section))
         
@@ -193,7 +202,7 @@ class ResultsState:
         # Tiktik rendern und unten platzieren
         tiktik_x = SCREEN_WIDTH // 2 + 280  # Mehr nach rechts verschoben
         tiktik_y = SCREEN_HEIGHT - 280
-        self.game.screen.blit(CONGRATS_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
+        self.game.screen.blit(assets.CONGRATS_TIKTIK_IMAGE, (tiktik_x, tiktik_y))
         
     def _render_page2(self):
         """Zeichnet die zweite Seite mit der Persona und dem Begleiter"""
@@ -209,53 +218,55 @@ class ResultsState:
         self.game.draw_card(persona_box.x, persona_box.y, persona_box.width, persona_box.height, color=BACKGROUND, shadow=False)
         
         # Persona-Titel
-        persona_title = self.game.medium_font.render("Dein Persönlichkeitstyp", True, TEXT_COLOR)
+        persona_title = self.game.render_text(self.game.medium_font, "Dein Persönlichkeitstyp", True, TEXT_COLOR)
         self.game.screen.blit(persona_title, (persona_box.x + persona_box.width // 2 - persona_title.get_width() // 2, persona_box.y + 20))
         
         # Persona-Typ
-        persona_type_text = self.game.body_font.render(self.persona_name, True, self.companion_color)
+        persona_type_text = self.game.render_text(self.game.body_font, self.persona_name, True, self.companion_color)
         self.game.screen.blit(persona_type_text, (persona_box.x + persona_box.width // 2 - persona_type_text.get_width() // 2, persona_box.y + 50))
         
         # Persönlichkeitsprofil
-        profile_title = self.game.small_font.render("Persönlichkeitsprofil:", True, TEXT_COLOR)
+        profile_title = self.game.render_text(self.game.small_font, "Persönlichkeitsprofil:", True, TEXT_COLOR)
         self.game.screen.blit(profile_title, (persona_box.x + 20, persona_box.y + 80))
-        next_y = self._render_multiline_text_with_height(self.persona_profile, persona_box.x + 20, persona_box.y + 100, persona_box.width - 40)
+        next_y = self._render_description(self.persona_profile, persona_box.x + 20, persona_box.y + 100, persona_box.width - 40)
 
         # Emotionale Bedürfnisse
         next_y += 10  # Füge etwas Abstand hinzu
-        needs_title = self.game.small_font.render("Emotionale Bedürfnisse:", True, TEXT_COLOR)
+        needs_title = self.game.render_text(self.game.small_font, "Emotionale Bedürfnisse:", True, TEXT_COLOR)
         self.game.screen.blit(needs_title, (persona_box.x + 20, next_y))
         next_y += 20  # Abstand für den Titel
-        next_y = self._render_multiline_text_with_height(self.persona_needs, persona_box.x + 20, next_y, persona_box.width - 40)
+        next_y = self._render_description(self.persona_needs, persona_box.x + 20, next_y, persona_box.width - 40)
 
         # Herausforderungen bei der Therapieadhärenz
         next_y += 10  # Füge etwas Abstand hinzu
-        challenges_title = self.game.small_font.render("Herausforderungen bei der Therapieadhärenz:", True, TEXT_COLOR)
+        challenges_title = self.game.render_text(self.game.small_font, "Herausforderungen bei der Therapieadhärenz:", True, TEXT_COLOR)
         self.game.screen.blit(challenges_title, (persona_box.x + 20, next_y))
         next_y += 20  # Abstand für den Titel
-        self._render_multiline_text_with_height(self.persona_challenges, persona_box.x + 20, next_y, persona_box.width - 40)
+        self._render_description(self.persona_challenges, persona_box.x + 20, next_y, persona_box.width - 40)
 
         # Begleiter-Bereich (rechts)
         companion_box = pygame.Rect(result_box.x + half_width + 20, result_box.y + 20, half_width, result_box.height - 60)
         self.game.draw_card(companion_box.x, companion_box.y, companion_box.width, companion_box.height, color=BACKGROUND, shadow=False)
         
         # Begleiter-Titel
-        companion_title = self.game.medium_font.render("Dein digitaler Begleiter", True, TEXT_COLOR)
+        companion_title = self.game.render_text(self.game.medium_font, "Dein digitaler Begleiter", True, TEXT_COLOR)
         self.game.screen.blit(companion_title, (companion_box.x + companion_box.width // 2 - companion_title.get_width() // 2, companion_box.y + 20))
         
         # Begleiter-Typ
-        companion_type_text = self.game.body_font.render(self.companion_type, True, self.companion_color)
+        companion_type_text = self.game.render_text(self.game.body_font, self.companion_type, True, self.companion_color)
         self.game.screen.blit(companion_type_text, (companion_box.x + companion_box.width // 2 - companion_type_text.get_width() // 2, companion_box.y + 60))
         
         # Begleiter-Beschreibung
-        self._render_multiline_text_with_height(self.companion_desc, companion_box.x + 20, companion_box.y + 100, companion_box.width - 40)
+        self._render_description(self.companion_desc, companion_box.x + 20, companion_box.y + 100, companion_box.width - 40)
         
         # Begleiter-Bild
-        # Skaliere das Bild, falls nötig
-        scaled_image = pygame.transform.scale(self.companion_image, (150, 150))
-        image_x = companion_box.x + companion_box.width // 2 - scaled_image.get_width() // 2
-        image_y = companion_box.y + companion_box.height - scaled_image.get_height() - 30
-        self.game.screen.blit(scaled_image, (image_x, image_y))
+        if self.companion_image is None:
+            self.companion_image = self._get_companion_image(self.companion_type)
+
+        # Das Bild ist bereits auf 150x150 skaliert (siehe assets.py)
+        image_x = companion_box.x + companion_box.width // 2 - self.companion_image.get_width() // 2
+        image_y = companion_box.y + companion_box.height - self.companion_image.get_height() - 30
+        self.game.screen.blit(self.companion_image, (image_x, image_y))
         
         # Button-Positionen und Grössen
         back_button_x = 120
@@ -309,79 +320,22 @@ class ResultsState:
             bfi_button_width,
             bfi_button_height
         )
-    def _render_multiline_text(self, text, x, y, max_width):
-        """Rendert mehrzeiligen Text mit Zeilenumbrüchen"""
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            test_width = self.game.small_font.size(test_line)[0]
-            
-            if test_width <= max_width:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-        
+    def _render_description(self, text, x, y, max_width):
+        """Zeichnet einen umgebrochenen Beschreibungstext und gibt die Y-Position unter dem Text zurück"""
         line_height = self.game.small_font.get_height() + 5
-        for i, line in enumerate(lines):
-            text_surface = self.game.small_font.render(line, True, TEXT_DARK)
-            self.game.screen.blit(text_surface, (x, y + i * line_height))
-            
+        return self.game.render_multiline_text(text, self.game.small_font, TEXT_DARK, x, y, max_width, line_height)
+
     def _get_companion_image(self, companion_type):
         """Lädt das passende Begleiter-Bild basierend auf dem Companion-Typ"""
-        # Mapping von Companion-Typen zu Bildern aus constants.py
+        # Mapping von Companion-Typen zu Bildnamen aus assets.py
         # Wenn z.B. companion_type = "Strukturierter Begleiter" statt "Organisationssystem" ist
         image_mapping = {
-            "Der Architektonische Turm": COMPANION_ORGANIZATION_IMAGE,
-            "Der Evolutionäre Begleiter Evo": COMPANION_INTERACTIVE_IMAGE,
-            "Der Schützende Kristallbaum": COMPANION_CALMING_IMAGE,
-            "Der Wandelnde Traumkristall": COMPANION_CREATIVE_IMAGE,
-            "Der Dynamische Leistungsroboter": COMPANION_PERFORMANCE_IMAGE
+            "Der Architektonische Turm": "COMPANION_ORGANIZATION_IMAGE",
+            "Der Evolutionäre Begleiter Evo": "COMPANION_INTERACTIVE_IMAGE",
+            "Der Schützende Kristallbaum": "COMPANION_CALMING_IMAGE",
+            "Der Wandelnde Traumkristall": "COMPANION_CREATIVE_IMAGE",
+            "Der Dynamische Leistungsroboter": "COMPANION_PERFORMANCE_IMAGE"
         }
         
         # Verwende das zugeordnete Bild oder BLOB_IMAGE als Fallback
-        return image_mapping.get(companion_type, BLOB_IMAGE)
-
-    def _render_multiline_text_with_height(self, text, x, y, max_width):
-        """
-        Rendert mehrzeiligen Text mit Zeilenumbrüchen und gibt die Höhe des gerenderten Texts zurück
-        
-        Args:
-            text (str): Der zu rendernde Text
-            x (int): X-Koordinate des Texts
-            y (int): Y-Koordinate des Texts
-            max_width (int): Maximale Breite für Zeilenumbrüche
-            
-        Returns:
-            int: Die gesamte Höhe des gerenderten Texts
-        """
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            test_width = self.game.small_font.size(test_line)[0]
-            
-            if test_width <= max_width:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-        
-        line_height = self.game.small_font.get_height() + 5
-        for i, line in enumerate(lines):
-            text_surface = self.game.small_font.render(line, True, TEXT_DARK)
-            self.game.screen.blit(text_surface, (x, y + i * line_height))
-        
-        # Gesamthöhe des gerenderten Texts zurückgeben
-        return y + len(lines) * line_height
\ No newline at end of file
+        return assets.get(image_mapping.get(companion_type, "BLOB_IMAGE"))
@@ -55,6 +55,10 @@ def main():
     try:
         # Versuche, die Game-Klasse zu importieren
         from game_core.game import Game
+        from game_core.log import setup_logging
+        
+        # Logging über einen Hintergrund-Thread einrichten (siehe game_core/log.py)
+        setup_logging()
         
         # Erstelle das Spielobjekt
         game = Game()